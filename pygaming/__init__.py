@@ -25,6 +25,7 @@ from .screen.art import mask, transform
 
 from .file import get_file
 from .screen.actor import Actor
+from .screen.actor_group import ActorGroup
 
 from .screen.camera import Camera
 
@@ -34,7 +35,7 @@ from .database import TextFormatter
 from . import commands
 
 __all__ = ['Game', 'LEAVE', 'STAY', 'ServerPhase', 'GamePhase', 'Tooltip', 'TextTooltip',
-           'Server', 'Frame', 'Actor', 'TextFormatter', 'Cursor',
+           'Server', 'Frame', 'Actor', 'ActorGroup', 'TextFormatter', 'Cursor',
            'mask', 'transform', 'widget', 'get_file', 'art', 'States',
            'HEADER', 'ID', 'PAYLOAD', 'TIMESTAMP', 'anchors', 'Rect', 'Hitbox',
            'commands', 'Camera', 'Color']
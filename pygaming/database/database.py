@@ -8,6 +8,7 @@ from typing import Literal
 from ..file import get_file
 from ..state import State
 from ..config import Config
+from .localization_index import LocalizationIndex
 
 SERVER = 'server'
 GAME = 'game'
@@ -236,6 +237,14 @@ class Database:
             )
         )[0]
 
+    def get_texts_index(self) -> LocalizationIndex:
+        """Return the index of all the texts of the game, resolved for every phase and language."""
+        return LocalizationIndex(
+            self.execute_select_query("SELECT phase_name_or_tag, language_code, position, text_value FROM localizations")[0],
+            self.execute_select_query("SELECT phase_name, tag FROM tags")[0],
+            self._config.default_language
+        )
+
     def get_loc_texts(self, loc: str):
         """Return the texts that can be obtain for the same localization given any language."""
         return self.execute_select_query(
@@ -289,6 +298,14 @@ class Database:
             )
         )[0]
 
+    def get_speeches_index(self) -> LocalizationIndex:
+        """Return the index of all the speeches of the game, resolved for every phase and language."""
+        return LocalizationIndex(
+            self.execute_select_query("SELECT phase_name_or_tag, language_code, position, sound_path FROM speeches")[0],
+            self.execute_select_query("SELECT phase_name, tag FROM tags")[0],
+            self._config.default_language
+        )
+
     def get_sounds(self, phase_name: str):
         """
         Return all the sounds of the phase.
@@ -0,0 +1,65 @@
+"""The localization_index module contains the LocalizationIndex class, used to keep the localized values of the game in memory."""
+from typing import Iterable
+
+class LocalizationIndex:
+    """
+    A LocalizationIndex keeps in memory every value of a localized table, like the texts or the speeches.
+    The values are resolved once for every phase and language, including the values of the tags of the phase
+    and the values in the default language for the positions missing in the language,
+    so that changing the phase or the language is only a matter of picking another dict.
+    The index is built from the rows of the table at startup, the rows added later are not indexed.
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, str, str, str]], tags: Iterable[tuple[str, str]], default_language: str) -> None:
+        """
+        Create the index.
+
+        Params:
+        ---
+        - rows: Iterable[tuple[str, str, str, str]], the phase name or tag, the language, the position and the value of every row of the table.
+        - tags: Iterable[tuple[str, str]], the phase name and the tag of every row of the tags table.
+        - default_language: str, the language used when a position is not available in a language.
+        """
+        self._default_language = default_language
+        self._groups: dict[tuple[str, str], dict[str, str]] = {} # (phase name or tag, language) -> {position: value}
+        self._values: dict[str, list[str]] = {} # position -> the values in every language
+        for phase_name_or_tag, language, position, value in rows:
+            self._groups.setdefault((phase_name_or_tag, language), {})[position] = value
+            self._values.setdefault(position, []).append(value)
+        self._tags: dict[str, list[str]] = {}
+        for phase_name, tag in tags:
+            self._tags.setdefault(phase_name, []).append(tag)
+
+        languages = {language for _, language in self._groups} | {default_language}
+        phase_names = {phase_name_or_tag for phase_name_or_tag, _ in self._groups} | set(self._tags)
+        self._resolved: dict[tuple[str, str], dict[str, str]] = {}
+        for phase_name in phase_names:
+            for language in languages:
+                self._resolved[(phase_name, language)] = self._resolve(phase_name, language)
+
+    def _resolve(self, phase_name: str, language: str) -> dict[str, str]:
+        """Merge the values of the phase and its tags in the language, over the values in the default language."""
+        groups = self._tags.get(phase_name, []) + [phase_name]
+        resolved = {}
+        for lang in (self._default_language, language):
+            for group in groups:
+                resolved.update(self._groups.get((group, lang), {}))
+        return resolved
+
+    def get(self, phase_name: str, language: str) -> dict[str, str]:
+        """
+        Return the values of a phase in a language, as a dict position -> value. The dict is shared and must not be modified.
+
+        Params:
+        ---
+        - phase_name: str, the name of the phase, or 'all' for the values loaded in every phase.
+        - language: str, the language of the values.
+        """
+        resolved = self._resolved.get((phase_name, language))
+        if resolved is None:
+            resolved = self._resolved[(phase_name, language)] = self._resolve(phase_name, language)
+        return resolved
+
+    def get_values(self, position: str) -> list[str]:
+        """Return the values of a position in every language."""
+        return self._values.get(position, [])
@@ -0,0 +1,74 @@
+"""The render_cache module contains the RenderCache class, used to render the texts only once."""
+from collections import OrderedDict
+from typing import Hashable
+from pygame import Surface
+
+_DEFAULT_MAX_BYTES = 16*2**20
+
+def _bytes(surface: Surface) -> int:
+    return surface.get_pitch()*surface.get_height()
+
+class RenderCache:
+    """
+    A RenderCache keeps the rendered texts, keyed by everything the render depends on:
+    the font, the resolved text, the colors, the justification, the wrapping and the antialiasing.
+    When the cached surfaces take more than max_bytes, the least recently used ones are forgotten.
+    The surfaces returned by the cache are shared by every widget displaying the same text and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._surfaces: OrderedDict[Hashable, Surface] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, max_bytes: int):
+        """
+        Change the maximum size of the cache.
+
+        Params:
+        ---
+        - max_bytes: int, the maximum number of bytes taken by the cached surfaces.
+        """
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def get(self, key: Hashable) -> Surface | None:
+        """Return the surface cached with this key, or None if there is none."""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: Surface) -> Surface:
+        """Cache a rendered surface and return it."""
+        previous = self._surfaces.pop(key, None)
+        if previous is not None:
+            self._bytes -= _bytes(previous)
+        self._surfaces[key] = surface
+        self._bytes += _bytes(surface)
+        self._evict()
+        return surface
+
+    def _evict(self):
+        """Forget the least recently used surfaces until the cache fits in its maximum size."""
+        while self._bytes > self._max_bytes and self._surfaces:
+            _, surface = self._surfaces.popitem(last=False)
+            self._bytes -= _bytes(surface)
+
+    def clear(self):
+        """Forget every cached surface."""
+        self._surfaces.clear()
+        self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes taken by the cached surfaces."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -14,16 +14,12 @@ class Speeches:
     def __init__(self, database: Database, settings: Settings, first_phase: str) -> None:
         self._db = database
         self._settings = settings
+        self._index = database.get_speeches_index()
         self.current_language = settings.language
-        self._all_phases_dict = self._query_db(self.current_language, 'all')
-        self._this_phase_dict = self._query_db(self.current_language, first_phase)
+        self._all_phases_dict = self._index.get('all', self.current_language)
+        self._this_phase_dict = self._index.get(first_phase, self.current_language)
         self.current_phase = first_phase
 
-    def _query_db(self, language, phase_name):
-        """Query the database for the speeches"""
-        texts_list = self._db.get_speeches(language, phase_name)
-        return {pos : txt for pos, txt in texts_list}
-
     def get_all(self):
         """Return all the locs and speech paths."""
         return self._this_phase_dict, self._all_phases_dict
@@ -32,10 +28,11 @@ class Speeches:
         """Update the language and/or phase of the speeches"""
         if settings.language == self.current_language:
             if phase != self.current_phase: # Same language, different phase
-                self._this_phase_dict = self._query_db(settings.language, phase)
+                self._this_phase_dict = self._index.get(phase, settings.language)
                 self.current_phase = phase
         else:
             # Different language
-            self._all_phases_dict = self._query_db(settings.language, 'all')
-            self._this_phase_dict = self._query_db(settings.language, phase)
+            self._all_phases_dict = self._index.get('all', settings.language)
+            self._this_phase_dict = self._index.get(phase, settings.language)
             self.current_language = settings.language
+            self.current_phase = phase
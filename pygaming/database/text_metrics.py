@@ -0,0 +1,378 @@
+"""The text_metrics module contains the TextMetrics class, used to measure the texts written with a font and to split them into lines."""
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterator
+from pygame.font import Font
+from ..screen.anchors import LEFT, Anchor
+
+_MAX_CACHED_WIDTHS = 4096
+_MAX_CACHED_LAYOUTS = 256
+
+@dataclass(frozen=True)
+class TextLayout:
+    """The lines of a text, once split on the line breaks and wrapped."""
+
+    lines: tuple[str, ...]
+    starts: tuple[int, ...] # The index in the text of the first character of each line.
+    widths: tuple[int, ...]
+    linesize: int
+
+    @property
+    def width(self) -> int:
+        """Return the width of the widest line."""
+        return max(self.widths)
+
+    @property
+    def height(self) -> int:
+        """Return the height of all the lines."""
+        return len(self.lines)*self.linesize
+
+    def line_of(self, index: int) -> int:
+        """Return the line of the caret at this index of the text. A caret at the end of a line stays on this line."""
+        return min(max(bisect_right(self.starts, index) - 1, 0), len(self.lines) - 1)
+
+class TextMetrics:
+    """
+    The TextMetrics measure the texts written with a font.
+    The widths of the words and the advances of the glyphs are cached, and are used to estimate the widths of the lines,
+    the estimations being checked against the font to keep the result exact despite the kerning.
+    """
+
+    def __init__(self, font: Font) -> None:
+        self._font = font
+        self._words: dict[str, int] = {}
+        self._glyphs: dict[str, int] = {}
+        self._layouts: OrderedDict[tuple[str, int | None], TextLayout] = OrderedDict()
+        self.space_width = font.size(' ')[0]
+        self.linesize = font.get_linesize()
+
+    def width(self, text: str) -> int:
+        """Return the width of a text, measured by the font."""
+        return self._font.size(text)[0]
+
+    def word_width(self, word: str) -> int:
+        """Return the width of a word."""
+        width = self._words.get(word)
+        if width is None:
+            if len(self._words) >= _MAX_CACHED_WIDTHS:
+                self._words.clear()
+            width = self._words[word] = self._font.size(word)[0]
+        return width
+
+    def glyph_advance(self, char: str) -> int:
+        """Return the advance of a glyph."""
+        advance = self._glyphs.get(char)
+        if advance is None:
+            advance = self._glyphs[char] = self._font.size(char)[0]
+        return advance
+
+    def wrap_words(self, words: list[str], max_width: int, indent: str | None = None) -> list[tuple[list[str], int]]:
+        """
+        Split a paragraph into lines filled with as many words as possible, separated by spaces.
+        A word wider than max_width is alone on its line.
+
+        Params:
+        ---
+        - words: list[str], the words of the paragraph.
+        - max_width: int, the maximum width of the lines.
+        - indent: str | None, if not None, a word added at the beginning of the first line.
+
+        Returns:
+        ---
+        - lines: list[tuple[list[str], int]], the words of each line with the width of the line.
+        """
+        space = self.space_width
+        # advances[j] is the estimated width of the first j words, each followed by a space.
+        advances = [0, *accumulate(self.word_width(word) + space for word in words)]
+        head = [] if indent is None else [indent]
+        lines = []
+        start = 0
+        while start < len(words):
+            head_width = sum(self.word_width(word) + space for word in head)
+            # Estimate the number of words in the line with the prefix sums, then correct it with the real widths.
+            end = max(bisect_right(advances, max_width - head_width + space + advances[start], lo=start) - 1, start)
+            width = self._font.size(' '.join(head + words[start:end]))[0]
+            while end > start and width > max_width:
+                end -= 1
+                width = self._font.size(' '.join(head + words[start:end]))[0]
+            while end < len(words):
+                next_width = self._font.size(' '.join(head + words[start:end + 1]))[0]
+                if next_width > max_width:
+                    break
+                end += 1
+                width = next_width
+            if end == start:
+                end += 1
+                width = self._font.size(' '.join(head + words[start:end]))[0]
+            lines.append((head + words[start:end], width))
+            head = []
+            start = end
+        return lines
+
+    def layout(self, text: str, max_width: int | None = None) -> TextLayout:
+        """
+        Return the layout of a text.
+
+        Params:
+        ---
+        - text: str, the text to split into lines.
+        - max_width: int | None, if not None, the paragraphs are wrapped to fit in this width.
+        """
+        key = (text, max_width)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+        if max_width is None:
+            lines = text.split('\n')
+            widths = [self._font.size(line)[0] for line in lines]
+        else:
+            lines, widths = [], []
+            for paragraph in text.split('\n'):
+                for words, width in self.wrap_words(paragraph.split(' '), max_width):
+                    lines.append(' '.join(words))
+                    widths.append(width)
+        # Each line break replaces exactly one character of the text.
+        starts = [0, *accumulate(len(line) + 1 for line in lines[:-1])]
+        layout = self._layouts[key] = TextLayout(tuple(lines), tuple(starts), tuple(widths), self.linesize)
+        if len(self._layouts) > _MAX_CACHED_LAYOUTS:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def char_index(self, line: str, x: float) -> int:
+        """Return the index of the first character of the line ending after x, or the index of the last character."""
+        if not line:
+            return 0
+        # Estimate the index with the advances of the glyphs, then correct it with the real widths.
+        index = bisect_right(list(accumulate(self.glyph_advance(char) for char in line)), x)
+        while index > 0 and self._font.size(line[:index])[0] > x:
+            index -= 1
+        while index < len(line) and self._font.size(line[:index + 1])[0] <= x:
+            index += 1
+        return min(index, len(line) - 1)
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Return the length of the longest common prefix of two strings."""
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        mid = (low + high + 1)//2
+        if first[:mid] == second[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def _common_suffix_length(first: str, second: str, limit: int) -> int:
+    """Return the length of the longest common suffix of two strings, up to limit."""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1)//2
+        if first[len(first) - mid:] == second[len(second) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+class _Line:
+    """
+    A line of an EditableLayout, with the advances of its glyphs and the widths of its prefixes measured so far.
+    The sums of the advances estimate the widths of the prefixes, only the prefixes at the carets are measured by the font.
+    """
+
+    __slots__ = ('text', 'width', '_advances', '_prefix_widths')
+
+    def __init__(self, text: str, width: int, advances: list[int] | None = None, prefix_widths: dict[int, int] | None = None) -> None:
+        self.text = text
+        self.width = width
+        self._advances = [0] if advances is None else advances # The sums of the advances of the first glyphs.
+        self._prefix_widths = {0: 0} if prefix_widths is None else prefix_widths # index -> width of the first characters.
+        self._prefix_widths[len(text)] = width
+
+    def keep_prefix(self, text: str, width: int, length: int) -> '_Line':
+        """Return a new line sharing the first characters of this line, keeping what has been measured on them."""
+        prefix_widths = {index: prefix_width for index, prefix_width in self._prefix_widths.items() if index <= length}
+        return _Line(text, width, self._advances[:length + 1], prefix_widths)
+
+    def prefix_width(self, metrics: TextMetrics, index: int) -> int:
+        """Return the width of the first characters of the line."""
+        width = self._prefix_widths.get(index)
+        if width is None:
+            width = self._prefix_widths[index] = metrics.width(self.text[:index])
+        return width
+
+    def char_index(self, metrics: TextMetrics, x: float) -> int:
+        """Return the index of the first character of the line ending after x, or the index of the last character."""
+        advances = self._advances
+        total = advances[-1]
+        for char in self.text[len(advances) - 1:]:
+            total += metrics.glyph_advance(char)
+            advances.append(total)
+        # Estimate the index with the advances of the glyphs, then correct it with the real widths.
+        index = bisect_right(advances, x) - 1
+        while index > 0 and self.prefix_width(metrics, index) > x:
+            index -= 1
+        while index < len(self.text) and self.prefix_width(metrics, index + 1) <= x:
+            index += 1
+        return min(index, max(len(self.text) - 1, 0))
+
+class EditableLayout:
+    """
+    The layout of a text edited by the player, like the value of an Entry or a Text.
+    The text is kept split into paragraphs and lines, with the advances of their glyphs and the widths of the prefixes measured at the carets.
+    When the text is updated, only the edited paragraphs are wrapped again,
+    and only what has been measured after the edit is measured again.
+    """
+
+    def __init__(self, metrics: TextMetrics, text: str = '', max_width: int | None = None) -> None:
+        """
+        Create the layout of a text.
+
+        Params:
+        ---
+        - metrics: TextMetrics, the metrics of the font used to display the text.
+        - text: str, the text.
+        - max_width: int | None, if not None, the paragraphs are wrapped to fit in this width.
+        """
+        self.metrics = metrics
+        self.max_width = max_width
+        self._text = text
+        self._paragraphs = text.split('\n')
+        self._lines = [self._wrap(paragraph) for paragraph in self._paragraphs]
+        self._index()
+
+    def _wrap(self, paragraph: str, previous: list[_Line] = ()) -> list[_Line]:
+        """Split a paragraph into lines, keeping the widths of the prefixes shared with the previous lines."""
+        if self.max_width is None:
+            texts_and_widths = [(paragraph, self.metrics.width(paragraph))]
+        else:
+            texts_and_widths = [(' '.join(words), width) for words, width in self.metrics.wrap_words(paragraph.split(' '), self.max_width)]
+        lines = []
+        for line_idx, (text, width) in enumerate(texts_and_widths):
+            if line_idx < len(previous):
+                old_line = previous[line_idx]
+                if old_line.text == text:
+                    lines.append(old_line)
+                else:
+                    lines.append(old_line.keep_prefix(text, width, _common_prefix_length(old_line.text, text)))
+            else:
+                lines.append(_Line(text, width))
+        return lines
+
+    def _index(self):
+        """Compute the index in the text of the first character of each paragraph, and the number of their first line."""
+        self._starts = [0, *accumulate(len(paragraph) + 1 for paragraph in self._paragraphs[:-1])]
+        self._first_lines = [0, *accumulate(len(lines) for lines in self._lines)]
+        self._width = None
+
+    @property
+    def text(self) -> str:
+        """Return the text."""
+        return self._text
+
+    def update(self, text: str):
+        """Replace the text, wrapping and measuring again only the paragraphs that changed."""
+        old_text = self._text
+        if text == old_text:
+            return
+        prefix = _common_prefix_length(old_text, text)
+        suffix = _common_suffix_length(old_text, text, min(len(old_text), len(text)) - prefix)
+        first = bisect_right(self._starts, prefix) - 1
+        last = bisect_right(self._starts, len(old_text) - suffix) - 1
+        start = self._starts[first]
+        end = self._starts[last] + len(self._paragraphs[last]) + len(text) - len(old_text)
+        paragraphs = text[start:end].split('\n')
+        lines = [self._wrap(paragraph, self._lines[first] if not idx else ()) for idx, paragraph in enumerate(paragraphs)]
+        self._paragraphs[first:last + 1] = paragraphs
+        self._lines[first:last + 1] = lines
+        self._text = text
+        self._index()
+
+    @property
+    def linesize(self) -> int:
+        """Return the height of a line."""
+        return self.metrics.linesize
+
+    @property
+    def line_count(self) -> int:
+        """Return the number of lines."""
+        return self._first_lines[-1]
+
+    @property
+    def width(self) -> int:
+        """Return the width of the widest line."""
+        if self._width is None:
+            self._width = max(line.width for lines in self._lines for line in lines)
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Return the height of all the lines."""
+        return self.line_count*self.linesize
+
+    def visible_lines(self, height: int) -> Iterator[tuple[int, str, int]]:
+        """Yield the vertical position, the text and the width of the lines starting above height."""
+        line_y = 0
+        for lines in self._lines:
+            for line in lines:
+                if line_y >= height:
+                    return
+                yield line_y, line.text, line.width
+                line_y += self.linesize
+
+    def _locate(self, index: int) -> tuple[int, _Line, int]:
+        """Return the number of the line of the caret at this index, the line and the index of the caret in the line."""
+        index = min(max(index, 0), len(self._text))
+        paragraph = bisect_right(self._starts, index) - 1
+        offset = index - self._starts[paragraph]
+        lines = self._lines[paragraph]
+        line_idx = 0
+        # A caret at the end of a line stays on this line.
+        while line_idx < len(lines) - 1 and offset > len(lines[line_idx].text):
+            offset -= len(lines[line_idx].text) + 1
+            line_idx += 1
+        return self._first_lines[paragraph] + line_idx, lines[line_idx], offset
+
+    def caret_pos(self, caret_index: int, justify: Anchor = LEFT, max_width: int = 0) -> tuple[int, int]:
+        """
+        Return the position of the caret given its index.
+
+        Params:
+        ---
+        - caret_index: int, the index of the caret in the text.
+        - justify: Anchor, the justification of the lines.
+        - max_width: int, the width in which the lines are justified. Only relevant if justify is not LEFT.
+        """
+        line_number, line, offset = self._locate(caret_index)
+        x = line.prefix_width(self.metrics, offset)
+        if justify != LEFT:
+            x += (max_width - line.width)*justify[0]
+        return x, line_number*self.linesize
+
+    def caret_index(self, pos: tuple[int, int], justify: Anchor = LEFT, max_width: int = 0) -> int:
+        """
+        Return the index of the caret given its position.
+
+        Params:
+        ---
+        - pos: tuple[int, int], the position of the caret.
+        - justify: Anchor, the justification of the lines.
+        - max_width: int, the width in which the lines are justified. Only relevant if justify is not LEFT.
+        """
+        line_number = pos[1]//self.linesize
+        if line_number >= self.line_count: # the position is below the last line.
+            return len(self._text)
+        if pos[1] < 0:
+            return 0
+        paragraph = bisect_right(self._first_lines, line_number) - 1
+        lines = self._lines[paragraph]
+        line_idx = line_number - self._first_lines[paragraph]
+        line_start = self._starts[paragraph] + sum(len(line.text) + 1 for line in lines[:line_idx])
+        line = lines[line_idx]
+        x = pos[0]
+        if justify != LEFT:
+            x -= (max_width - line.width)*justify[0]
+        if x <= 0:
+            return line_start
+        return line_start + line.char_index(self.metrics, x)
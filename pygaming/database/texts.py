@@ -26,14 +26,10 @@ class Texts:
     def __init__(self, database: Database, settings: Settings, first_phase: str) -> None:
         self._db = database
         self._settings = settings
+        self._index = database.get_texts_index()
         self._last_language = settings.language
-        self._all_phases_dict = self._query_db(settings.language, 'all')
-        self._this_phase_dict = self._query_db(settings.language, first_phase)
-
-    def _query_db(self, language, phase_name):
-        """Query the database for the texts"""
-        texts_list = self._db.get_language_texts(language, phase_name)
-        return {pos : txt for pos, txt in texts_list}
+        self._all_phases_dict = self._index.get('all', settings.language)
+        self._this_phase_dict = self._index.get(first_phase, settings.language)
 
     def get_all_positions(self):
         """Return all the positions (text keys) in this phase."""
@@ -41,12 +37,9 @@ class Texts:
 
     def update(self, settings: Settings, phase: str):
         """Update the texts based on the new settings (new language) and/or new phase."""
-        if settings.language == self._last_language:
-            self._this_phase_dict = self._query_db(settings.language, phase)
-        else:
-            self._all_phases_dict = self._query_db(settings.language, 'all')
-            self._this_phase_dict = self._query_db(settings.language, phase)
-            self._last_language = settings.language
+        self._all_phases_dict = self._index.get('all', settings.language)
+        self._this_phase_dict = self._index.get(phase, settings.language)
+        self._last_language = settings.language
 
     def get(self, text_or_loc: str | TextFormatter):
         """Return a piece of text."""
@@ -62,5 +55,5 @@ class Texts:
         return text
 
     def get_values(self, loc: str):
-        """Return the longest text that can be obtained for the same localization given any language."""
-        return self._db.get_loc_texts(self, loc)
+        """Return the texts that can be obtained for the same localization given any language."""
+        return self._index.get_values(loc)
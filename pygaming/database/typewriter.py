@@ -1,6 +1,6 @@
 """The Font module contain the font class."""
 from pygame.font import Font as _Ft
-from pygame import Surface, SRCALPHA, Rect
+from pygame import Surface, SRCALPHA, Rect, Color as _Cl
 from gamarts import Art
 from ..color import Color
 from .texts import Texts, TextFormatter
@@ -8,9 +8,20 @@ from .database import Database
 from ..settings import Settings
 from ..file import get_file
 from ..screen.anchors import LEFT, Anchor
+from ..screen.display_format import to_display_format
+from .render_cache import RenderCache, _DEFAULT_MAX_BYTES
+from .text_metrics import TextMetrics, TextLayout
+
+def _color_key(color: Color | None):
+    """Return a hashable version of the color to use it in the keys of the render cache."""
+    return tuple(color) if isinstance(color, _Cl) else color
 
 class Font(_Ft):
-    """The Font class is used to display texts."""
+    """
+    The Font class is used to display texts.
+    The texts are rendered by SDL_ttf, which already keeps the rasterized glyphs and the kerning of the font:
+    composing the glyphs in Python, even with a single Surface.blits, is slower than rendering the whole text.
+    """
 
     def __init__(
         self,
@@ -44,7 +55,17 @@ class Font(_Ft):
 class TypeWriter:
     """The TypeWriter is a class used to manage the fonts and the text generation."""
 
-    def __init__(self, database: Database, settings: Settings, first_phase: str) -> None:
+    def __init__(self, database: Database, settings: Settings, first_phase: str, render_cache_size: int = _DEFAULT_MAX_BYTES) -> None:
+        """
+        Create the TypeWriter.
+
+        Params:
+        ----
+        - database: Database, the database of the game.
+        - settings: Settings, the settings of the game.
+        - first_phase: str, the name of the first phase of the game.
+        - render_cache_size: int, the maximum number of bytes taken by the rendered texts kept in the render cache.
+        """
 
         self._db = database
         self._all_phases_fonts: dict[str, Font] = {
@@ -63,9 +84,15 @@ class TypeWriter:
 
         self._default_font = Font(None, 15)
         self._antialias = False
+        # The rendered texts are shared by every widget of the game.
+        self.render_cache = RenderCache(render_cache_size)
+        self._metrics: dict[Font, TextMetrics] = {}
 
     def update_settings(self, settings: Settings, phase):
         """Update the texts based on the new language."""
+        # The language, the antialiasing or the fonts may change, the rendered texts are no longer valid.
+        self.render_cache.clear()
+        self._metrics.clear()
         self._texts.update(settings, phase)
         if self._current_phase != phase: # If we change the phase, we change the fonts
             self._this_phase_fonts:  dict[str, Font] = {
@@ -82,23 +109,24 @@ class TypeWriter:
             thefont = self._all_phases_fonts.get(font, self._default_font)
         return thefont
 
-    def __wrap_text(self, thetext: str, font: str, max_width: int):
+    def get_metrics(self, font: str) -> TextMetrics:
+        """
+        Get the metrics of the font, used to measure the texts and split them into lines.
 
+        Params:
+        ----
+        - font: str, the name of the font. If the name is not find (which means it is not present on the fonts.sql file for this phase),
+        use the default system font with a size of 20
+        """
         thefont = self._get_font(font)
+        metrics = self._metrics.get(thefont)
+        if metrics is None:
+            metrics = self._metrics[thefont] = TextMetrics(thefont)
+        return metrics
 
-        lines = []
-        for text in thetext.split('\n'):
-            words_and_whitespaces = [word+' ' for word in text.split(' ')]
-            words = text.split(' ')
-            while words:
-                thisline = []
-                # Find the words that will fit in the line
-                while words and thefont.size(' '.join(thisline + [words[0]]))[0] <= max_width:
-                    thisline.append(words_and_whitespaces.pop(0))
-                    words.pop(0)
-                lines.append(''.join(thisline)[:-1]) # remove the trainling whitespace
-
-        return '\n'.join(lines)
+    def _layout(self, font: str, thetext: str, wrap: bool, max_width: int | None) -> TextLayout:
+        """Split the text into lines, wrapped if needed. The layouts are shared by the renders and the caret computations."""
+        return self.get_metrics(font).layout(thetext, max_width if wrap else None)
 
     def get_caret_index(
         self,
@@ -116,35 +144,23 @@ class TypeWriter:
         else:
             thetext = str(text_or_loc)
 
-        if wrap:
-            thetext = self.__wrap_text(thetext, font, max_width)
-
-        if pos[1]//self.get_linesize(font) > thetext.count('\n'): # the position is below the last line.
+        metrics = self.get_metrics(font)
+        layout = self._layout(font, thetext, wrap, max_width)
+        if pos[1]//layout.linesize >= len(layout.lines): # the position is below the last line.
             return len(thetext)
         if pos[1] < 0:
             return 0
 
-        line = pos[1]//self.get_linesize(font)
-        thelines = thetext.split('\n')
+        line = pos[1]//layout.linesize
 
         pos_x = pos[0]
         if justify != LEFT:
-            this_line_width = self.size(font, thelines[line])[0]
-            line_left = (max_width - this_line_width)*justify[0]
+            line_left = (max_width - layout.widths[line])*justify[0]
             pos_x -= line_left
-        
-        left_chars = ''
-        if pos_x <= 0:
-            return sum(len(theline) for theline in thelines[:line])
-
-        char_idx = 0
-        for char_idx, char in enumerate(thelines[line]):
-            
-            left_chars = left_chars + char
-            if self.size(font, left_chars)[0] > pos_x:
-                break
 
-        return sum(len(theline) for theline in thelines[:line]) + char_idx
+        if pos_x <= 0:
+            return layout.starts[line]
+        return layout.starts[line] + metrics.char_index(layout.lines[line], pos_x)
 
     def get_caret_pos(
         self,
@@ -172,25 +188,15 @@ class TypeWriter:
         else:
             thetext = str(text_or_loc)
 
-        if wrap:
-            thetext = self.__wrap_text(thetext, font, max_width)
-
-        line = 0
-        thelines = thetext.split('\n')
-        cum_length = 0
-        if len(thelines) > 1:
-            while line < len(thelines) - 1 and cum_length + len(thelines[line]) < caret_index:
-                cum_length += len(thelines[line]) + 1
-                line += 1
-        
-        w = self.size(font, thelines[line][:caret_index - cum_length])[0]
+        layout = self._layout(font, thetext, wrap, max_width)
+        line = layout.line_of(caret_index)
+        w = self._get_font(font).size(layout.lines[line][:caret_index - layout.starts[line]])[0]
 
         if justify != LEFT:
-            this_line_width = self.size(font, thelines[line])[0]
-            line_left = (max_width - this_line_width)*justify[0]
+            line_left = (max_width - layout.widths[line])*justify[0]
             w = line_left + w
 
-        return w, self.get_linesize(font)*line
+        return w, layout.linesize*line
 
     def render(
         self,
@@ -217,6 +223,8 @@ class TypeWriter:
         the surface returned has a solid background with this color, otherwise the background is transparent
         - justify: Anchor, only for multiline renders.
         - can_be_loc: bool, return whether the text or loc can be a loc or not.
+
+        The returned surface is shared with the render cache and must not be modified.
         """
         thefont = self._get_font(font)
         if can_be_loc:
@@ -224,24 +232,24 @@ class TypeWriter:
         else:
             thetext = str(text_or_loc)
 
-        if wrap:
-            thetext = self.__wrap_text(thetext, font, max_width)
+        key = (thefont, thetext, _color_key(color), _color_key(background_color), justify, wrap, max_width, self._antialias)
+        rendered = self.render_cache.get(key)
+        if rendered is not None:
+            return rendered
 
-        if "\n" in thetext:
-            lines = thetext.split('\n')
-            line_size = self.get_linesize(font)
-            bg_width = max(self.size(font, line)[0] for line in lines)
-            bg_height = len(lines)*line_size
-            background = Surface((bg_width, bg_height), SRCALPHA)
+        layout = self._layout(font, thetext, wrap, max_width) if wrap or "\n" in thetext else None
+        if layout is not None and len(layout.lines) > 1:
+            bg_width = layout.width
+            background = Surface((bg_width, layout.height), SRCALPHA)
             background.fill((0, 0, 0, 0) if background_color is None else background_color)
             line_y = 0
-            for line in lines:
+            for line in layout.lines:
                 render = thefont.render(line, self._antialias, color, background_color)
                 background.blit(render, ((bg_width - render.get_width())*justify[0], line_y))
-                line_y += line_size
-            return background
+                line_y += layout.linesize
+            return self.render_cache.put(key, to_display_format(background))
 
-        return thefont.render(thetext, self._antialias, color, background_color)
+        return self.render_cache.put(key, to_display_format(thefont.render(thetext, self._antialias, color, background_color)))
 
     def render_paragraphs(
         self,
@@ -265,34 +273,38 @@ class TypeWriter:
         - color: Color, the color to display the font in
         - background_color: Color = None, the color of the background. If a color is given,
         the surface returned has a solid background with this color, otherwise the background is transparent
+
+        The returned surface is shared with the render cache and must not be modified.
         """
         thefont = self._get_font(font)
         if can_be_loc:
             thetext = self._texts.get(text_or_loc)
         else:
             thetext = str(text_or_loc)
+
+        key = (thefont, thetext, _color_key(color), _color_key(background_color), tuple(rect.size), autotab_on_first_line)
+        rendered = self.render_cache.get(key)
+        if rendered is not None:
+            return rendered
+
         if thefont.size(thetext)[0] <= rect.width and not '\n' in thetext:
-            return thefont.render(thetext, True, color, background_color)
+            return self.render_cache.put(key, to_display_format(thefont.render(thetext, True, color, background_color)))
 
         background = Surface(rect.size, SRCALPHA)
         if background_color:
             background.fill((0, 0, 0, 0) if background_color is None else background_color)
-        line_size = thefont.get_linesize()
+        metrics = self.get_metrics(font)
         line_y = 0
         # Render the paragraphs one by one
         for text in thetext.split('\n'):
-            words = text.split()
-            first_line = autotab_on_first_line # The first line variable is used to know if we need to add a tab.
-            # If we don't auto tab, it is like if there is no first line
-            while words and line_y <= rect.height:
-                thisline = ['    '] if first_line else []
-                # Find the words that will fit in the line
-                while words and thefont.size(' '.join(thisline + [words[0]]))[0] <= rect.width:
-                    thisline.append(words.pop(0))
-
-                if words:
+            # If we auto tab, the first line of the paragraph starts with a tab.
+            lines = metrics.wrap_words(text.split(), rect.width, '    ' if autotab_on_first_line else None)
+            for line_idx, (thisline, line_width) in enumerate(lines):
+                if line_y > rect.height:
+                    break
+                if line_idx < len(lines) - 1:
                     # Spread the extra pixels among all spaces
-                    extra_pixels = rect.width - thefont.size(' '.join(thisline))[0]
+                    extra_pixels = rect.width - line_width
                     spaces = [extra_pixels//(len(thisline) - 1) for _ in range(len(thisline) - 1)]
                     if len(thisline) > 1:
                         for i in range(extra_pixels%(len(thisline) - 1)):
@@ -303,17 +315,16 @@ class TypeWriter:
                     for word, space in zip(thisline, spaces):
                         rendered_word = thefont.render(word + ' ', True, color, background_color)
                         background.blit(rendered_word, (word_x, line_y))
-                        word_x += thefont.size(word + ' ')[0] + space
+                        word_x += metrics.word_width(word + ' ') + space
 
                 else:
                     # Render the last line
                     rendered_word = thefont.render(' '.join(thisline), True, color, background_color)
                     background.blit(rendered_word, (0, line_y))
 
-                line_y += line_size
-                first_line = False
+                line_y += metrics.linesize
 
-        return background
+        return self.render_cache.put(key, to_display_format(background))
 
     def get_max_size(self, font: str, loc: str):
         """
@@ -329,7 +340,7 @@ class TypeWriter:
 
         values = self._texts.get_values(loc)
         if not values:
-            return self.size(font, loc)            
+            return self.size(font, loc)
         max_w = 0
         max_h = 0
         for value in values:
@@ -338,7 +349,7 @@ class TypeWriter:
                 max_w = w
             if h > max_h:
                 max_h = h
-            return max_w, max_h
+        return max_w, max_h
 
     def size(self, font: str, text_or_loc: str | TextFormatter) -> tuple[int, int]:
         """
@@ -357,12 +368,8 @@ class TypeWriter:
         """
         text = self._texts.get(text_or_loc)
         if "\n" in text:
-            lines = text.split('\n')
-            thefont = self._get_font(font)
-            line_size = thefont.get_linesize()
-            bg_width = max(thefont.size(line)[0] for line in lines)
-            bg_height = len(lines)*line_size
-            return bg_width, bg_height
+            layout = self._layout(font, text, False, None)
+            return layout.width, layout.height
 
         return self._get_font(font).size(text)
 
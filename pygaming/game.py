@@ -9,6 +9,8 @@ from .settings import Settings
 from .screen.screen import Screen
 from ._base import BaseRunnable
 
+_DEFAULT_TEXT_RENDER_CACHE_SIZE_KB = 16384 # The memory used to keep the rendered texts.
+
 class Game(BaseRunnable):
     """
     The game is the instance created and runned by the player.
@@ -28,7 +30,12 @@ class Game(BaseRunnable):
         self.soundbox = SoundBox(self.settings, first_phase, self.database)
         self.jukebox = Jukebox(self.settings)
 
-        self.typewriter = TypeWriter(self.database, self.settings, first_phase)
+        self.typewriter = TypeWriter(
+            self.database,
+            self.settings,
+            first_phase,
+            self.config.get("text_render_cache_size_kb", _DEFAULT_TEXT_RENDER_CACHE_SIZE_KB)*1024
+        )
 
         self.mouse = Mouse()
         self.keyboard = Keyboard()
@@ -41,7 +48,6 @@ class Game(BaseRunnable):
 
         self.screen_clock = pygame.time.Clock()
         self._display_screen = True
-        self._pause_display = False
         self._display_screen_thread = Thread(target=self.display_image)
 
     def start(self):
@@ -49,8 +55,6 @@ class Game(BaseRunnable):
         self._display_screen_thread.start()
 
     def transition(self, next_phase):
-        # Pause the displaying thread
-        self._pause_display = True
         # get the value for the arguments for the start of the next phase
         new_data = self.phases[self.current_phase].apply_transition(next_phase)
 
@@ -60,17 +64,12 @@ class Game(BaseRunnable):
         self.current_phase = next_phase
         # start the new phase
         self.phases[self.current_phase].begin(**new_data)
-        # Resume the displaying thread
-        self._pause_display = False
 
     def display_image(self) -> bool:
-        """Display the image."""
+        """Display the last image published by the update thread."""
         while self._display_screen:
-            dt = self.screen_clock.tick(self.config.get("max_frame_rate"))
-            if not self._pause_display:
-                self._screen.display_phase(self.phases[self.current_phase])
-                self._screen.update()
-                self.phases[self.current_phase].update_hover(dt)
+            self.screen_clock.tick(self.config.get("max_frame_rate"))
+            self._screen.present()
 
     def update(self) -> bool:
         """Update all the component of the game."""
@@ -81,6 +80,7 @@ class Game(BaseRunnable):
         if self.online:
             self.client.update()
         is_game_over = self.update_phases(dt)
+        self._screen.publish(self.phases[self.current_phase])
         return self._inputs.quit or is_game_over or (
             self.online and self.client.is_server_killed() and self.config.get("stop_game_on_server_killed", False)
         )
@@ -108,6 +108,7 @@ class Game(BaseRunnable):
         self.soundbox.update_settings(self.settings, self.current_phase)
         self.keyboard.update_settings(self.settings)
         self.jukebox.update_settings(self.settings)
+        self._screen.update_settings(self.settings)
 
     def stop(self):
         """Stop the algorithm properly"""
@@ -1,6 +1,5 @@
 """A phase is one step of the game."""
 from abc import ABC, abstractmethod
-from functools import lru_cache
 import gc
 import pygame
 from .error import PygamingException
@@ -10,6 +9,9 @@ from .server import Server
 from .screen.hover import Cursor
 from .screen.frame import Frame
 from .screen._abstract import Master
+from .screen.surface_pool import surface_pool
+from .screen.rotozoom_cache import rotozoom_cache
+from .screen.animation_clock import AnimationClock
 
 _TOOLTIP_DELAY = 500 # [ms]
 
@@ -175,8 +177,21 @@ class GamePhase(_BasePhase, Master):
         self.current_tooltip = None 
         self._default_cursor = Cursor(self.config.default_cursor)
         self.current_cursor = self._default_cursor
+        self._shown_cursor = None # The pygame cursor currently set.
         self._tooltip_x, self._tooltip_y = None, None
-        self._tooltip_delay = _TOOLTIP_DELAY # [ms], the delay waited before showing the tooltip
+        self._tooltip_time = 0 # [ms], the time, given by pygame.time.get_ticks, at which the tooltip will be shown.
+        self._tooltip_shown = False
+
+        # Data about the last hover resolution, made again only if the mouse moved or the children changed.
+        self._hover_pos = None
+        self._hover_result: tuple = (None, None)
+        self._hover_invalidated = True
+
+        # Data about the damaged areas of the screen, None means the whole screen is damaged.
+        self._damaged_rects: list[pygame.Rect] | None = None
+
+        # The clock updating the animated arts of every child of the phase.
+        self._animation_clock = AnimationClock()
     
     def __hash__(self) -> int:
         return hash(self._name)
@@ -200,11 +215,15 @@ class GamePhase(_BasePhase, Master):
         self.game.update_settings()
 
         # Start the frames
+        self._animation_clock.clear()
         for frame in self.children:
             frame.begin()
+        self._hover_invalidated = True
         # Change to default cursor
+        self._default_cursor.begin(self.settings)
         self.current_cursor = self._default_cursor
-        pygame.mouse.set_cursor(self._default_cursor.get(self.settings))
+        self._shown_cursor = None # Another cursor might have been set by the previous phase.
+        self._show_cursor()
         # Start the phase
         self.notify_change_all()
         self.start(**kwargs)
@@ -215,6 +234,8 @@ class GamePhase(_BasePhase, Master):
         for frame in self.children:
             frame.end() # Unload
         Master.finish(self)
+        surface_pool.clear()
+        rotozoom_cache.clear()
         gc.collect()
 
     @property
@@ -259,6 +280,22 @@ class GamePhase(_BasePhase, Master):
             return self.game.client
         raise PygamingException("The game is not connected yet, there is no network to reach.")
 
+    def notify_change(self, rect: pygame.Rect | None = None):
+        """
+        Notify a change in the visual.
+
+        Params:
+        ---
+        - rect: Rect | None, the damaged area of the screen. If None, the whole screen is damaged.
+        """
+        self._surface_changed = True
+        if rect is None:
+            self._damaged_rects = None
+        elif self._damaged_rects is not None:
+            rect = self.absolute_rect.clip(rect)
+            if rect:
+                self._damaged_rects.append(rect)
+
     def notify_change_all(self):
         """Notify the change to everyone."""
         self.notify_change()
@@ -274,15 +311,18 @@ class GamePhase(_BasePhase, Master):
         Master.loop(self, dt)
         self._update_focus()
         self.update(dt)
+        self._animation_clock.advance(dt)
         for frame in self.children:
             frame.loop(dt)
+        self.update_hover(dt)
 
     def _update_focus(self):
         """Update the focus of all the frames."""
         ck1 = self.mouse.get_click(1)
         if ck1:
+            candidates = set(self.get_children_at(ck1))
             for frame in self.frame_children:
-                if frame.is_contact(ck1):
+                if frame in candidates and frame.is_contact(ck1):
                     frame.update_focus(ck1)
                 else:
                     frame.remove_focus()
@@ -291,16 +331,31 @@ class GamePhase(_BasePhase, Master):
             for frame in self.children:
                 frame.next_object_focus()
 
+    def _invalidate_hover(self):
+        self._hover_invalidated = True
+
+    def _get_hover_position(self):
+        return self._hover_pos
+
     def update_hover(self, dt):
-        """Update the cursor and the over hover surface based on whether we are above one element or not."""
+        """
+        Update the cursor and the over hover surface based on whether we are above one element or not.
+        The hovered elements are searched only if the mouse moved or if the children of the phase changed since the last call.
+        """
         pos = self.mouse.get_position()
-        cursor, tooltip = None, None
-        for frame in self.visible_children():
-            frame_tooltip, frame_cursor = frame.get_hover(pos)
-            if frame_tooltip is not None:
-                tooltip = frame_tooltip
-            if frame_cursor is not None:
-                cursor = frame_cursor
+        if pos != self._hover_pos or self._hover_invalidated:
+            self._hover_pos = pos
+            self._hover_invalidated = False
+            cursor, tooltip = None, None
+            for frame in self.visible_children():
+                frame_tooltip, frame_cursor = frame.get_hover(pos)
+                if frame_tooltip is not None:
+                    tooltip = frame_tooltip
+                if frame_cursor is not None:
+                    cursor = frame_cursor
+            self._hover_result = tooltip, cursor
+        else:
+            tooltip, cursor = self._hover_result
 
         if tooltip is None: # We are not on a widget requiring a tooltip
             if self.current_tooltip is not None:
@@ -311,14 +366,14 @@ class GamePhase(_BasePhase, Master):
                 tooltip.loop(dt)
                 if tooltip._surface_changed: # need to go like this as tooltip's internal notify change do not call the phase
                     self.notify_change()
-                if self._tooltip_delay > 0:
-                    self._tooltip_delay -= dt
-                    if self._tooltip_delay < 0:
-                        self.notify_change() # We ask to remake the screen only if the delay is exceeded
+                if not self._tooltip_shown and pygame.time.get_ticks() >= self._tooltip_time:
+                    self._tooltip_shown = True
+                    self.notify_change() # We ask to remake the screen only if the delay is exceeded
             else: # We have a new tooltip
                 tooltip.begin(self.settings)
                 self.current_tooltip = tooltip
-                self._tooltip_delay = _TOOLTIP_DELAY
+                self._tooltip_time = pygame.time.get_ticks() + _TOOLTIP_DELAY
+                self._tooltip_shown = False
                 self._tooltip_x, self._tooltip_y = None, None
                 self.current_tooltip.notify_change() # We force its change because the language might have changed.
                 
@@ -330,31 +385,60 @@ class GamePhase(_BasePhase, Master):
         if cursor is self.current_cursor:
             has_changed = self.current_cursor.update(dt)
             if has_changed:
-                pygame.mouse.set_cursor(self.current_cursor.get(self.settings))
-                # Trigger the update of the cursor.
-                pygame.mouse.set_pos(*pos)
+                self._show_cursor()
         else:
             self.current_cursor.reset()
             self.current_cursor = cursor
-            pygame.mouse.set_cursor(self.current_cursor.get(self.settings))
-            # Trigger the update of the cursor.
-            pygame.mouse.set_pos(*pos)
+            self._show_cursor()
+
+    def _show_cursor(self):
+        """Set the current cursor as the mouse cursor, if it is not already shown. The compiled cursors are cached by the cursors."""
+        compiled_cursor = self.current_cursor.get(self.settings)
+        if compiled_cursor is not self._shown_cursor:
+            self._shown_cursor = compiled_cursor
+            pygame.mouse.set_cursor(compiled_cursor)
     
-    @lru_cache()
-    def visible_children(self) -> list[Frame]:
-        return sorted(filter(lambda ch: (ch.is_visible() and ch._x is not None), self.frame_children), key=lambda ch: ch.layer)
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect] | None:
+        """
+        Draw the damaged areas of the phase on the screen.
+        The screen is the scene composed by the update thread, not the window itself.
 
-    def draw(self, screen: pygame.Surface):
-        """Draw the phase's surface on the screen."""
-        for frame in self.visible_children():
-            surf = frame.get_surface()
-            screen.blit(surf, (frame.relative_left, frame.relative_top))
+        Returns:
+        ---
+        - rects: list[Rect] | None, the areas of the screen that have been redrawn. If None, the whole screen has been redrawn.
+        """
+        damaged_rects, self._damaged_rects = self._damaged_rects, []
+        if damaged_rects is not None and not damaged_rects:
+            return damaged_rects
 
-        if self.current_tooltip is not None and self._tooltip_delay < 0:
+        tooltip_surface, tooltip_pos = None, None
+        if self.current_tooltip is not None and self._tooltip_shown:
             if self._tooltip_x is None:
                 x, y = self.mouse.get_position() # We set the position of the tooltip with the position of the mouse.
                 self._tooltip_x, self._tooltip_y = x, y
-            screen.blit(self.current_tooltip.get_surface(self), (self._tooltip_x, max(0, self._tooltip_y - self.current_tooltip.height)))
+            tooltip_surface = self.current_tooltip.get_surface(self)
+            tooltip_pos = (self._tooltip_x, max(0, self._tooltip_y - self.current_tooltip.height))
+            tooltip_rect = tooltip_surface.get_rect(topleft=tooltip_pos).clip(screen.get_rect())
+            if damaged_rects is not None and tooltip_rect:
+                # The area under the tooltip is redrawn too, as the tooltip is blitted again over the previous one.
+                damaged_rects.append(tooltip_rect)
+
+        # The areas are cleared first, as the frames might be transparent.
+        if damaged_rects is None:
+            if not self.is_covered(self.visible_children(), screen.get_rect()):
+                screen.fill((0, 0, 0))
+            self.blit_children(screen, self.visible_children())
+        else:
+            # The areas are redrawn one after the other, as overlapping areas would blend transparent frames twice.
+            for rect in damaged_rects:
+                if not self.is_covered(self.visible_children(), rect):
+                    screen.fill((0, 0, 0), rect)
+                self.blit_children(screen, self.visible_children(), area=rect)
+
+        if tooltip_surface is not None:
+            screen.blit(tooltip_surface, tooltip_pos)
+
+        return damaged_rects
 
     def make_surface(self) -> pygame.Surface:
         pass
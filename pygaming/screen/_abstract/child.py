@@ -7,7 +7,9 @@ from .master import Master
 from ..states import WidgetStates
 
 class Child(Visual):
-    
+
+    _batched = False # If True, the master blits the surfaces returned by get_blits(offset, area) instead of the surface of the child.
+
     def __init__(self, master: Master, update_if_invisible: bool = False, **kwargs) -> None:
         super().__init__(**kwargs)
         self.master = master
@@ -15,6 +17,9 @@ class Child(Visual):
         self._visible = True
         self._update_if_invisible = update_if_invisible
         self.absolute_rect: Rect
+        self.relative_rect: Rect
+        self._drawn_rect: Rect | None = None # The area of the master on which the child has been drawn the last time.
+        self._notified_rect: Rect | None = None # The area of the master notified as damaged since the child has been drawn.
         # self.state = WidgetStates.NORMAL
 
     @abstractmethod
@@ -24,22 +29,22 @@ class Child(Visual):
     def hide(self) -> Self:
         """Hide the object."""
         self._visible = False
-        self.master._clear_cache()
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
     def show(self) -> Self:
         """Show the object."""
         self._visible = True
-        self.master._clear_cache()
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
     def toggle_visibility(self) -> Self:
         """Toggle the object visibility."""
         self._visible = not self._visible
-        self.master._clear_cache()
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
     def get_visibility(self):
@@ -56,8 +61,24 @@ class Child(Visual):
     def notify_change(self):
         """Notify a change in the visual."""
         self._surface_changed = True
-        if self.is_visible():
-            self.master.notify_change()
+        self._notify_master()
+
+    def _notify_master(self):
+        """Notify the master that the area where the child was drawn and the area where it is now are damaged."""
+        # The drawn rect is reset here and set again by the master when the child is drawn.
+        drawn_rect, self._drawn_rect = self._drawn_rect, None
+        if drawn_rect is not None:
+            self.master.notify_change(drawn_rect)
+        if not self.is_visible():
+            self._notified_rect = None
+            return
+        rect = self.relative_rect
+        if drawn_rect is None and self._notified_rect is not None and self._notified_rect.contains(rect):
+            # The child has not been drawn since its area has been notified, the master already knows it is damaged.
+            return
+        if rect != drawn_rect:
+            self.master.notify_change(rect)
+        self._notified_rect = rect
 
     def loop(self, dt: int):
         if self.is_visible() or self._update_if_invisible:
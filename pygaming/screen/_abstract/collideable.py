@@ -21,6 +21,12 @@ class Collideable(Placeable):
         super().finish()
         self.hitbox.unload()
     
+    @property
+    def contact_rect(self):
+        """Return the area of the frame where the element can be in contact with a position: its rect and its hitbox."""
+        rect = self.relative_rect
+        return rect.union(self.hitbox.get_rect().move(rect.topleft))
+
     def is_contact(self, pos: Optional[Click | tuple[int, int]]):
         """Return whether the position, relative to the top left of the master of this element, is in contact with the element."""
         if pos is None or not self.on_master:
@@ -48,6 +48,7 @@ class Disableable(Focusable):
             self.state = WidgetStates.NORMAL
             self._arts.new_state()
             self.notify_change()
+            self.master._invalidate_hover() # The object can be hovered again.
 
 class TextualDisableable(Disableable, TextualFocusable):
 
@@ -40,6 +40,7 @@ class Focusable(GraphicalChild, Collideable):
             self.state = WidgetStates.NORMAL
             self._arts.new_state()
             self.notify_change()
+            self.master._invalidate_hover() # The object can be hovered again.
 
 class TextualFocusable(Focusable, Textual):
 
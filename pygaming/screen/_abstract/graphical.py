@@ -1,5 +1,8 @@
 """The visual module contains the Visual class, an abstract for all object displayable on the screen."""
+from typing import Any, Callable
 import pygame
+from ZOCallable import ZOCallable
+from ZOCallable.functions import linear
 from .visual import Visual
 from .child import Child
 from .master import Master
@@ -40,17 +43,35 @@ class Arts:
     def set_continue_animation(self, value: bool):
         self._continue_animation = value
     
-    def update(self, dt: int, state: States = WidgetStates.NORMAL) -> bool:
+    def arts(self) -> list[Art]:
+        """Return the arts of every state."""
+        return [art for art in self._arts.values() if art is not None]
+
+    def animated(self, state: States = WidgetStates.NORMAL) -> Art:
+        """Return the art whose animation is updated in the given state."""
         if self._continue_animation or self._arts.get(state, None) is None:
-            return self._arts[WidgetStates.NORMAL].update(dt)
-        else:
-            return self._arts[state].update(dt)
+            return self._arts[WidgetStates.NORMAL]
+        return self._arts[state]
+
+    def update(self, dt: int, state: States = WidgetStates.NORMAL) -> bool:
+        return self.animated(state).update(dt)
+
+    def next_change(self, state: States = WidgetStates.NORMAL) -> int | None:
+        """Return the time before the next frame change of the art animated in the given state, or None if it is not animated."""
+        art = self.animated(state)
+        if not art.is_loaded() or len(art.surfaces) < 2:
+            return None
+        return max(art.durations[art.index] - art._time_since_last_change, 0)
     
     def get(self, state: States = WidgetStates.NORMAL, **ld_kwargs) -> pygame.Surface:
         state = WidgetStates.NORMAL if self._arts.get(state, None) is None else state
         match = self._arts[WidgetStates.NORMAL] if self._continue_animation else None
         return self._arts[state].get(match, **ld_kwargs)
 
+    def is_opaque(self, state: States = WidgetStates.NORMAL) -> bool:
+        state = WidgetStates.NORMAL if self._arts.get(state, None) is None else state
+        return self._arts[state].is_opaque()
+
     def start(self, start_all: bool = False, **ld_kwargs):
         if start_all:
             for art in self._arts.values():
@@ -71,11 +92,24 @@ class Arts:
 class Graphical(Visual):
     """The Graphicals are visual object having an art as main display."""
 
+    _animation_clock = None # The clock updating the arts, if any. Otherwise, they are updated at every loop iteration.
+
     def __init__(self, art: Art, **kwargs):
         super().__init__(**kwargs)
         self._arts = Arts(art)
         self.state = WidgetStates.NORMAL
 
+    @property
+    def state(self) -> States:
+        """The state of the graphical, used to select the art."""
+        return self._state
+
+    @state.setter
+    def state(self, state: States):
+        self._state = state
+        if self._animation_clock is not None:
+            self._animation_clock.refresh(self)
+
     @property
     def width(self):
         return self._arts.width
@@ -84,6 +118,10 @@ class Graphical(Visual):
     def height(self):
         return self._arts.height
 
+    def is_opaque(self) -> bool:
+        """Return whether the art of the current state is fully opaque."""
+        return self._arts.is_opaque(self.state)
+
     def begin(self, settings: Settings, **kwargs):
         """Call this method at the beginning of the phase."""
         self._arts.start(**settings)
@@ -95,11 +133,15 @@ class Graphical(Visual):
         super().finish()
         self._arts.end()
 
+    def _animate(self, dt: int):
+        """Update the animation of the art of the current state."""
+        if self._arts.update(dt, self.state):
+            self.notify_change()
+
     def loop(self, dt: int):
         """Call this method at every loop iteration."""
-        has_changed = self._arts.update(dt)
-        if has_changed:
-            self.notify_change()
+        if self._animation_clock is None:
+            self._animate(dt)
         self.update(dt)
 
 class GraphicalChild(Child, Graphical):
@@ -110,17 +152,56 @@ class GraphicalChild(Child, Graphical):
     def begin(self, **kwargs):
         """Call this method at the beginning of the phase."""
         self._arts.start(**self.game.settings)
+        # The arts are updated by the clock of the phase when their frame changes.
+        self._animation_clock = self.master._animation_clock
+        if self._animation_clock is not None:
+            self._animation_clock.add(self)
         self.notify_change()
         super().begin(settings=self.game.settings, **kwargs)
 
+    def finish(self):
+        """Call this method at the end of the phase."""
+        if self._animation_clock is not None:
+            self._animation_clock.remove(self)
+            self._animation_clock = None
+        super().finish()
+
+    def _tween(
+        self,
+        name: str,
+        start: float | tuple[float, ...],
+        end: float | tuple[float, ...],
+        duration: int,
+        callback: Callable[[Any], Any],
+        transition_function: ZOCallable = linear
+    ):
+        """
+        Animate a value of the child with the tweens of the phase, replacing the running animation with the same name.
+        If the duration is 0 or the child has not begun, the callback is called with the end value at once.
+        """
+        if self._animation_clock is None or duration <= 0:
+            self._stop_tween(name)
+            callback(end)
+        else:
+            self._animation_clock.tweens.start((self, name), start, end, duration, callback, transition_function)
+
+    def _stop_tween(self, name: str):
+        """Stop the animation of a value of the child."""
+        if self._animation_clock is not None:
+            self._animation_clock.tweens.stop((self, name))
+
+    def _animate(self, dt: int):
+        """Update the animation of the art of the current state. The animation is paused while the child is not visible."""
+        if self.is_visible() or self._update_if_invisible:
+            super()._animate(dt)
+
     def loop(self, dt: int):
         """Call this method at every loop iteration."""
         if self.is_visible() or self._update_if_invisible:
-            has_changed = self._arts.update(dt)
-            if has_changed:
-                self.notify_change()
+            if self._animation_clock is None:
+                super()._animate(dt)
             self.update(dt)
 
     def make_surface(self) -> pygame.Surface:
         """Create the image of the visual as a pygame surface."""
-        return self._arts.get(self.state, **self.game.settings)
+        return self._arts.get(self.state, copy=False, **self.game.settings)
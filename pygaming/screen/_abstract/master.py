@@ -1,12 +1,14 @@
 """The master module defines the Master abstract class implementing methods related to being a master."""
 from abc import abstractmethod
-from itertools import product
+from itertools import product, count
+from bisect import bisect_left, insort
+from operator import attrgetter
 from dataclasses import dataclass
-from typing import Any
-from functools import lru_cache
-from pygame import Rect
+from typing import Any, Iterable, Sequence
+from pygame import Rect, Surface
 from ordered_set import OrderedSet
 from .visual import Visual
+from ..spatial_index import SpatialIndex
 from ...game import Game
 from ..anchors import AnchorLike, Anchor, TOP_LEFT, CENTER_CENTER
 
@@ -65,6 +67,8 @@ class Grid:
             x, y = self.get(rw, col)
             element._x = x
             element._y = y
+            element._update_position()
+            element.master._update_child_index(element)
 
     def add(
         self,
@@ -173,9 +177,13 @@ class Grid:
         self._update(row, col, obj.rowspan, obj.columnspan)
 
 
+_z_key = attrgetter('_z_key')
+
 class Master(Visual):
     """The class Master is an abstract for the classes that can be the master of an Element."""
 
+    _animation_clock = None # The clock updating the arts of the children, shared by all the masters of a phase.
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.children = set()
@@ -185,7 +193,13 @@ class Master(Visual):
         self.collideable_children = set()
         self.placeable_children = set()
         self.frame_children = set()
+        # The placed children shown on the master, sorted by (layer, insertion order).
+        self._children_index: list = []
+        self._insertion_counter = count()
+        # The placed children by position, used to find the children under a point.
+        self._spatial_index = SpatialIndex()
         self.wc_ratio: tuple[int, int]
+        self._transform: tuple | None = None # (absolute_left, absolute_top, wc_ratio), None once the master or one of its masters moved.
         self.grids: list[Grid] = []
         self.game: Game
         self.absolute_rect: Rect
@@ -200,6 +214,7 @@ class Master(Visual):
             if disableable:
                 self.disableable_children.add(child)
         if placeable:
+            child._z_order = next(self._insertion_counter)
             self.placeable_children.add(child)
             if collideable:
                 self.collideable_children.add(child)
@@ -241,13 +256,160 @@ class Master(Visual):
     def notify_change_all(self) -> None:
         pass
 
-    @lru_cache(1)
-    def visible_children(self):
-        """Return the list of visible children sorted by increasing layer."""
-        return sorted(filter(lambda ch: ch.is_visible(), self.children), key= lambda w: w.layer)
+    def notify_change(self, rect: Rect | None = None):
+        """
+        Notify a change in the visual.
+
+        Params:
+        ---
+        - rect: Rect | None, the damaged area, in the coordinates of this master. If None, the whole master is damaged.
+        """
+        self._surface_changed = True
+
+    def visible_children(self) -> list:
+        """
+        Return the list of visible children sorted by increasing layer.
+        Children on the same layer are sorted by order of creation. The list must not be modified.
+        """
+        return self._children_index if self.is_visible() else []
+
+    def _update_child_index(self, child):
+        """
+        Update the position of a child in the layer-sorted index of the shown children.
+        This method must be called every time the layer, the visibility, the placement or the on_master attribute of the child change.
+        """
+        previous_key = child._z_key
+        previous_rect = self._spatial_index.get_rect(child)
+        if child._z_key is not None:
+            del self._children_index[bisect_left(self._children_index, child._z_key, key=_z_key)]
+            child._z_key = None
+        if child._visible and child._x is not None and child.on_master:
+            child._z_key = (child.layer, child._z_order)
+            insort(self._children_index, child, key=_z_key)
+        rect = None
+        if child._x is None:
+            self._spatial_index.remove(child)
+        else:
+            rect = child.contact_rect
+            self._spatial_index.update(child, rect)
+        if child in self.frame_children:
+            # The visibility of the frame, and then of all its descendants, might have changed.
+            child._invalidate_visibility()
+        # The hovering only changes if the child is shown, hidden or changes of layer, or if it leaves or reaches the hovered position.
+        if (
+            previous_key != child._z_key
+            or (previous_rect is not None and previous_rect != rect and self._is_under_hover(previous_rect))
+            or (rect is not None and rect != previous_rect and self._is_under_hover(rect))
+        ):
+            self._invalidate_hover()
+
+    def _invalidate_hover(self):
+        """Notify that the children under the mouse might have changed, the hovering needs to be updated."""
+
+    def _get_hover_position(self) -> tuple[int, int] | None:
+        """Return the position on the window where the hovering has been computed the last time, or None if it has not been computed."""
+        return None
+
+    def _is_under_hover(self, rect: Rect) -> bool:
+        """Return whether an area of the master is under the position where the hovering has been computed, like in get_children_at."""
+        pos = self._get_hover_position()
+        if pos is None:
+            return False
+        left, top, wc_ratio = self.get_transform()
+        x = int((pos[0] - left)/wc_ratio[0])
+        y = int((pos[1] - top)/wc_ratio[1])
+        return rect.colliderect((x - 1, y - 1, 3, 3))
+
+    def _invalidate_visibility(self):
+        """Invalidate the visibility cached by the descendants of the master. Call it when the master is shown, hidden, or moves on its master."""
+        for frame in self.frame_children:
+            frame._invalidate_visibility()
 
-    def _clear_cache(self):
-        self.visible_children.cache_clear()
+    def _invalidate_transforms(self):
+        """Invalidate the transforms cached by the master and its descendants. Call it when the master or its camera moves or is zoomed."""
+        # The transforms of the descendants are computed from this one: if it is not cached, theirs are not either.
+        if self._transform is not None:
+            self._transform = None
+            for frame in self.frame_children:
+                frame._invalidate_transforms()
+
+    def _compute_transform(self) -> tuple[int, int, tuple[float, float]]:
+        """Compute the position of the origin of the master on the game window and the ratio of its coordinates to the window's."""
+        return self.absolute_left, self.absolute_top, self.wc_ratio
+
+    def get_transform(self) -> tuple[int, int, tuple[float, float]]:
+        """
+        Return the transform from the coordinates of the master to the coordinates of the game window:
+        the position (x, y) on the master is at (left + x*wc_ratio[0], top + y*wc_ratio[1]) on the window.
+        The transform is cached until the master, one of its masters, or their cameras move.
+
+        Returns:
+        ---
+        - left, top: int, the position of the origin of the master on the game window.
+        - wc_ratio: tuple[float, float], the ratio between the window and the master coordinates.
+        """
+        transform = self._transform
+        if transform is None:
+            transform = self._transform = self._compute_transform()
+        return transform
+
+    def get_children_at(self, pos: tuple[int, int]) -> list:
+        """
+        Return the placed children whose contact rect is under a position, sorted by increasing layer.
+        Their hitbox still needs to be tested, with is_contact.
+
+        Params:
+        ---
+        - pos: tuple[int, int], the position on the window, like the position of the mouse or of a Click.
+        """
+        # The position in the coordinates of the master, with a margin for the rounding of the local clicks.
+        left, top, wc_ratio = self.get_transform()
+        x = int((pos[0] - left)/wc_ratio[0])
+        y = int((pos[1] - top)/wc_ratio[1])
+        return sorted(self._spatial_index.query(Rect(x - 1, y - 1, 3, 3)), key=lambda child: (child.layer, child._z_order))
+
+    def is_covered(self, children: Iterable, area: Rect) -> bool:
+        """Return whether an area of the master is completely covered by one of the opaque children."""
+        return any(child.is_opaque() and child.relative_rect.contains(area) for child in children)
+
+    def blit_children(self, surface: Surface, children: Sequence, offset: tuple[int, int] = (0, 0), area: Rect | None = None):
+        """
+        Blit the surfaces of the children on a surface, in the given order, with a single call to surface.blits.
+        The children completely covered by an opaque child blitted after them are skipped.
+
+        Params:
+        ---
+        - surface: Surface, the surface to blit the children on.
+        - children: Sequence of children of this master, usually sorted by increasing layer.
+        - offset: tuple[int, int] = (0, 0), the position of the top left of the master on the surface.
+        - area: Rect | None, if specified, only the parts of the children inside this area of the master are blitted.
+        """
+        blit_sequence = []
+        opaque_rects: list[Rect] = [] # The areas covered by the opaque children already met.
+        # The children are browsed from the front to the back to know which ones are covered.
+        for child in reversed(children):
+            rect = child.relative_rect
+            clipped = rect if area is None else rect.clip(area)
+            if not clipped or any(opaque_rect.contains(clipped) for opaque_rect in opaque_rects):
+                continue
+            if child._batched:
+                # The child is drawn as several surfaces, in its own order.
+                blit_sequence.extend(reversed(child.get_blits(offset, None if area is None else clipped)))
+                child._drawn_rect = rect
+                continue
+            if child.is_opaque():
+                opaque_rects.append(clipped)
+            if area is None:
+                blit_sequence.append((child.get_surface(), (rect.left + offset[0], rect.top + offset[1])))
+            else:
+                blit_sequence.append((
+                    child.get_surface(),
+                    (clipped.left + offset[0], clipped.top + offset[1]),
+                    clipped.move(-rect.left, -rect.top)
+                ))
+            child._drawn_rect = rect
+        blit_sequence.reverse()
+        surface.blits(blit_sequence, doreturn=False)
 
     def begin(self, **kwargs):
         """Execute this method at the beginning of the phase."""
@@ -18,6 +18,7 @@ class Placeable(Child):
         self.layer = None
         self.on_master = False
         self._current_grid = None # None or a Grid.
+        self._z_key = None # The key of the element in the index of its master, None if it is not in it.
         # All placable must have an absolute rect. It can either be based on a background, like most Elements but Frames
         # Or it can be defined differently, like Frames, Phases or Views.
         self.absolute_rect: Rect
@@ -25,21 +26,27 @@ class Placeable(Child):
     def set_layer(self, new_layer: int) -> Self:
         """Set a new value for the layer"""
         self.layer = new_layer
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
     def send_to_the_back(self) -> Self:
         """Send the object one step to the back."""
         self.layer -= 1
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
     def send_to_the_front(self) -> Self:
         """Send the object one step to the front."""
         self.layer += 1
-        self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
         return self
 
+    def _update_position(self):
+        """Update what depends on the position of the element, after it changed and before its master is updated."""
+
     def get_on_master(self) -> None:
         """Reassign the on_screen argument to whether the object is inside the screen or outside."""
         on_screen = self.absolute_rect.colliderect((0, 0, *self.master.game.config.dimension))
@@ -67,10 +74,11 @@ class Placeable(Child):
         self.anchor = Anchor(anchor)
         self.layer = layer
 
+        self._update_position()
         self.on_master = self.get_on_master()
-        if self.on_master:
-            self.master.notify_change()
-        
+        self.master._update_child_index(self)
+        self._notify_master()
+
         return self
 
     def grid(self,
@@ -114,7 +122,9 @@ class Placeable(Child):
         self._x, self._y = grid.get(row, column)
         self.layer = layer
 
+        self._update_position()
         self.on_master = self.get_on_master()
+        self.master._update_child_index(self)
         if self.on_master:
             self.master.notify_change()
 
@@ -145,9 +155,10 @@ class Placeable(Child):
         self._x += dx
         self._y += dy
 
+        self._update_position()
         self.on_master = self.get_on_master()
-        if self.on_master:
-            self.master.notify_change()
+        self.master._update_child_index(self)
+        self._notify_master()
 
     def is_visible(self):
         """Return wether the widget is visible or not."""
@@ -157,6 +168,11 @@ class Placeable(Child):
     def relative_rect(self):
         return Rect(self._x, self._y, self.width, self.height)
 
+    @property
+    def contact_rect(self):
+        """Return the area of the frame where the element can be in contact with a position."""
+        return self.relative_rect
+
     @property
     def relative_coordinate(self):
         """Reutnr the relative coordinate of the element in its frame."""
@@ -175,7 +191,8 @@ class Placeable(Child):
     @property
     def absolute_rect(self):
         """Return the rect of the element in the game window."""
-        return Rect(self.absolute_left, self.absolute_top, self.width*self.master.wc_ratio[0], self.height*self.master.wc_ratio[1])
+        left, top, wc_ratio = self.master.get_transform()
+        return Rect(left + self.relative_left*wc_ratio[0], top + self.relative_top*wc_ratio[1], self.width*wc_ratio[0], self.height*wc_ratio[1])
 
     @property
     def shape(self):
@@ -190,7 +207,8 @@ class Placeable(Child):
     @property
     def absolute_right(self):
         """Return the right coordinate of the element in the game window"""
-        return self.absolute_left + self.width*self.master.wc_ratio[0]
+        left, _, wc_ratio = self.master.get_transform()
+        return left + (self.relative_left + self.width)*wc_ratio[0]
 
     @property
     def relative_bottom(self):
@@ -200,7 +218,8 @@ class Placeable(Child):
     @property
     def absolute_bottom(self):
         """Return the bottom coordinate of the element in the game window."""
-        return self.absolute_top + self.height*self.master.wc_ratio[1]
+        _, top, wc_ratio = self.master.get_transform()
+        return top + (self.relative_top + self.height)*wc_ratio[1]
 
     @property
     def relative_left(self):
@@ -210,7 +229,8 @@ class Placeable(Child):
     @property
     def absolute_left(self):
         """Return the left coordinate of the element in the game window."""
-        return self.master.absolute_rect.left + self.relative_left*self.master.wc_ratio[0]
+        left, _, wc_ratio = self.master.get_transform()
+        return left + self.relative_left*wc_ratio[0]
 
     @property
     def relative_top(self):
@@ -220,4 +240,5 @@ class Placeable(Child):
     @property
     def absolute_top(self):
         """Return the top coordinate of the element in the game window."""
-        return self.master.absolute_rect.top + self.relative_top*self.master.wc_ratio[1]
+        _, top, wc_ratio = self.master.get_transform()
+        return top + self.relative_top*wc_ratio[1]
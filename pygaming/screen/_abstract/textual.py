@@ -1,4 +1,3 @@
-from functools import cache
 from pygame import Surface
 from ..art import Art
 from ...color import Color
@@ -7,6 +6,7 @@ from ...database import TextFormatter, TypeWriter
 from .graphical import Graphical
 from ..anchors import LEFT, Anchor, CENTER
 from ...settings import Settings
+from ..surface_pool import surface_pool
 
 class Fonts:
 
@@ -43,33 +43,9 @@ class Fonts:
         wrap: bool = False,
         max_width: int = None
     ) -> Surface:
-        """Render a piece of text."""    
-        return self._render(typewriter, state, text, bg_color, justify, can_be_loc, wrap, max_width)
-
-    @cache
-    def _render(
-        self,
-        typewriter: TypeWriter,
-        state: States,
-        text: str,
-        bg_color: Color,
-        justify: Anchor = LEFT,
-        can_be_loc: bool = True,
-        wrap: bool = False,
-        max_width: int = None
-    ) -> Surface:
-        """Render a piece of text."""
-        font = self._fonts.get(state, None)
-        if font is None:
-            font = self._fonts.get(WidgetStates.NORMAL)
-        color = self._colors.get(state, None)
-        if color is None:
-            color = self._colors.get(WidgetStates.NORMAL)
-        rendered_text = typewriter.render(font, text, color, bg_color, justify, can_be_loc, wrap, max_width)
-        return rendered_text
-
-    def cache_clear(self):
-        self._render.cache_clear()
+        """Render a piece of text. The surface is shared with the render cache of the typewriter and must not be modified."""
+        font, color = self.get(state)
+        return typewriter.render(font, text, color, bg_color, justify, can_be_loc, wrap, max_width)
 
 class Textual(Graphical):
     
@@ -86,10 +62,6 @@ class Textual(Graphical):
         self._text = new_text_or_loc
         self.notify_change()
 
-    def finish(self):
-        super().finish()
-        self._fonts.cache_clear()
-
     def _render_text(self, typewriter: TypeWriter):
         return self._fonts.render(
             typewriter,
@@ -104,7 +76,7 @@ class Textual(Graphical):
 
     def _render_text_on_bg(self, settings: Settings, typewriter: TypeWriter):
         """Return the surface of the Label."""
-        bg = self._arts.get(self.state, **settings).copy()
+        bg = surface_pool.copy(self._arts.get(self.state, copy=False, **settings))
         rendered_text = self._render_text(typewriter)
         text_width, text_height = rendered_text.get_size()
         just_x = self._justify[0]*(bg.get_width() - text_width)
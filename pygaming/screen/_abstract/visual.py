@@ -1,6 +1,7 @@
 """The visual module define the Visual class, a base class for everything that is displayed on the screen."""
 from abc import ABC, abstractmethod
 from pygame import Surface
+from ..surface_pool import surface_pool
 
 class Visual(ABC):
     """The Visual class is the most abstract class representing anything on the screen."""
@@ -24,6 +25,13 @@ class Visual(ABC):
     def size(self):
         return self.width, self.height
 
+    def is_opaque(self) -> bool:
+        """
+        Return whether the surface of the visual covers its whole rect with fully opaque pixels.
+        The masters do not draw what is hidden by opaque visuals.
+        """
+        return False
+
     def notify_change(self):
         """Notify a change in the visual."""
         self._surface_changed = True
@@ -47,10 +55,15 @@ class Visual(ABC):
         pass
 
     def get_surface(self) -> Surface:
-        """Return the surface to be displayed."""
+        """
+        Return the surface to be displayed.
+        The surface belongs to the visual, it is given back to the surface pool when a new surface is made.
+        """
         if self._surface_changed or self._last_surface is None:
             self._surface_changed = False
-            self._last_surface = self.make_surface()
+            last_surface, self._last_surface = self._last_surface, self.make_surface()
+            if last_surface is not self._last_surface:
+                surface_pool.release(last_surface)
         return self._last_surface
 
     @abstractmethod
@@ -1,14 +1,17 @@
 """The actor module contain the actor."""
 import math
 from typing import Optional
-from pygame import transform as tf
+from pygame import transform as tf, Rect
+from ZOCallable import ZOCallable
+from ZOCallable.functions import linear
 from .frame import Frame
-from .anchors import AnchorLike, TOP_LEFT, Anchor
+from .anchors import AnchorLike, TOP_LEFT
 from .hover import Hoverable
 from .art import Art
 from .hitbox import Hitbox
 from ..inputs.mouse import Click
 from .hover import Tooltip, Cursor
+from .rotozoom_cache import rotozoom_cache
 
 class Actor(Hoverable):
     """
@@ -23,8 +26,23 @@ class Actor(Hoverable):
         tooltip: Tooltip = None,
         cursor: Cursor = None,
         update_if_invisible: bool = False,
-        continue_animation: bool = False
+        continue_animation: bool = False,
+        rotation_steps: int | None = None
     ) -> None:
+        """
+        Create an actor.
+
+        Params:
+        ---
+        - rotation_steps: int | None, if given, the angle of the actor is rounded to a full turn divided in this number of steps,
+        and all the rotations of its main art are computed at the beginning of the phase.
+        """
+        self._angle = 0 # [°], counterclockwise.
+        self._zoom = 1
+        # [°], the step the angle is rounded to. If None, the default step of the rotozoom cache is used.
+        self._angle_step = 360/rotation_steps if rotation_steps else None
+        self._initial_anchor = None # The anchor given at placement, before the rotation.
+        self._geometry = None # (key, width, height, anchor) of the rotated and zoomed actor.
         super().__init__(
             master=master,
             art=main_art,
@@ -34,14 +52,57 @@ class Actor(Hoverable):
             continue_animation=continue_animation,
             update_if_invisible=update_if_invisible
         )
-        self._angle = 0
-        self._zoom = 1
-        self._initial_size = self.width, self.height
-        self._initial_anchor = None
+        self._rotation_steps = rotation_steps
+
+    def begin(self):
+        super().begin()
+        if self._rotation_steps:
+            art = self._arts.main
+            art.load(**self.game.settings)
+            rotozoom_cache.bake(art.surfaces, self._zoom, self._rotation_steps)
+
+    def _get_geometry(self) -> tuple[int, int, tuple[float, float] | None]:
+        """Return the size and the anchor of the rotated and zoomed actor. The anchor is moved with the point it is on."""
+        size = self._arts.size
+        key = (self._angle, self._zoom, size, self._initial_anchor)
+        if self._geometry is None or self._geometry[0] != key:
+            width, height = rotozoom_cache.get_size(size, self._angle, self._zoom, self._angle_step)
+            anchor = self._initial_anchor
+            angle, zoom = rotozoom_cache.quantize(self._angle, self._zoom, self._angle_step)
+            if anchor is not None and (angle or zoom != 1):
+                theta = math.radians(-angle)
+                # The anchor point relative to the center, before and after the rotation.
+                rel_x, rel_y = (anchor[0] - 0.5)*size[0]*zoom, (anchor[1] - 0.5)*size[1]*zoom
+                new_rel_x = rel_x*math.cos(theta) - rel_y*math.sin(theta)
+                new_rel_y = rel_x*math.sin(theta) + rel_y*math.cos(theta)
+                anchor = (new_rel_x + width/2)/width, (new_rel_y + height/2)/height
+            self._geometry = (key, width, height, anchor)
+        return self._geometry[1:]
+
+    @property
+    def width(self):
+        return self._get_geometry()[0]
+
+    @property
+    def height(self):
+        return self._get_geometry()[1]
+
+    @property
+    def anchor(self):
+        """The anchor of the actor, the point placed at its coordinates. It follows the rotations."""
+        return self._get_geometry()[2]
+
+    @anchor.setter
+    def anchor(self, anchor):
+        self._initial_anchor = anchor
+
+    @property
+    def relative_rect(self):
+        width, height, anchor = self._get_geometry()
+        return Rect(self._x - anchor[0]*width, self._y - anchor[1]*height, width, height)
 
     def place(self, x: int, y:int, anchor: AnchorLike = TOP_LEFT, angle: float = 0, zoom: float = 1, layer: int = 0):
-        self._initial_anchor = Anchor(anchor)
-        self._angle = angle
+        self._angle = angle % 360
         self._zoom = zoom
         return super().place(x, y, anchor, layer)
 
@@ -52,15 +113,37 @@ class Actor(Hoverable):
             self._y += dy
 
             self.on_master = self.get_on_master()
-            if self.on_master:
-                self.master.notify_change()
+            self.master._update_child_index(self)
+            self._notify_master()
+
+    def glide(self, dx, dy, duration: int, transition_function: ZOCallable = linear):
+        """
+        Translate the actor in the frame by a given value, progressively.
+
+        Params:
+        ---
+        - dx, dy: the translation of the actor at the end of the movement.
+        - duration: int [ms], the duration of the movement.
+        - transition_function: ZOCallable, the progress of the movement given the progress of the time. Default is linear.
+        """
+        done = [0, 0] # The part of the translation already done.
+        def move(offset):
+            x, y = round(offset[0]), round(offset[1])
+            if (x, y) != (done[0], done[1]):
+                self.translate(x - done[0], y - done[1])
+                done[:] = x, y
+        self._tween('glide', (0, 0), (dx, dy), duration, move, transition_function)
+
+    def is_opaque(self):
+        """Return whether the actor is fully opaque. Rotated or zoomed actors are not."""
+        return not self._angle and self._zoom == 1 and super().is_opaque()
 
     def make_surface(self):
         """Create the current surface."""
 
-        surface = self._arts.get(self.state, **self.game.settings)
+        surface = self._arts.get(self.state, copy=False, **self.game.settings)
         if self._angle or self._zoom != 1:
-            surface = tf.rotozoom(surface, self._angle, self._zoom)
+            surface = rotozoom_cache.get(surface, self._angle, self._zoom, self._angle_step)
         return surface
 
     def is_contact(self, pos: Optional[Click | tuple[int, int]]):
@@ -71,51 +154,34 @@ class Actor(Hoverable):
             pos = Click(*pos)
         ck = pos.make_local_click(self.absolute_left, self.absolute_top, self.master.wc_ratio)
         pos = ck.x, ck.y
-        if self._zoom != 1:
-            # modify the position to take the zoom into account.
-            x,y = pos
-            x/= self._zoom
-            y/= self._zoom
-            pos = x,y
-        if self._angle:
-            # modify the position to take the angle into account.
-            x,y = pos # relative to the top left of the element this is the hitbox
-            rel_x = x - self.width/2 # relative to the center of the element.
-            rel_y = y - self.height/2
-
-            rad = math.radians(self._angle)
+        angle, zoom = rotozoom_cache.quantize(self._angle, self._zoom, self._angle_step)
+        if angle or zoom != 1:
+            # modify the position to take the angle and the zoom into account.
+            rel_x = ck.x - self.width/2 # relative to the center of the element.
+            rel_y = ck.y - self.height/2
+
+            rad = math.radians(angle)
             cos_a, sin_a = math.cos(rad), math.sin(rad)
 
-            orig_x = cos_a * rel_x - sin_a * rel_y # relative to the center of the element, before rotation
-            orig_y = sin_a * rel_x + cos_a * rel_y
+            orig_x = (cos_a * rel_x - sin_a * rel_y)/zoom # relative to the center of the element, before rotation and zoom
+            orig_y = (sin_a * rel_x + cos_a * rel_y)/zoom
 
-            pos = orig_x + self._initial_size[0]/2, orig_y + self._initial_size[1]/2
+            pos = orig_x + self._arts.width/2, orig_y + self._arts.height/2
         return self.hitbox.is_contact(pos)
 
-    def _find_new_anchor(self):
-        w, h = self.width, self.height # the size before any rotation
-
-        theta = math.radians(-self._angle)
-        self.width = int(w * abs(math.cos(theta)) + h * abs(math.sin(theta)))
-        self.height = int(h * abs(math.cos(theta)) + w * abs(math.sin(theta)))
-
-        point = self._initial_anchor[0]*w, self._initial_anchor[1]*h # the point of anchor before rotation
-        rel_x, rel_y = point[0] - w / 2, point[1] - h / 2 # relative to the old center
-        new_rel_x = (rel_x * math.cos(theta) - rel_y * math.sin(theta)) # relative to the new center
-        new_rel_y = (rel_x * math.sin(theta) + rel_y * math.cos(theta))
-        self.anchor = (new_rel_x + self.width / 2)/self.width, (new_rel_y + self.height / 2)/self.height
+    def _notify_geometry_change(self):
+        """Notify that the size of the actor changed."""
+        if self._x is not None:
+            self.on_master = self.get_on_master()
+            self.master._update_child_index(self)
+        self.notify_change()
 
     def rotate(self, angle):
-        """Rotate the actor."""
-        self._angle += angle
-        self._find_new_anchor()
-        self.get_on_master()
-        self.notify_change()
+        """Rotate the actor counterclockwise by an angle [°], around its anchor."""
+        self._angle = (self._angle + angle) % 360
+        self._notify_geometry_change()
 
     def zoom(self, zoom):
-        """Zoom the actor."""
+        """Zoom the actor by a factor, around its anchor."""
         self._zoom *= zoom
-        self.width *= zoom
-        self.height *= zoom
-        self.get_on_master()
-        self.notify_change()
+        self._notify_geometry_change()
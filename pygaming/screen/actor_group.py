@@ -0,0 +1,446 @@
+"""The actor_group module contains the ActorGroup class, used to display and move many sprites at once."""
+from typing import Sequence
+import numpy as np
+import pygame
+from ._abstract import Placeable
+from ._abstract.graphical import Arts
+from .frame import Frame
+from .art import Art
+from .states import WidgetStates
+from .rotozoom_cache import rotozoom_cache
+
+_DEFAULT_CAPACITY = 64
+
+def _unique_rows(*columns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the unique rows of the columns, and the index of the unique row of every row. Faster than np.unique(axis=0)."""
+    order = np.lexsort(columns[::-1])
+    rows = np.stack(columns, axis=1)[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]).any(axis=1)
+    inverse = np.empty(len(rows), dtype=np.intp)
+    inverse[order] = np.cumsum(first) - 1
+    return rows[first], inverse
+
+class _AnimatedArt:
+    """One of the arts of an actor group, animated by the clock of the phase like the art of a graphical."""
+
+    state = WidgetStates.NORMAL
+
+    def __init__(self, group: 'ActorGroup', art: Art) -> None:
+        self._group = group
+        self._arts = Arts(art)
+
+    def _animate(self, dt: int):
+        """Update the animation of the art. The animation is paused while the group is not visible."""
+        group = self._group
+        if (group.is_visible() or group._update_if_invisible) and self._arts.update(dt):
+            group._notify_frames_change()
+
+class ActorGroup(Placeable):
+    """
+    An ActorGroup displays many sprites, like bullets or particles, as a single child of its frame.
+    The positions, angles, zooms, layers and arts of the sprites are stored in arrays and modified all at once.
+    Every sprite is centered on its position, relative to the position of the group, and rotates around its center.
+    The group notifies its frame once per modification, with the area covering all its sprites, and the sprites are
+    blitted by the frame with its other children, in a single call.
+    The sprites can't be hovered nor clicked, use actors for this.
+    """
+
+    _batched = True
+
+    def __init__(
+        self,
+        master: Frame,
+        arts: Art | Sequence[Art],
+        layer: int = 0,
+        update_if_invisible: bool = False,
+        rotation_steps: int | None = None
+    ) -> None:
+        """
+        Create an actor group.
+
+        Params:
+        ---
+        - master: Frame, the frame the sprites are displayed on.
+        - arts: Art | Sequence[Art], the arts of the sprites. Every sprite is displayed with one of them, given by its index.
+        - layer: int, the layer of the group on its master. The sprites are sorted by their own layers inside the group.
+        - update_if_invisible: bool, if True, the arts are animated even when the group is not visible.
+        - rotation_steps: int | None, if given, the angles of the sprites are rounded to a full turn divided in this number of steps,
+        and all the rotations of the arts are computed at the beginning of the phase.
+        """
+        super().__init__(master=master, update_if_invisible=update_if_invisible)
+        self._arts: tuple[Art, ...] = (arts,) if isinstance(arts, Art) else tuple(arts)
+        self._rotation_steps = rotation_steps
+        self._angle_step = None if not rotation_steps else 360/rotation_steps
+        self._count = 0
+        self._positions = np.zeros((_DEFAULT_CAPACITY, 2))
+        self._angles = np.zeros(_DEFAULT_CAPACITY) # [°], counterclockwise.
+        self._zooms = np.ones(_DEFAULT_CAPACITY)
+        self._layers = np.zeros(_DEFAULT_CAPACITY, dtype=int)
+        self._art_indices = np.zeros(_DEFAULT_CAPACITY, dtype=np.intp)
+        # (combinations of art, angle and zoom, combination of every sprite, widths, heights, drawing order, sizes of the arts),
+        # recomputed when the sprites change of art, angle or zoom. The sizes are the declared sizes of the arts, rotated and zoomed.
+        self._appearance: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, tuple] | None = None
+        # The surfaces of the sprites in the drawing order, recomputed when the sprites or the frames of the arts change.
+        self._surfaces: list[pygame.Surface] | None = None
+        # The arts are updated by the clock of the phase when their frame changes.
+        self._animation_clock = None
+        # An art used by several indices is started, updated and ended only once.
+        self._distinct_arts = tuple(dict.fromkeys(self._arts))
+        self._animated_arts = [_AnimatedArt(self, art) for art in self._distinct_arts]
+        # (lefts, tops, rights, bottoms, rect) of the sprites relative to the position of the group, recomputed when they move.
+        self._layout: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, pygame.Rect] | None = None
+        self.place(0, 0, layer=layer)
+
+    def _grow(self, size: int):
+        capacity = len(self._angles)
+        while capacity < size:
+            capacity *= 2
+        for name in ('_positions', '_angles', '_zooms', '_layers', '_art_indices'):
+            old = getattr(self, name)
+            array = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            array[:self._count] = old[:self._count]
+            setattr(self, name, array)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def positions(self) -> np.ndarray:
+        """The positions (x, y) of the centers of the sprites, relative to the position of the group. Call notify_change after modifying them."""
+        return self._positions[:self._count]
+
+    @property
+    def angles(self) -> np.ndarray:
+        """The angles [°] of the sprites. Call notify_change after modifying them."""
+        return self._angles[:self._count]
+
+    @property
+    def zooms(self) -> np.ndarray:
+        """The zooms of the sprites. Call notify_change after modifying them."""
+        return self._zooms[:self._count]
+
+    @property
+    def layers(self) -> np.ndarray:
+        """The layers of the sprites in the group. Call notify_change after modifying them."""
+        return self._layers[:self._count]
+
+    @property
+    def art_indices(self) -> np.ndarray:
+        """The index of the art of every sprite. Call notify_change after modifying them."""
+        return self._art_indices[:self._count]
+
+    def add(self, x, y, art=0, angle=0., zoom=1., layer=0) -> np.ndarray:
+        """
+        Add sprites to the group. All the arguments can be single values or arrays, one value per new sprite.
+
+        Params:
+        ---
+        - x, y: the positions of the centers of the sprites, relative to the position of the group.
+        - art: the indices of the arts of the sprites.
+        - angle: the angles [°] of the sprites, counterclockwise.
+        - zoom: the zooms of the sprites.
+        - layer: the layers of the sprites in the group. The sprites with the same layer are drawn in their order in the group.
+
+        Returns:
+        ---
+        - indices: np.ndarray, the indices of the new sprites.
+
+        Raises:
+        ---
+        - ValueError if an art index does not match an art of the group.
+        """
+        x, y, art, angle, zoom, layer = np.broadcast_arrays(*map(np.atleast_1d, (x, y, art, angle, zoom, layer)))
+        if np.any((art < 0) | (art >= len(self._arts))):
+            raise ValueError(f"The art indices must be between 0 and {len(self._arts) - 1}, got {art}.")
+        start, end = self._count, self._count + len(x)
+        if end > len(self._angles):
+            self._grow(end)
+        self._positions[start:end, 0] = x
+        self._positions[start:end, 1] = y
+        self._art_indices[start:end] = art
+        self._angles[start:end] = angle % 360
+        self._zooms[start:end] = zoom
+        self._layers[start:end] = layer
+        self._count = end
+        self.notify_change()
+        return np.arange(start, end)
+
+    def remove(self, sprites):
+        """
+        Remove sprites from the group. The following sprites keep their order, and their indices are shifted.
+
+        Params:
+        ---
+        - sprites: the index, the indices, or a boolean mask of the sprites to remove.
+        """
+        keep = np.ones(self._count, dtype=bool)
+        keep[sprites] = False
+        count = int(np.count_nonzero(keep))
+        if count == self._count:
+            return
+        for array in (self._positions, self._angles, self._zooms, self._layers, self._art_indices):
+            array[:count] = array[:self._count][keep]
+        self._count = count
+        self.notify_change()
+
+    def clear(self):
+        """Remove all the sprites."""
+        if self._count:
+            self._count = 0
+            self.notify_change()
+
+    def translate(self, dx, dy, sprites=None):
+        """
+        Translate sprites.
+
+        Params:
+        ---
+        - dx, dy: the translation, a single value or one value per translated sprite.
+        - sprites: the index, the indices or a boolean mask of the sprites to translate. If None, all the sprites are translated.
+        """
+        selection = slice(None) if sprites is None else sprites
+        self._positions[:self._count][selection, 0] += dx
+        self._positions[:self._count][selection, 1] += dy
+        self._notify_sprites_change(moved_only=True)
+
+    def rotate(self, angle, sprites=None):
+        """
+        Rotate sprites counterclockwise around their centers.
+
+        Params:
+        ---
+        - angle: the angle [°], a single value or one value per rotated sprite.
+        - sprites: the index, the indices or a boolean mask of the sprites to rotate. If None, all the sprites are rotated.
+        """
+        selection = slice(None) if sprites is None else sprites
+        angles = self._angles[:self._count]
+        angles[selection] = (angles[selection] + angle) % 360
+        self.notify_change()
+
+    def zoom(self, zoom, sprites=None):
+        """
+        Zoom sprites around their centers.
+
+        Params:
+        ---
+        - zoom: the zoom factor, a single value or one value per zoomed sprite.
+        - sprites: the index, the indices or a boolean mask of the sprites to zoom. If None, all the sprites are zoomed.
+        """
+        selection = slice(None) if sprites is None else sprites
+        self._zooms[:self._count][selection] *= zoom
+        self.notify_change()
+
+    def set_art(self, art, sprites=None):
+        """
+        Change the art of sprites.
+
+        Params:
+        ---
+        - art: the index of the new art, a single value or one value per modified sprite.
+        - sprites: the index, the indices or a boolean mask of the sprites to modify. If None, all the sprites are modified.
+        """
+        if np.any((np.asarray(art) < 0) | (np.asarray(art) >= len(self._arts))):
+            raise ValueError(f"The art indices must be between 0 and {len(self._arts) - 1}, got {art}.")
+        selection = slice(None) if sprites is None else sprites
+        self._art_indices[:self._count][selection] = art
+        self.notify_change()
+
+    def set_sprite_layer(self, layer, sprites=None):
+        """
+        Change the layer of sprites in the group.
+
+        Params:
+        ---
+        - layer: the new layer, a single value or one value per modified sprite.
+        - sprites: the index, the indices or a boolean mask of the sprites to modify. If None, all the sprites are modified.
+        """
+        selection = slice(None) if sprites is None else sprites
+        self._layers[:self._count][selection] = layer
+        self.notify_change()
+
+    def notify_change(self):
+        """Notify a change of the sprites. Call it after modifying the arrays of the sprites directly."""
+        self._notify_sprites_change(moved_only=False)
+
+    def _notify_sprites_change(self, moved_only: bool):
+        """Notify the master, once, of the change of the area covered by the sprites."""
+        if not moved_only:
+            self._appearance = None
+            self._surfaces = None
+        self._layout = None
+        if self._x is not None:
+            self.on_master = self.get_on_master()
+            self.master._update_child_index(self)
+        super().notify_change()
+
+    def _notify_frames_change(self):
+        """Notify the master that the frames of the arts changed. The sprites keep their sizes, unless the arts have been transformed."""
+        if self._appearance is not None and self._appearance[5] != tuple(art.size for art in self._arts):
+            self.notify_change()
+        else:
+            self._surfaces = None
+            super().notify_change()
+
+    def _notify_master(self):
+        """Notify the master that the area where the sprites were drawn and the area where they are now are damaged, at once if they overlap."""
+        drawn_rect = self._drawn_rect
+        if drawn_rect is not None and self.is_visible():
+            rect = self.relative_rect
+            if rect.colliderect(drawn_rect):
+                self._drawn_rect = None
+                self.master.notify_change(rect.union(drawn_rect))
+                self._notified_rect = rect
+                return
+        super()._notify_master()
+
+    def _get_appearance(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, tuple]:
+        """
+        Return the combinations of art, angle and zoom of the sprites, the combination of every sprite,
+        the size of every sprite and the drawing order. The arts are not loaded.
+        """
+        if self._appearance is None:
+            count = self._count
+            art_sizes = tuple(art.size for art in self._arts)
+            if not count:
+                empty = np.zeros(0, dtype=int)
+                self._appearance = (np.zeros((0, 3)), empty, empty, empty, empty, art_sizes)
+                return self._appearance
+            angles, zooms = rotozoom_cache.quantize_arrays(self._angles[:count], self._zooms[:count], self._angle_step)
+            # The sizes are computed once for every combination of art, angle and zoom.
+            combinations, inverse = _unique_rows(self._art_indices[:count].astype(float), angles, zooms)
+            sizes = np.array([
+                rotozoom_cache.get_size(art_sizes[int(art)], angle, zoom, self._angle_step)
+                for art, angle, zoom in combinations.tolist()
+            ])
+            order = np.argsort(self._layers[:count], kind='stable')
+            self._appearance = (combinations, inverse, sizes[inverse, 0], sizes[inverse, 1], order, art_sizes)
+        return self._appearance
+
+    def _get_surfaces(self) -> list[pygame.Surface]:
+        """Return the surfaces of the sprites, in the drawing order. The arts are loaded if they are not."""
+        if self._surfaces is None:
+            combinations, inverse, _, _, order, _ = self._get_appearance()
+            frames = {}
+            surfaces = []
+            for art, angle, zoom in combinations.tolist():
+                art = int(art)
+                if art not in frames:
+                    frames[art] = self._arts[art].get(None, copy=False, **self.game.settings)
+                surfaces.append(rotozoom_cache.get(frames[art], angle, zoom, self._angle_step))
+            self._surfaces = [surfaces[i] for i in inverse[order].tolist()]
+        return self._surfaces
+
+    def _get_layout(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, pygame.Rect]:
+        """Return the lefts, tops, rights and bottoms of the sprites and the rect covering them, relative to the position of the group."""
+        if self._layout is None:
+            _, _, widths, heights, _, _ = self._get_appearance()
+            if not self._count:
+                empty = np.zeros(0, dtype=int)
+                self._layout = (empty, empty, empty, empty, pygame.Rect(0, 0, 0, 0))
+                return self._layout
+            positions = self._positions[:self._count]
+            lefts = np.floor(positions[:, 0] - widths/2).astype(int)
+            tops = np.floor(positions[:, 1] - heights/2).astype(int)
+            rights, bottoms = lefts + widths, tops + heights
+            left, top = int(lefts.min()), int(tops.min())
+            rect = pygame.Rect(left, top, int(rights.max()) - left, int(bottoms.max()) - top)
+            self._layout = (lefts, tops, rights, bottoms, rect)
+        return self._layout
+
+    @property
+    def relative_rect(self):
+        """The area of the master covered by the sprites."""
+        return self._get_layout()[4].move(self._x, self._y)
+
+    @property
+    def relative_left(self):
+        return self._x + self._get_layout()[4].left
+
+    @property
+    def relative_top(self):
+        return self._y + self._get_layout()[4].top
+
+    @property
+    def width(self):
+        return self._get_layout()[4].width
+
+    @property
+    def height(self):
+        return self._get_layout()[4].height
+
+    def on_camera(self) -> np.ndarray:
+        """Return a boolean mask of the sprites displayed by the camera of the frame, or by one of its views."""
+        lefts, tops, rights, bottoms, _ = self._get_layout()
+        on_camera = np.zeros(self._count, dtype=bool)
+        for camera in [self.master.camera] + [view.camera for view in self.master.views]:
+            left, top = camera.left - self._x, camera.top - self._y
+            on_camera |= (lefts < left + camera.width) & (rights > left) & (tops < top + camera.height) & (bottoms > top)
+        return on_camera
+
+    def get_blits(self, offset: tuple[int, int], area: pygame.Rect | None = None) -> list[tuple]:
+        """
+        Return the blit sequence drawing the sprites, in the format of Surface.blits.
+
+        Params:
+        ---
+        - offset: tuple[int, int], the position of the top left of the master on the destination surface.
+        - area: Rect | None, if specified, only the parts of the sprites inside this area of the master are blitted.
+        """
+        order = self._get_appearance()[4]
+        surfaces = self._get_surfaces()
+        lefts, tops, rights, bottoms, _ = self._get_layout()
+        lefts, tops = lefts[order] + self._x, tops[order] + self._y
+        if area is None:
+            return list(zip(surfaces, zip((lefts + offset[0]).tolist(), (tops + offset[1]).tolist())))
+        rights, bottoms = rights[order] + self._x, bottoms[order] + self._y
+        clipped_lefts, clipped_tops = np.maximum(lefts, area.left), np.maximum(tops, area.top)
+        clipped_rights, clipped_bottoms = np.minimum(rights, area.right), np.minimum(bottoms, area.bottom)
+        shown = np.flatnonzero((clipped_lefts < clipped_rights) & (clipped_tops < clipped_bottoms))
+        return [
+            (surfaces[i], (left + offset[0], top + offset[1]), (left - sprite_left, top - sprite_top, right - left, bottom - top))
+            for i, left, top, right, bottom, sprite_left, sprite_top in zip(
+                shown.tolist(), clipped_lefts[shown].tolist(), clipped_tops[shown].tolist(), clipped_rights[shown].tolist(),
+                clipped_bottoms[shown].tolist(), lefts[shown].tolist(), tops[shown].tolist()
+            )
+        ]
+
+    def make_surface(self) -> pygame.Surface:
+        """Draw all the sprites on a transparent surface covering them."""
+        rect = self.relative_rect
+        surface = pygame.Surface((max(rect.width, 1), max(rect.height, 1)), pygame.SRCALPHA)
+        surface.blits(self.get_blits((-rect.left, -rect.top)), doreturn=False)
+        return surface
+
+    def begin(self, **kwargs):
+        """Call this method at the beginning of the phase."""
+        for art in self._distinct_arts:
+            art.start(**self.game.settings)
+            if self._rotation_steps:
+                art.load(**self.game.settings)
+                rotozoom_cache.bake(art.surfaces, 1, self._rotation_steps)
+        self._animation_clock = self.master._animation_clock
+        if self._animation_clock is not None:
+            for animated_art in self._animated_arts:
+                self._animation_clock.add(animated_art)
+        self.notify_change()
+        super().begin(**kwargs)
+
+    def finish(self):
+        """Call this method at the end of the phase."""
+        if self._animation_clock is not None:
+            for animated_art in self._animated_arts:
+                self._animation_clock.remove(animated_art)
+            self._animation_clock = None
+        super().finish()
+        for art in self._distinct_arts:
+            art.end()
+
+    def loop(self, dt: int):
+        """Animate the arts of the sprites, if there is no clock to do it, and update the group."""
+        if self.is_visible() or self._update_if_invisible:
+            if self._animation_clock is None:
+                # Every art is updated, the list is not short-circuited.
+                if any([art.update(dt) for art in self._distinct_arts]):
+                    self._notify_frames_change()
+            self.update(dt)
@@ -0,0 +1,92 @@
+"""The animation_clock module contains the AnimationClock class, used to update the animated arts only when their frame changes."""
+import heapq
+from itertools import count
+from .art.art import pop_changed_arts
+from .tween import TweenEngine
+
+class AnimationClock:
+    """
+    An AnimationClock updates the arts of the graphicals of a phase.
+    The graphicals are kept in a heap sorted by the time of their next frame change: at every loop iteration,
+    only the graphicals whose frame changes are updated, and the static arts are never updated.
+    The graphicals are updated again when their state changes, or when one of their arts is loaded or transformed.
+    The clock also advances the tweens used for the transitions of the widgets, the movements of the actors and the cameras.
+    """
+
+    def __init__(self) -> None:
+        self._time = 0 # [ms], the time elapsed since the clock has been created.
+        self._heap: list[tuple[int, int, object]] = [] # (time of the next change, id of the entry, graphical)
+        # graphical: (id of the entry, animated art, time of the last update or None if the art is not animated)
+        self._entries: dict[object, tuple[int, object, int | None]] = {}
+        self._users: dict[object, set] = {} # art: the graphicals using it.
+        self._pending: set = set() # The graphicals to update at the next iteration, whatever their next change.
+        self._counter = count()
+        self.tweens = TweenEngine()
+
+    def add(self, graphical):
+        """Start updating the arts of a graphical."""
+        for art in graphical._arts.arts():
+            self._users.setdefault(art, set()).add(graphical)
+        self._pending.add(graphical)
+
+    def remove(self, graphical):
+        """Stop updating the arts of a graphical."""
+        for art in graphical._arts.arts():
+            users = self._users.get(art)
+            if users is not None:
+                users.discard(graphical)
+                if not users:
+                    del self._users[art]
+        self._entries.pop(graphical, None)
+        self._pending.discard(graphical)
+
+    def refresh(self, graphical):
+        """Update a graphical at the next iteration, because the art it animates might have changed."""
+        if graphical in self._entries:
+            self._pending.add(graphical)
+
+    def clear(self):
+        """Forget every graphical."""
+        self._heap.clear()
+        self._entries.clear()
+        self._users.clear()
+        self._pending.clear()
+        self.tweens.clear()
+
+    def _update(self, graphical):
+        """Update the animated art of a graphical with the time elapsed since its last update, and schedule its next change."""
+        entry = self._entries.get(graphical)
+        art = graphical._arts.animated(graphical.state)
+        # If the animated art changed with the state, the previous art is left where it was.
+        # The time does not flow for the arts that were not animated, like the unloaded ones.
+        graphical._animate(self._time - entry[2] if entry is not None and entry[1] is art and entry[2] is not None else 0)
+        entry_id = next(self._counter)
+        delay = graphical._arts.next_change(graphical.state)
+        if delay is not None:
+            # A frame of null duration is shown at the next iteration, otherwise the graphical would be updated again and again.
+            heapq.heappush(self._heap, (self._time + max(delay, 1), entry_id, graphical))
+        self._entries[graphical] = (entry_id, art, None if delay is None else self._time)
+
+    def advance(self, dt: int):
+        """
+        Advance the clock and update the graphicals whose next frame change is due.
+
+        Params:
+        ---
+        - dt: int, the duration of the loop iteration, in ms.
+        """
+        self._time += dt
+        for art in pop_changed_arts():
+            self._pending.update(self._users.get(art, ()))
+        pending, self._pending = self._pending, set()
+        for graphical in pending:
+            self._update(graphical)
+        while self._heap and self._heap[0][0] <= self._time:
+            _, entry_id, graphical = heapq.heappop(self._heap)
+            entry = self._entries.get(graphical)
+            if entry is not None and entry[0] == entry_id: # Otherwise, the graphical has been updated or removed since.
+                self._update(graphical)
+        self.tweens.advance(dt)
+
+    def __len__(self) -> int:
+        return len(self._entries)
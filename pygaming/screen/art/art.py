@@ -3,7 +3,9 @@ from gamarts import (
     TexturedCircle, TexturedEllipse, TexturedPolygon, TexturedRoundedRectangle, Art
 )
 # reexport of all arts, some are slightly modified to use the get_file function
+from weakref import WeakSet
 from ...file import get_file
+from ..display_format import to_display_format, is_display_format_available, is_surface_opaque
 
 # Update the saving method of the art by using the get_file function.
 __art_save = Art.save
@@ -27,11 +29,104 @@ def __new_init(self, transformation):
     __art_init(self, transformation)
     self._permanent = False
     self._load_on_start = False
+    self._opaque_surfaces = None
+    self._opaque = False
 Art.__init__ =  __new_init
 
-# Add a copy at get time.
+# Add the opacity of the art, computed once for every new set of surfaces.
+def __is_opaque(self) -> bool:
+    """Return whether the art is loaded and all its frames are fully opaque."""
+    if not self._loaded:
+        return False
+    surfaces = self._surfaces
+    if surfaces is not self._opaque_surfaces:
+        self._opaque = all(map(is_surface_opaque, surfaces))
+        self._opaque_surfaces = surfaces
+    return self._opaque
+Art.is_opaque = __is_opaque
+
+# Add a copy at get time, unless the copy-on-write mode is enabled.
+__copy_on_get = True
 __art_get = Art.get
-Art.get = lambda self, match, copy = True, **kwargs: __art_get(self, match, **kwargs).copy() if copy else __art_get(self, match, **kwargs)
+def __new_get(self, match, copy: bool = None, **kwargs):
+    if copy is None:
+        copy = __copy_on_get
+    return __art_get(self, match, **kwargs).copy() if copy else __art_get(self, match, **kwargs)
+Art.get = __new_get
+
+def set_copy_on_write(enabled: bool = True):
+    """
+    Enable or disable the copy-on-write mode of the arts.
+    By default, art.get(...) returns a copy of the surface of the art. In copy-on-write mode, it returns the surface of the art itself,
+    which must not be modified: the caller must copy it before drawing on it, preferably with surface_pool.copy(...).
+    An explicit copy argument given to art.get(...) is always respected.
+    """
+    global __copy_on_get
+    __copy_on_get = not enabled
+
+# Convert the surfaces into the display format when they are loaded or transformed.
+__loaded_arts: WeakSet[Art] = WeakSet()
+# The arts loaded or transformed since the last call to pop_changed_arts, whose animation must be scheduled again.
+__changed_arts: set[Art] = set()
+# The arts transformed since their last conversion. They are converted by pop_changed_arts, on the main thread.
+__transformed_arts: set[Art] = set()
+
+def pop_changed_arts() -> list[Art]:
+    """
+    Return the arts that have been loaded or transformed since the last call, the references of the transformed arts included.
+    The surfaces of the transformed arts are converted into the display format here, once their transformation thread is over.
+    """
+    for art in list(__transformed_arts): # The arts can be transformed by another thread.
+        if art._transfo_thread is None or not art._transfo_thread.is_alive():
+            __transformed_arts.discard(art)
+            if art._loaded:
+                __convert_surfaces(art)
+    arts = []
+    while __changed_arts:
+        arts.append(__changed_arts.pop())
+    return arts
+
+def __convert_surfaces(self):
+    self._surfaces = tuple(to_display_format(surface) for surface in self._surfaces)
+
+__art_load = Art.load
+def __new_load(self, **ld_kwargs):
+    # Loading an art that is already loaded only loads its copies, its surfaces are kept as they are.
+    was_loaded = self._loaded
+    __art_load(self, **ld_kwargs)
+    if not was_loaded and self._loaded:
+        __transformed_arts.discard(self)
+        __convert_surfaces(self)
+        __loaded_arts.add(self)
+        __changed_arts.add(self)
+Art.load = __new_load
+
+__art_transform = Art._transform
+def __new_transform(self, transformation, **ld_kwargs):
+    # The transformation may run in the thread of the art, the surfaces are converted later by the main thread.
+    __art_transform(self, transformation, **ld_kwargs)
+    __transformed_arts.add(self)
+    __changed_arts.add(self)
+    __changed_arts.update(self._references)
+Art._transform = __new_transform
+
+__art_unload = Art.unload
+def __new_unload(self):
+    __art_unload(self)
+    __loaded_arts.discard(self)
+    __transformed_arts.discard(self)
+Art.unload = __new_unload
+
+def convert_arts():
+    """
+    Convert the surfaces of every loaded art into the display format.
+    This function is called by the screen when the display is recreated, as its pixel format might change.
+    """
+    if not is_display_format_available():
+        return
+    for art in list(__loaded_arts):
+        if art._loaded and (art._transfo_thread is None or not art._transfo_thread.is_alive()):
+            __convert_surfaces(art)
 
 # Add load on start and permanent, with start and end.
 def __set_load_on_start(self):
@@ -114,5 +209,5 @@ class GIFFile(_GIFFile):
 __all__ = [
     'GIFFile', 'ImageFile', 'ImageFolder', 'Rectangle', 'RoundedRectangle', 'Art',
     'Circle', 'Ellipse', 'Polygon', 'TexturedCircle', 'TexturedEllipse', 'TexturedPolygon',
-    'TexturedRoundedRectangle'
+    'TexturedRoundedRectangle', 'set_copy_on_write', 'convert_arts'
 ]
\ No newline at end of file
@@ -1,16 +1,11 @@
 """The window module contains the window class."""
 import pygame
 import numpy as np
-from pygamecv.effect import saturate, desaturate, darken, lighten, shift_hue
+import cv2 as cv
 from .anchors import TOP_LEFT, Anchor, AnchorLike
 from .art import mask as mask_
 from ..settings import Settings
-
-def _set_alpha(surface: pygame.Surface, matrix: np.ndarray):
-    surface = surface.convert_alpha()
-    alpha = pygame.surfarray.pixels_alpha()
-    alpha[:] = (255 - matrix*255).astype(np.int8)
-    return surface
+from .surface_pool import replace_area
 
 class Camera(pygame.Rect):
     """
@@ -59,19 +54,111 @@ class Camera(pygame.Rect):
         self.saturate_mask = saturate_mask
         self.shift_hue_mask = shift_hue_mask
 
+        # The effects compositor's cache: the mask matrices, the area of the color effects and the output surface.
+        self._effect_key = None
+        self._effect_matrices: tuple[np.ndarray | None, ...] = () # The matrices of the masks the factors were computed from.
+        self._effect_factors: list[np.ndarray | None] = []
+        self._effect_area: tuple[slice, slice] | None = None
+        self._effect_not_null: np.ndarray | None = None
+        self._effect_output: pygame.Surface | None = None
+
     def get_surface(self, surface: pygame.Surface, settings: Settings):
         """Return the surface extracted by the camera."""
-        surface = surface.subsurface(self)
-        for mask, func in zip([
-            self.darken_mask, self.lighten_mask, self.desaturate_mask, self.saturate_mask, self.shift_hue_mask
-        ], [
-            darken, lighten, desaturate, saturate, shift_hue
-        ]):
-            if mask is not None:
-                mask.load(*surface.get_size(), **settings)
-                func(surface, mask.matrix)
-        if self.hide_mask is not None:
-            self.hide_mask.load(*surface.get_size(), **settings)
-            return _set_alpha(surface, self.hide_mask.matrix)
-        else:
+        return self.apply_effects(surface.subsurface(self), settings)
+
+    def _masks(self) -> tuple[mask_.Mask | None, ...]:
+        """Return the masks of the camera, in the order of the effect factors."""
+        return (self.darken_mask, self.lighten_mask, self.desaturate_mask, self.saturate_mask, self.shift_hue_mask, self.hide_mask)
+
+    def invalidate_effects(self):
+        """
+        Forget the cached matrices of the masks, they are reloaded at the next render.
+        The masks whose matrix is replaced, by being reloaded or updated, are detected.
+        Call this method when the matrix of a mask is modified in place, then notify the change of the frame.
+        """
+        self._effect_key = None
+
+    def _load_effects(self, size: tuple[int, int], settings: Settings):
+        """Load the matrices of the masks for the given size and cache them, with the area where the colors are modified."""
+        factors = []
+        for mask in self._masks():
+            if mask is None:
+                factors.append(None)
+                continue
+            if mask.is_loaded() and mask.matrix.shape != size:
+                mask.unload()
+            mask.load(*size, **settings)
+            # The matrices are transposed to be indexed by [row, column], as the pixel buffer.
+            factors.append(np.ascontiguousarray(np.clip(mask.matrix, 0, 1).T, dtype=np.float32))
+        self._effect_factors = factors
+        self._effect_matrices = tuple(None if mask is None else mask.matrix for mask in self._masks())
+
+        # The colors are only modified in the smallest rect containing the non-zero values of the color masks.
+        color_factors = [factor for factor in factors[:5] if factor is not None]
+        self._effect_area = None
+        if color_factors:
+            not_null = np.logical_or.reduce([factor != 0 for factor in color_factors])
+            rows, columns = np.nonzero(not_null.any(axis=1))[0], np.nonzero(not_null.any(axis=0))[0]
+            if rows.size:
+                self._effect_area = (slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1))
+                # The pixels of the area whose color is modified, the others are kept as they are.
+                self._effect_not_null = not_null[self._effect_area][:, :, None]
+
+    def apply_effects(self, surface: pygame.Surface, settings: Settings):
+        """
+        Return the surface with the effects of the camera applied on it. The surface given as argument is not modified.
+        All the effects are applied in a single pass, on an output surface reused from a call to another.
+        """
+        masks = self._masks()
+        if all(mask is None for mask in masks):
             return surface
+
+        # The matrices of the masks are cached as long as the size, the loading settings, the masks and their matrices are the same.
+        key = (surface.get_size(), tuple(settings[ld_key] for ld_key in settings.keys()), masks)
+        if key != self._effect_key or any(
+            mask is not None and mask.matrix is not matrix for mask, matrix in zip(masks, self._effect_matrices)
+        ):
+            self._load_effects(surface.get_size(), settings)
+            self._effect_key = key
+        darken, lighten, desaturate, saturate, shift_hue, hide = self._effect_factors
+
+        flags = pygame.SRCALPHA if hide is not None else surface.get_flags() & pygame.SRCALPHA
+        output = self._effect_output
+        if output is None or output.get_size() != surface.get_size() or output.get_flags() & pygame.SRCALPHA != flags:
+            output = self._effect_output = pygame.Surface(surface.get_size(), flags, 32)
+        replace_area(output, surface, (0, 0))
+
+        # The pixels are seen as an array of [row, column, byte], the bytes being in the B, G, R, A order for 32 bits surfaces.
+        pixels = pygame.surfarray.pixels2d(output).T
+        pixels = pixels.view(np.uint8).reshape(*pixels.shape, 4)
+        if self._effect_area is not None:
+            area = self._effect_area
+            bgra = pixels[area]
+            hls = cv.cvtColor(cv.cvtColor(bgra, cv.COLOR_BGRA2BGR), cv.COLOR_BGR2HLS)
+            # As with pygamecv, the hue is in [0, 180[, the lightness and the saturation in [0, 255].
+            if darken is not None or lighten is not None:
+                lightness = hls[:, :, 1].astype(np.float32)
+                if darken is not None:
+                    lightness *= 1 - darken[area]
+                if lighten is not None:
+                    lightness[...] = 255 - (255 - lightness)*(1 - lighten[area])
+                hls[:, :, 1] = lightness + 0.5
+            if desaturate is not None or saturate is not None:
+                saturation = hls[:, :, 2].astype(np.float32)
+                if desaturate is not None:
+                    saturation *= 1 - desaturate[area]
+                if saturate is not None:
+                    saturation[...] = 255 - (255 - saturation)*(1 - saturate[area])
+                hls[:, :, 2] = saturation + 0.5
+            if shift_hue is not None:
+                hls[:, :, 0] = np.mod(hls[:, :, 0] + shift_hue[area], 180)
+            modified = cv.cvtColor(cv.cvtColor(hls, cv.COLOR_HLS2BGR), cv.COLOR_BGR2BGRA)
+            modified[:, :, 3] = bgra[:, :, 3]
+            # The conversion to HLS is lossy, the pixels without any effect are not written back.
+            np.copyto(bgra, modified, where=self._effect_not_null)
+
+        if hide is not None:
+            alpha = pixels[:, :, 3]
+            alpha[...] = alpha*(1 - hide) + 0.5
+        del pixels # unlock the surface.
+        return output
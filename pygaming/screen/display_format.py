@@ -0,0 +1,78 @@
+"""The display_format module contains the functions used to convert the surfaces into the pixel format of the display, so that blitting them does not need any conversion."""
+import pygame
+from pygame.surfarray import pixels_alpha
+
+_RLE_MIN_RUN_FRACTION = 0.75 # The fraction of fully transparent or fully opaque pixels above which an alpha surface is RLE-accelerated.
+
+__rle_accel = False
+__references: dict[bool, pygame.Surface] = {}
+__display = None
+
+def set_rle_accel(enabled: bool = True):
+    """
+    Enable or disable the RLE acceleration of the converted surfaces.
+    In RLE mode, the surfaces with a colorkey and the mostly opaque surfaces are run-length encoded,
+    which makes blitting them faster, but drawing on them slower. It should be used for sprites that are blitted as they are.
+    """
+    global __rle_accel
+    __rle_accel = enabled
+
+def is_display_format_available() -> bool:
+    """Return whether a display exists, in which case the surfaces can be converted."""
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+def _reference(alpha: bool) -> pygame.Surface:
+    """Return a surface in the display format, with or without per-pixel alpha, used to compare the formats."""
+    global __display
+    display = pygame.display.get_surface()
+    if display is not __display:
+        # The display changed, the references are not in the right format anymore.
+        __display = display
+        __references.clear()
+    if alpha not in __references:
+        __references[alpha] = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha() if alpha else pygame.Surface((1, 1)).convert()
+    return __references[alpha]
+
+def _is_mostly_opaque(surface: pygame.Surface) -> bool:
+    """Return whether most of the pixels of an alpha surface are fully transparent or fully opaque."""
+    if not surface.get_width() or not surface.get_height():
+        return False
+    alpha = pixels_alpha(surface)
+    runs = (alpha == 0).sum() + (alpha == 255).sum()
+    del alpha # unlock the surface.
+    return runs >= _RLE_MIN_RUN_FRACTION*surface.get_width()*surface.get_height()
+
+def is_surface_opaque(surface: pygame.Surface) -> bool:
+    """Return whether all the pixels of the surface are fully opaque, taking the colorkey and the surface alpha into account."""
+    if surface.get_colorkey() is not None or surface.get_alpha() not in (None, 255):
+        return False
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return True
+    if surface.get_bytesize() != 4 or not surface.get_width() or not surface.get_height():
+        return False
+    alpha = pixels_alpha(surface)
+    opaque = bool(alpha.min() == 255)
+    del alpha # unlock the surface.
+    return opaque
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Return the surface converted into the pixel format of the display.
+    If the surface is already in this format, or if there is no display yet, the surface itself is returned.
+
+    Params:
+    ---
+    - surface: pygame.Surface, the surface to convert.
+    """
+    if not is_display_format_available():
+        return surface
+    alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    reference = _reference(alpha)
+    if surface.get_bitsize() != reference.get_bitsize() or surface.get_masks() != reference.get_masks():
+        surface = surface.convert_alpha() if alpha else surface.convert()
+    if __rle_accel and not surface.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK):
+        if surface.get_colorkey() is not None:
+            surface.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+        elif alpha and _is_mostly_opaque(surface):
+            surface.set_alpha(surface.get_alpha(), pygame.RLEACCEL)
+    return surface
@@ -1,15 +1,25 @@
 """The frame module contain the Frame class."""
 from typing import Optional, Self
+import math
 import numpy as np
 import pygame
-from functools import lru_cache
-from ._abstract import Master, Focusable, Child, Collideable
+from ZOCallable import ZOCallable
+from ZOCallable.functions import linear
+from pygame.surfarray import pixels2d
+from ._abstract import Master, Focusable, Child, Collideable, Visual, GraphicalChild
 from .art.art import Art
 from .camera import Camera
 from .anchors import CENTER_CENTER, TOP_LEFT, Anchor, AnchorLike
 from ..inputs import Click
 from .hover import Cursor, Tooltip, Hoverable
 from .states import WidgetStates
+from .surface_pool import surface_pool, replace_area
+
+def _needs_loop(child: Child) -> bool:
+    """Return whether the child does something at every loop iteration, apart from the animation of its arts made by the clock of the phase."""
+    cls = type(child)
+    return cls.update is not Visual.update or cls.loop not in (Child.loop, GraphicalChild.loop)
+
 class Frame(Focusable, Collideable, Master):
     """
     The Frame represent a fraction of the screen.
@@ -24,7 +34,8 @@ class Frame(Focusable, Collideable, Master):
         focused_background: Optional[Art] = None,
         camera: Optional[Camera] = None,
         continue_animation: bool = False,
-        update_if_invisible: bool = False
+        update_if_invisible: bool = False,
+        quantize_zoom: bool = False
     ) -> None:
         """
         Create the frame.
@@ -40,9 +51,12 @@ class Frame(Focusable, Collideable, Master):
         If None, the top left is 0,0 and the dimensions are the window dimensions.
         - layer: the layer of the frame on its master. Objects having the same master are blitted on it by increasing layer.
         - continue_animation: bool. If set to False, switching from focused to unfocused will reset the animations.
+        - quantize_zoom: bool. If set to True, the zoom of the camera is rounded to a power of 2. When the camera is zoomed out,
+        the frame is then composed from precomputed downscaled versions (mip levels) of the background instead of being rescaled.
         """
         self.window = pygame.Rect(0, 0, *(background.size if size is None else size))
         self.children: set[Child]
+        self._looping_children: set[Child] = set() # The children that need to be looped over at every iteration.
         self.frame_children: set[Frame]
         self.has_a_widget_focused = False
 
@@ -60,9 +74,22 @@ class Frame(Focusable, Collideable, Master):
             continue_animation=continue_animation
         )
         self.master.add_child(self, False, False, False, False, True, False)
-        self._compute_wc_ratio()
 
         self.views = set()
+        self._hovered_children: set[Hoverable] = set()
+
+        # The composition of the background and the children under the camera, only the damaged areas are recomposed.
+        self._composite: pygame.Surface | None = None
+        self._composite_area = pygame.Rect(0, 0, 0, 0) # The area of the frame covered by the composite.
+        self._composite_level = 0 # The composite is downscaled by 2**level.
+        self._scaled: pygame.Surface | None = None # The composite scaled to the window, when the camera is zoomed.
+        self._surface_version = 0 # Incremented every time the surface is remade.
+
+        self._quantize_zoom = quantize_zoom
+        self._mip_background: pygame.Surface | None = None
+        self._mip_levels: dict[int, pygame.Surface] = {} # The downscaled versions of the background, by level.
+        self._damaged_areas: list[pygame.Rect] | None = None # None means that the whole frame is damaged.
+        self._visibility: bool | None = None # None once the frame or one of its masters is shown, hidden or moved.
 
     @property
     def width(self):
@@ -72,24 +99,53 @@ class Frame(Focusable, Collideable, Master):
     def height(self):
         return self.window.height
 
-    def _compute_wc_ratio(self, master: Master = None):
-        """Recompute the ratio between the window and the camera dimensions."""
-        if master is None:
-            master = self.master
-        self.wc_ratio = self.window.width/self.camera.width*master.wc_ratio[0], self.window.height/self.camera.height*master.wc_ratio[1]
+    def is_opaque(self):
+        """The frame is opaque if its background is and the camera does not hide any part of it."""
+        return self.camera.hide_mask is None and self._arts.is_opaque(self.state)
+
+    def _compute_transform(self):
+        """The frame's coordinates are the coordinates on its background, the camera is displayed on the window."""
+        master_left, master_top, master_ratio = self.master.get_transform()
+        wc_ratio = self.window.width/self.camera.width*master_ratio[0], self.window.height/self.camera.height*master_ratio[1]
+        left = int(master_left + self.window.left*master_ratio[0] - self.camera.left*wc_ratio[0])
+        top = int(master_top + self.window.top*master_ratio[1] - self.camera.top*wc_ratio[1])
+        return left, top, wc_ratio
+
+    @property
+    def wc_ratio(self):
+        """The ratio between the window and the camera dimensions, multiplied by the ratio of the master."""
+        return self.get_transform()[2]
 
     def get_hover(self, pos) -> tuple[Tooltip | None, Cursor | None]:
-        """Update the hovering."""
+        """Update the hovering. Only the children under the position are tested, the others are unhovered."""
+        tooltip, cursor = None, None
+        hovered_children = set()
         if self.is_contact(pos):
-            tooltip, cursor = None, None
-            for child in self.hoverable_children:
-                child_tooltip, child_cursor = child.get_hover(pos)
-                if child_tooltip is not None:
-                    tooltip = child_tooltip
-                if child_cursor is not None:
-                    cursor = child_cursor
-            return tooltip, cursor
-        return None, None
+            for child in self.get_children_at(pos):
+                if child in self.hoverable_children and child.is_contact(pos):
+                    child.set_hover()
+                    hovered_children.add(child)
+                    if child.tooltip is not None:
+                        tooltip = child.tooltip
+                    if child.cursor is not None:
+                        cursor = child.cursor
+        for child in self._hovered_children - hovered_children:
+            child.unset_hover()
+        self._hovered_children = hovered_children
+        return tooltip, cursor
+
+    def _invalidate_hover(self):
+        self.master._invalidate_hover()
+
+    def _get_hover_position(self):
+        return self.master._get_hover_position()
+
+    def is_contact(self, pos: Optional[Click | tuple[int, int]]):
+        """Return whether the position, on the game window, is on the window of the frame."""
+        if pos is None or not self.on_master:
+            return False
+        ck = Click(*pos).make_local_click(self.master.absolute_left, self.master.absolute_top, self.master.wc_ratio)
+        return self.window.collidepoint(ck.x, ck.y)
 
     def update_focus(self, click: Click | None):
         """Update the focus of all the children in the frame."""
@@ -97,9 +153,11 @@ class Frame(Focusable, Collideable, Master):
             self.notify_change()
             self.focus()
         one_is_clicked = False
+        # Only the children under the click can be in contact with it.
+        candidates = set(self.get_children_at(click)) if click is not None else set()
 
         for (i,child) in enumerate(self.collideable_children.intersection(self.focusable_children)):
-            if child.is_contact(click) and child.state != WidgetStates.DISABLED:
+            if child in candidates and child.is_contact(click) and child.state != WidgetStates.DISABLED:
                 child.focus()
                 self._current_object_focus = i
                 one_is_clicked = True
@@ -109,7 +167,7 @@ class Frame(Focusable, Collideable, Master):
                     child.unfocus()
 
         for child in self.frame_children:
-            if child.is_contact(click):
+            if child in candidates and child.is_contact(click):
                 child.update_focus(click)
         if not one_is_clicked:
             self._current_object_focus = None
@@ -125,13 +183,60 @@ class Frame(Focusable, Collideable, Master):
         for frame in self.frame_children:
             frame.notify_change_all()
 
-    def notify_change(self):
-        """Notify a change in the visual."""
+    def notify_change(self, rect: pygame.Rect | None = None):
+        """
+        Notify a change in the visual.
+
+        Params:
+        ---
+        - rect: Rect | None, the damaged area, in the coordinates of the frame. If None, the whole frame is damaged.
+        """
+        if self._surface_changed and (
+            self._damaged_areas is None or (rect is not None and any(area.contains(rect) for area in self._damaged_areas))
+        ):
+            # The area is already damaged: the master and the views have been notified and have not been redrawn since.
+            return
         self._surface_changed = True
+        if rect is None:
+            self._damaged_areas = None
+        elif self._damaged_areas is not None:
+            self._damaged_areas.append(rect)
         for view in self.views:
             view.notify_change()
         if self.is_visible():
-            self.master.notify_change()
+            damaged_rect = self._damaged_rect_on_master(rect)
+            if damaged_rect:
+                self.master.notify_change(damaged_rect)
+
+    def is_visible(self):
+        """Return wether the frame is visible or not. The result is cached until the frame or one of its masters is shown, hidden or moved."""
+        if self._visibility is None:
+            self._visibility = super().is_visible()
+        return self._visibility
+
+    def _invalidate_visibility(self):
+        # The visibility of the descendants might depend on this one only if it is cached.
+        if self._visibility is not None:
+            self._visibility = None
+            super()._invalidate_visibility()
+
+    def _damaged_rect_on_master(self, rect: pygame.Rect | None) -> pygame.Rect:
+        """Convert a damaged area of the frame into the damaged area of the master, taking the camera into account."""
+        if rect is None:
+            return self.window.copy()
+        # When composed from a mip level, the area is aligned on the pixels of the mip level.
+        factor = 1 << self._composite_level
+        area = pygame.Rect(self.camera.left - self.camera.left % factor, self.camera.top - self.camera.top % factor, *self.camera.size)
+        rect = area.clip(rect)
+        if not rect:
+            return rect
+        ratio_x = self.window.width/self.camera.width
+        ratio_y = self.window.height/self.camera.height
+        left = self.window.left + math.floor((rect.left - area.left)*ratio_x)
+        top = self.window.top + math.floor((rect.top - area.top)*ratio_y)
+        right = self.window.left + math.ceil((rect.right - area.left)*ratio_x)
+        bottom = self.window.top + math.ceil((rect.bottom - area.top)*ratio_y)
+        return self.window.clip(pygame.Rect(left, top, right - left, bottom - top))
 
     def unfocus(self):
         """Unfocus the Frame by unfocusing itself and its children"""
@@ -175,67 +280,253 @@ class Frame(Focusable, Collideable, Master):
             self._arts.new_state()
             self.notify_change()
 
+    def add_child(self, child, focusable: bool, disableable: bool, collideable: bool, hoverable: bool, frame: bool, placeable: bool):
+        """Add a new element to the child set."""
+        super().add_child(child, focusable, disableable, collideable, hoverable, frame, placeable)
+        if _needs_loop(child):
+            self._looping_children.add(child)
+
     def loop(self, dt: int):
         """Update the frame every loop iteration."""
-        # Update the frame's background
-        has_changed = self._arts.update(dt, self.state)
-        if has_changed:
-            self.notify_change()
+        # Update the frame's background, if it is not updated by the clock of the phase.
+        if self._animation_clock is None:
+            self._animate(dt)
         # Update the frame
         self.update(dt)
 
-        # Update the children
-        for element in self.children:
+        # Update the children. The static ones and the ones only animating their arts are updated by the clock of the phase.
+        for element in self._looping_children:
             element.loop(dt)
 
-    @lru_cache()
-    def visible_children(self):
-        return sorted(filter(lambda ch: (ch.is_visible() and ch._x is not None), self.placeable_children), key=lambda ch: ch.layer)
+    def _get_mip_level(self, background: pygame.Surface) -> int:
+        """Return the level of the mip used to compose the frame: the camera is 2**level times larger than the window."""
+        if not self._quantize_zoom or background.get_bytesize() != 4:
+            return 0
+        factor, remainder = divmod(self.camera.width, self.window.width)
+        if remainder or factor < 2 or factor & (factor - 1) or self.camera.height != factor*self.window.height:
+            return 0
+        return factor.bit_length() - 1
+
+    def _get_mip(self, background: pygame.Surface, level: int) -> pygame.Surface:
+        """Return the background downscaled by 2**level. The mip levels are kept until the background changes."""
+        if background is not self._mip_background:
+            self._mip_background = background
+            self._mip_levels.clear()
+        if level not in self._mip_levels:
+            factor = 1 << level
+            size = (-(-background.get_width()//factor), -(-background.get_height()//factor))
+            mip = pygame.Surface(size, background.get_flags() & pygame.SRCALPHA, background)
+            pixels = pixels2d(mip)
+            pixels[...] = pixels2d(background)[::factor, ::factor]
+            del pixels # unlock the surfaces.
+            self._mip_levels[level] = mip
+        return self._mip_levels[level]
+
+    def _make_composite(self, background: pygame.Surface, damaged_areas: list[pygame.Rect] | None) -> list[pygame.Rect] | None:
+        """
+        Recompose the damaged areas of the composite, or the whole composite if the damaged areas are None.
+        Only the area of the frame under the camera is composed. If the camera moved, the composite is scrolled
+        and only the uncovered areas are recomposed.
+        If the camera is zoomed out on a frame with quantized zoom, the composite is downscaled and composed from a mip level of the background.
+
+        Returns:
+        ---
+        - rects: list[Rect] | None, the areas of the composite that have been recomposed. If None, the whole composite has changed.
+        """
+        level = self._get_mip_level(background)
+        factor = 1 << level
+        area = self.camera.copy()
+        # The area is aligned on the pixels of the mip level.
+        area.topleft = (area.left - area.left % factor, area.top - area.top % factor)
+        source = background if level == 0 else self._get_mip(background, level)
+        size = (area.width >> level, area.height >> level)
+
+        previous_area = self._composite_area
+        if self._composite is None or self._composite.get_size() != size or self._composite_level != level:
+            self._composite = pygame.Surface(size, background.get_flags() & pygame.SRCALPHA, background)
+            damaged_areas = None
+        elif damaged_areas is not None and area != previous_area:
+            if not area.colliderect(previous_area):
+                damaged_areas = None
+            else:
+                self._composite.scroll((previous_area.left - area.left) >> level, (previous_area.top - area.top) >> level)
+                overlap = area.clip(previous_area)
+                # The uncovered areas are the horizontal and vertical bands of the new area outside of the previous one.
+                damaged_areas = damaged_areas + [
+                    pygame.Rect(area.left, area.top, area.width, overlap.top - area.top),
+                    pygame.Rect(area.left, overlap.bottom, area.width, area.bottom - overlap.bottom),
+                    pygame.Rect(area.left, overlap.top, overlap.left - area.left, overlap.height),
+                    pygame.Rect(overlap.right, overlap.top, area.right - overlap.right, overlap.height),
+                ]
+        scrolled = area != previous_area
+        self._composite_area = area
+        self._composite_level = level
+
+        if damaged_areas is None:
+            for child in self.children:
+                child._drawn_rect = None
+            if level == 0:
+                # The background is not drawn if an opaque child hides it.
+                if not self.is_covered(self.visible_children(), area):
+                    replace_area(self._composite, source, (0, 0), pygame.Rect(area.left, area.top, *size))
+                self.blit_children(self._composite, self.visible_children(), (-area.left, -area.top), area)
+                return None
+            replace_area(self._composite, source, (0, 0), pygame.Rect(area.left >> level, area.top >> level, *size))
+            # Only the areas covered by the children need to be downscaled.
+            self._recompose(background, source, [child.relative_rect for child in self.visible_children()], level)
+            return None
+
+        rects = self._recompose(background, source, damaged_areas, level)
+        return None if scrolled else rects
+
+    def _recompose(self, background: pygame.Surface, source: pygame.Surface, damaged_areas: list[pygame.Rect], level: int) -> list[pygame.Rect]:
+        """Recompose the damaged areas of the composite and return the recomposed areas, in the coordinates of the composite."""
+        area = self._composite_area
+        factor = 1 << level
+        rects = []
+        # The areas are clipped before removing the duplicates, as large areas often cover the whole composite.
+        for damaged_area in set(tuple(area.clip(damaged_area)) for damaged_area in damaged_areas):
+            damaged_area = pygame.Rect(damaged_area)
+            if not damaged_area:
+                continue
+            if level:
+                # Align the damaged area on the pixels of the mip level.
+                left, top = damaged_area.left - damaged_area.left % factor, damaged_area.top - damaged_area.top % factor
+                right, bottom = -(-damaged_area.right//factor)*factor, -(-damaged_area.bottom//factor)*factor
+                damaged_area = area.clip(pygame.Rect(left, top, right - left, bottom - top))
+            rect_on_composite = pygame.Rect(
+                (damaged_area.left - area.left) >> level, (damaged_area.top - area.top) >> level,
+                damaged_area.width >> level, damaged_area.height >> level
+            )
+            rects.append(rect_on_composite)
+            if level == 0:
+                if not self.is_covered(self.visible_children(), damaged_area):
+                    replace_area(self._composite, background, rect_on_composite.topleft, damaged_area)
+                self.blit_children(self._composite, self.visible_children(), (-area.left, -area.top), damaged_area)
+                continue
+
+            children = [child for child in self.visible_children() if child.relative_rect.colliderect(damaged_area)]
+            if not children:
+                replace_area(self._composite, source, rect_on_composite.topleft, rect_on_composite.move(area.left >> level, area.top >> level))
+            else:
+                # The children are composed at full resolution on a temporary surface, which is then downscaled.
+                temp = surface_pool.get(damaged_area.size, self._composite)
+                replace_area(temp, background, (0, 0), damaged_area)
+                self.blit_children(temp, children, (-damaged_area.left, -damaged_area.top))
+                pixels = pixels2d(self._composite)
+                pixels[rect_on_composite.left:rect_on_composite.right, rect_on_composite.top:rect_on_composite.bottom] = pixels2d(temp)[::factor, ::factor]
+                del pixels # unlock the surfaces.
+                surface_pool.release(temp)
+        return rects
+
+    def _make_scaled(self, surface: pygame.Surface, rects: list[pygame.Rect] | None) -> pygame.Surface:
+        """
+        Scale the surface to the window.
+        If only some areas of the surface changed since the last call, only the matching areas of the scaled surface are recomputed.
+        """
+        width, height = self.window.size
+        if (
+            rects is None or surface is not self._composite or self._scaled is None
+            or self._scaled.get_size() != self.window.size or surface.get_bytesize() != 4
+        ):
+            if self._scaled is None or self._scaled.get_size() != self.window.size:
+                self._scaled = pygame.Surface(self.window.size, surface.get_flags() & pygame.SRCALPHA, surface)
+            return pygame.transform.scale(surface, self.window.size, self._scaled)
+
+        src_width, src_height = surface.get_size()
+        # The pixel x of the scaled surface is the pixel x*src_width//width of the surface, as in pygame.transform.scale.
+        x_map = np.arange(width)*src_width//width
+        y_map = np.arange(height)*src_height//height
+        pixels = pixels2d(self._scaled)
+        src_pixels = pixels2d(surface)
+        for rect in rects:
+            left, right = -(-rect.left*width//src_width), -(-rect.right*width//src_width)
+            top, bottom = -(-rect.top*height//src_height), -(-rect.bottom*height//src_height)
+            if left < right and top < bottom:
+                pixels[left:right, top:bottom] = src_pixels[np.ix_(x_map[left:right], y_map[top:bottom])]
+        del pixels, src_pixels # unlock the surfaces.
+        return self._scaled
 
     def make_surface(self) -> pygame.Surface:
         """Return the surface of the frame as a pygame.Surface"""
-        background = self._arts.get(self.state, **self.game.settings).copy()
-        for child in self.visible_children():
-            background.blit(child.get_surface(), child.relative_rect.topleft)
-
-        surf = self.camera.get_surface(background, self.game.settings)
-        if self.window.size != self.camera.size:
-            surf = pygame.transform.scale(surf, self.window.size)
+        background = self._arts.get(self.state, copy=False, **self.game.settings)
+        damaged_areas, self._damaged_areas = self._damaged_areas, []
+        rects = self._make_composite(background, damaged_areas)
+        self._surface_version += 1
+
+        surf = self.camera.apply_effects(self._composite, self.game.settings)
+        if surf.get_size() != self.window.size:
+            scaled = self._make_scaled(surf, rects)
+            surface_pool.release(surf)
+            surf = scaled
         return surf
 
+    def _notify_camera_change(self):
+        """Notify that the camera moved: the content of the frame did not change but the whole window is damaged."""
+        self._invalidate_transforms()
+        # The children move relatively to the mouse.
+        self._invalidate_hover()
+        for child in self.placeable_children:
+            if child._x is not None:
+                child.on_master = child.get_on_master()
+                self._update_child_index(child)
+        self._surface_changed = True
+        for view in self.views:
+            view.notify_change()
+        if self.is_visible():
+            self.master.notify_change(self.window.copy())
+
     def move_camera(self, dx, dy):
         """Move the camera on the frame."""
-        dx = np.clip(int(dx), - self.camera.left, self.width - self.camera.right)
-        dy = np.clip(int(dy), - self.camera.top, self.height - self.camera.bottom)
+        # The camera is bound to the background, which can be larger than the window.
+        dx = np.clip(int(dx), - self.camera.left, self._arts.width - self.camera.right)
+        dy = np.clip(int(dy), - self.camera.top, self._arts.height - self.camera.bottom)
 
         if dx != 0 or dy != 0:
             self.camera.move_ip(dx, dy)
-            self._compute_wc_ratio()
-            for child in self.visible_children():
-                if child._x is not None:
-                    child.on_master = child.get_on_master()
-            self.notify_change()
+            self._notify_camera_change()
 
-    def set_camera_position(self, new_x, new_y, anchor: AnchorLike = TOP_LEFT):
-        """Reset the camera position on the frame with a new value."""
+    def set_camera_position(
+        self,
+        new_x,
+        new_y,
+        anchor: AnchorLike = TOP_LEFT,
+        duration: int = 0,
+        transition_function: ZOCallable = linear
+    ):
+        """
+        Reset the camera position on the frame with a new value.
+        If a duration [ms] is given, the camera pans to its new position following the transition function.
+        """
         anchor = Anchor(anchor)
-        new_y = np.clip(int(new_y - anchor[1]*self.camera.height), 0, self.height - self.camera.height)
-        new_x = np.clip(int(new_x - anchor[0]*self.camera.width), 0, self.width - self.camera.width)
+        new_x, new_y = new_x - anchor[0]*self.camera.width, new_y - anchor[1]*self.camera.height
+        self._tween('camera_position', self.camera.topleft, (new_x, new_y), duration, self._move_camera_to, transition_function)
 
-        if (new_x, new_y) != self.window.topleft:
-            self.camera.move_ip(self.camera.left - new_x, self.camera.top - new_y)
-            self._compute_wc_ratio()
-            for child in self.visible_children():
-                child.on_master = child.get_on_master()
-            self.notify_change()
+    def _move_camera_to(self, topleft: tuple[float, float]):
+        """Move the top left of the camera, bound to the background."""
+        new_x = np.clip(int(topleft[0]), 0, self._arts.width - self.camera.width)
+        new_y = np.clip(int(topleft[1]), 0, self._arts.height - self.camera.height)
 
-    def zoom_camera(self, ratio_x: float, target: AnchorLike = CENTER_CENTER, ratio_y = None):
+        if (new_x, new_y) != self.camera.topleft:
+            self.camera.topleft = (new_x, new_y)
+            self._notify_camera_change()
+
+    def zoom_camera(
+        self,
+        ratio_x: float,
+        target: AnchorLike = CENTER_CENTER,
+        ratio_y = None,
+        duration: int = 0,
+        transition_function: ZOCallable = linear
+    ):
 
         """
         Zoom by a given factor on the target point.
 
         if ratio is > 1, the camera will zoom by a factor ratio (the details will appear bigger).
         if ratio is < 1, the camera will unzoom by a factor ratio (the details will appear smaller).
+        If the frame has a quantized zoom, the resulting zoom is rounded to a power of 2.
+        If a duration [ms] is given, the camera zooms progressively following the transition function.
         """
 
         target = Anchor(target)
@@ -243,26 +534,33 @@ class Frame(Focusable, Collideable, Master):
         if ratio_y is None:
             ratio_y = ratio_x
 
-        new_width = np.minimum(self.camera.width/ratio_x, self.width)
-        new_height = np.minimum(self.camera.height/ratio_y, self.height)
+        new_width = self.camera.width/ratio_x
+        new_height = self.camera.height/ratio_y
+        if self._quantize_zoom:
+            new_width = self.window.width*2**round(math.log2(new_width/self.window.width))
+            new_height = self.window.height*2**round(math.log2(new_height/self.window.height))
+        new_width = int(min(max(new_width, 1), self._arts.width))
+        new_height = int(min(max(new_height, 1), self._arts.height))
+
+        # The target point stays at the same place on the window.
+        zoom_point = self.camera.left + self.camera.width*target[0], self.camera.top + self.camera.height*target[1]
+        self._tween('camera_size', self.camera.size, (new_width, new_height), duration,
+            lambda size: self._resize_camera(size, zoom_point, target), transition_function)
+
+    def _resize_camera(self, size: tuple[float, float], zoom_point: tuple[float, float], target: Anchor):
+        """Resize the camera, keeping the zoom point at the relative position target on the camera."""
+        new_width, new_height = int(size[0]), int(size[1])
+        if (new_width, new_height) != self.camera.size:
+            left = np.clip(int(zoom_point[0] - new_width*target[0]), 0, self._arts.width - new_width)
+            top = np.clip(int(zoom_point[1] - new_height*target[1]), 0, self._arts.height - new_height)
+
+            self.camera.update(left, top, new_width, new_height)
+            self._notify_camera_change()
 
-        if ratio_x != 1 or ratio_y != 1:
-            zoom_point = self.camera.width*target[0], self.camera.height*target[1]
-            left = zoom_point[0] - new_width
-            top = zoom_point[1] - new_height
-            left = np.clip(left, 0, self.width - new_width)
-            top = np.clip(top, 0, self.height - new_height)
-
-            self.camera.inflate_ip(ratio_x, ratio_y)
-            self.camera.topleft = (top, left)
-            self._compute_wc_ratio()
-            for child in self.visible_children():
-                child.on_master = child.get_on_master()
-            self.notify_change()
-        
     def unset_hover(self):
         for child in self.hoverable_children:
             child.unset_hover()
+        self._hovered_children.clear()
     
     def is_child_on_me(self, child):
         """Return whether the child is visible on the frame or not."""
@@ -270,41 +568,16 @@ class Frame(Focusable, Collideable, Master):
             and child._x is not None
             and (
                 self.camera.colliderect(child.relative_rect) or any(
-                    view.camera.collierect(child.relative_rect) for view in self.views
+                    view.camera.colliderect(child.relative_rect) for view in self.views
                 )
             )
         )
 
 
-    def place(self, x: int, y: int, anchor: AnchorLike = TOP_LEFT, layer=0) -> Self:
-        super().place(x, y, anchor, layer)
-        self.window.topleft = x - anchor[0]*self.window.width, y - anchor[1]*self.window.height
-        return self
-
-    def grid(self,
-        row: int,
-        column: int,
-        grid = None,
-        rowspan: int = 1,
-        columnspan: int = 1,
-        padx: int = 0,
-        pady: int = 0,
-        anchor: AnchorLike = TOP_LEFT,
-        justify: AnchorLike = CENTER_CENTER,
-        layer: int = 0
-    ) -> Self:
-
-        super().grid(row, column, grid, rowspan, columnspan, padx, pady, anchor, justify, layer) 
-        self.window.topleft = self._x - anchor[0]*self.window.width, self._y - anchor[1]*self.window.height
-
-        return self
-
-    def move(self, dx: int = 0, dy: int = 0):
-        if self._x is None:
-            return
-
-        super().move(dx, dy)
+    def _update_position(self):
+        """Move the window of the frame to its new position on the master."""
         self.window.topleft = self._x - self.anchor[0]*self.window.width, self._y - self.anchor[1]*self.window.height
+        self._invalidate_transforms()
 
     @property
     def relative_left(self):
@@ -325,12 +598,12 @@ class Frame(Focusable, Collideable, Master):
     @property
     def absolute_left(self):
         """The absolute coordinates of the frame depends on the camera."""
-        return int(self.master.absolute_left + self.relative_left - self.camera.left*self.wc_ratio[0])
+        return self.get_transform()[0]
 
     @property
     def absolute_top(self):
         """The absolute coordinates of the frame depends on the camera."""
-        return int(self.master.absolute_top + self.relative_top - self.camera.top*self.wc_ratio[1])
+        return self.get_transform()[1]
 
     @property
     def absolute_right(self):
@@ -69,6 +69,8 @@ class Cursor:
 
     def __init__(self, *values):
         self.is_loaded = True # only set to false is the cursor is an art
+        self._future_cursors = None # The art and the anchor, if the cursor is an art.
+        self._compiled_cursors: dict[tuple, tuple[_Cs, ...]] = {} # The cursors compiled from the art, by settings.
         self._durations = (500,)
         self._introduction = 0
         if len(values) == 1:
@@ -84,7 +86,7 @@ class Cursor:
                     self._cursors = (_Cs(*_pygame_bitmap_cursors[values[0]], *pygame.cursors.compile(getattr(pygame.cursors, values[0]))),)
                 elif os.path.isfile(get_file('cursors', values[0])):
                     # Create a cursor a file
-                    self._cursors = (_Cs(*pygame.cursors.load_xbm(values[0])))
+                    self._cursors = (_Cs(*pygame.cursors.load_xbm(get_file('cursors', values[0]))),)
                 else:
                     raise ValueError(f"{values[0]} isn't a proper argument for a cursor.")
 
@@ -92,9 +94,9 @@ class Cursor:
                 # Create a cursor with a string bitmap
                 bitmap = _verify_bitmap(values[0])
                 hotspot = (0, 0)
-                size = len(bitmap), len(bitmap[0])
+                size = len(bitmap[0]), len(bitmap)
 
-                self._cursors = (_Cs(size, hotspot, *pygame.cursors.compile(bitmap)))
+                self._cursors = (_Cs(size, hotspot, *pygame.cursors.compile(bitmap)),)
 
         elif len(values) == 2:
 
@@ -105,7 +107,7 @@ class Cursor:
 
             elif isinstance(values[0], str):
                 if os.path.isfile(get_file('cursors', values[0])) and os.path.isfile(get_file('cursors', values[1])):
-                    self._cursors = (_Cs(*pygame.cursors.load_xbm(values[0], values[1])))
+                    self._cursors = (_Cs(*pygame.cursors.load_xbm(get_file('cursors', values[0]), get_file('cursors', values[1]))),)
                 else:
                     raise ValueError(f"{values[0], values[1]} aren't proper arguments for a cursor.")
 
@@ -113,9 +115,9 @@ class Cursor:
                 # Create a cursor with a string bitmap
                 bitmap = _verify_bitmap(values[0])
                 hotspot = values[1]
-                size = len(bitmap), len(bitmap[0])
+                size = len(bitmap[0]), len(bitmap)
 
-                self._cursors = (_Cs(size, hotspot, *pygame.cursors.compile(bitmap)))
+                self._cursors = (_Cs(size, hotspot, *pygame.cursors.compile(bitmap)),)
 
         if all((isinstance(value, Cursor) for value in values)):
             self._cursors = []
@@ -129,16 +131,28 @@ class Cursor:
         self._time_since_last_change = 0
         self._index = 0
 
-    def get(self, settings: Settings):
-        """Return the current image to show as a cursor."""
-        if not self.is_loaded:
+    def _compile(self, settings: Settings):
+        """Compile the pygame cursors of every frame of the art, once for every settings."""
+        key = tuple((name, settings[name]) for name in settings.keys())
+        if key not in self._compiled_cursors:
             art, anchor = self._future_cursors # pylint: disable=unbalanced-tuple-unpacking
             art.load(**settings)
             hotspot = int(anchor[0]*art.width), int(anchor[1]*art.height)
-            self._cursors = tuple(_Cs(hotspot, surf) for surf in art.surfaces)
+            self._compiled_cursors[key] = tuple(_Cs(hotspot, surf) for surf in art.surfaces)
             self._durations = art.durations
             self._introduction = art.introduction
-            self.is_loaded = True
+        self._cursors = self._compiled_cursors[key]
+        self.is_loaded = True
+
+    def begin(self, settings: Settings):
+        """Compile the cursor, if it is made from an art. Call this method at the beginning of the phase."""
+        if self._future_cursors is not None:
+            self._compile(settings)
+
+    def get(self, settings: Settings):
+        """Return the current image to show as a cursor."""
+        if self._future_cursors is not None:
+            self._compile(settings)
         return self._cursors[self._index]
 
     def update(self, loop_duration) -> bool:
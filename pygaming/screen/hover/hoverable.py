@@ -42,6 +42,8 @@ class Hoverable(GraphicalChild, Collideable):
         super().begin()
         if self.tooltip is not None:
             self.tooltip.begin(self.master.game.settings)
+        if self.cursor is not None:
+            self.cursor.begin(self.master.game.settings)
 
     def finish(self):
         super().finish()
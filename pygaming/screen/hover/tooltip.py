@@ -6,6 +6,7 @@ from ...database import TextFormatter
 from ...color import ColorLike
 from ..anchors import CENTER_CENTER, AnchorLike, Anchor
 from .._abstract import Graphical, Textual
+from ..surface_pool import surface_pool
 
 class Tooltip(Graphical):
     """Tooltip is a graphical overlay displayed on hover."""
@@ -28,12 +29,14 @@ class Tooltip(Graphical):
         """Return the surface to be displayed."""
         if self._surface_changed or self._last_surface is None:
             self._surface_changed = False
-            self._last_surface = self.make_surface(phase)
+            last_surface, self._last_surface = self._last_surface, self.make_surface(phase)
+            if last_surface is not self._last_surface:
+                surface_pool.release(last_surface)
         return self._last_surface
 
     def make_surface(self, phase) -> pygame.Surface:
         """Create the image of the visual as a pygame surface."""
-        return self._arts.get(**phase.settings)
+        return self._arts.get(copy=False, **phase.settings)
 
 class TextTooltip(Tooltip, Textual):
     """A TextTooltip is a tooltip with some text displayed on it."""
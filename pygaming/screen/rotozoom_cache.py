@@ -0,0 +1,157 @@
+"""The rotozoom_cache module contains the RotozoomCache class, used to rotate and zoom the frames of the arts only once."""
+from collections import OrderedDict
+import math
+import numpy as np
+import pygame
+from .display_format import to_display_format
+
+_DEFAULT_MAX_BYTES = 64*2**20
+_DEFAULT_ANGLE_STEP = 1. # [°]
+_DEFAULT_ZOOM_STEP = 1/64
+_ANGLE_LIMIT = 0.001 # [°], below this angle, pygame only zooms the surface.
+
+def _bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch()*surface.get_height()
+
+class RotozoomCache:
+    """
+    A RotozoomCache keeps the rotated and zoomed versions of the surfaces, keyed by the surface, the angle and the zoom.
+    The angles and the zooms are quantized, so that an object spinning or zooming continuously reuses a limited number of surfaces.
+    When the cached surfaces take more than max_bytes, the least recently used ones are forgotten.
+    The surfaces returned by the cache must not be modified.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        angle_step: float = _DEFAULT_ANGLE_STEP,
+        zoom_step: float = _DEFAULT_ZOOM_STEP
+    ) -> None:
+        """
+        Create a cache.
+
+        Params:
+        ---
+        - max_bytes: int, the maximum number of bytes taken by the cached surfaces.
+        - angle_step: float, the default step [°] the angles are rounded to.
+        - zoom_step: float, the step the zooms are rounded to. A smaller step avoids the size snapping of the small zooms.
+        """
+        self._max_bytes = max_bytes
+        self._angle_step = angle_step
+        self._zoom_step = zoom_step
+        self._surfaces: OrderedDict[tuple[pygame.Surface, float, float], pygame.Surface] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, max_bytes: int | None = None, angle_step: float | None = None, zoom_step: float | None = None):
+        """
+        Change the parameters of the cache.
+
+        Params:
+        ---
+        - max_bytes: int | None, the maximum number of bytes taken by the cached surfaces. If None, it is not changed.
+        - angle_step: float | None, the default step [°] the angles are rounded to. If None, it is not changed.
+        - zoom_step: float | None, the step the zooms are rounded to. If None, it is not changed.
+        """
+        if max_bytes is not None:
+            self._max_bytes = max_bytes
+            self._evict()
+        if angle_step is not None:
+            self._angle_step = angle_step
+        if zoom_step is not None:
+            self._zoom_step = zoom_step
+
+    def quantize(self, angle: float, zoom: float, angle_step: float | None = None) -> tuple[float, float]:
+        """Return the angle, between 0 and 360, and the zoom actually used to rotate and zoom a surface."""
+        step = self._angle_step if angle_step is None else angle_step
+        angle = round(angle/step)*step % 360
+        zoom = max(round(zoom/self._zoom_step), 1)*self._zoom_step
+        return angle, zoom
+
+    def quantize_arrays(self, angles: np.ndarray, zooms: np.ndarray, angle_step: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Return the angles and the zooms actually used to rotate and zoom surfaces, like quantize but for arrays."""
+        step = self._angle_step if angle_step is None else angle_step
+        angles = np.round(angles/step)*step % 360
+        zooms = np.maximum(np.round(zooms/self._zoom_step), 1)*self._zoom_step
+        return angles, zooms
+
+    def get_size(self, size: tuple[int, int], angle: float, zoom: float, angle_step: float | None = None) -> tuple[int, int]:
+        """Return the size of a surface of the given size once rotated and zoomed, without computing it."""
+        angle, zoom = self.quantize(angle, zoom, angle_step)
+        width, height = size
+        if angle < _ANGLE_LIMIT and zoom == 1:
+            return width, height
+        # pygame works with single precision floats.
+        angle, zoom = float(np.float32(angle)), float(np.float32(zoom))
+        if angle > _ANGLE_LIMIT:
+            radians = math.radians(angle)
+            cos, sin = math.cos(radians)*zoom, math.sin(radians)*zoom
+            x, y = width//2, height//2
+            half_width = max(math.ceil(max(abs(cos*x + sin*y), abs(cos*x - sin*y))), 1)
+            half_height = max(math.ceil(max(abs(sin*x + cos*y), abs(sin*x - cos*y))), 1)
+            return 2*half_width, 2*half_height
+        return max(int(width*zoom), 1), max(int(height*zoom), 1)
+
+    def get(self, surface: pygame.Surface, angle: float, zoom: float, angle_step: float | None = None) -> pygame.Surface:
+        """
+        Return the surface rotated and zoomed.
+
+        Params:
+        ---
+        - surface: pygame.Surface, the surface to rotate and zoom.
+        - angle: float, the angle of the rotation [°], counterclockwise.
+        - zoom: float, the zoom factor.
+        - angle_step: float | None, the step the angle is rounded to. If None, the default step of the cache is used.
+        """
+        angle, zoom = self.quantize(angle, zoom, angle_step)
+        if angle < _ANGLE_LIMIT and zoom == 1:
+            return surface
+        key = (surface, angle, zoom)
+        rotozoomed = self._surfaces.get(key)
+        if rotozoomed is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return rotozoomed
+        self.misses += 1
+        rotozoomed = to_display_format(pygame.transform.rotozoom(surface, angle, zoom))
+        self._surfaces[key] = rotozoomed
+        self._bytes += _bytes(rotozoomed)
+        self._evict()
+        return rotozoomed
+
+    def bake(self, surfaces, zoom: float, steps: int):
+        """
+        Rotate and zoom surfaces for all the angles of a full turn made in a given number of steps.
+
+        Params:
+        ---
+        - surfaces: Iterable[pygame.Surface], the surfaces to rotate and zoom, like the frames of an art.
+        - zoom: float, the zoom factor.
+        - steps: int, the number of angles of the turn.
+        """
+        step = 360/steps
+        for surface in surfaces:
+            for i in range(steps):
+                self.get(surface, i*step, zoom, step)
+
+    def _evict(self):
+        """Forget the least recently used surfaces until the cache fits in its maximum size."""
+        while self._bytes > self._max_bytes and self._surfaces:
+            _, rotozoomed = self._surfaces.popitem(last=False)
+            self._bytes -= _bytes(rotozoomed)
+
+    def clear(self):
+        """Forget every cached surface."""
+        self._surfaces.clear()
+        self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes taken by the cached surfaces."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+rotozoom_cache = RotozoomCache()
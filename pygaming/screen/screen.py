@@ -1,9 +1,36 @@
 """The screen is the surface of the window."""
-
+from threading import Lock
 import pygame
 from ..settings import Settings
 from ..config import Config
 from ..file import get_file
+from .display_format import set_rle_accel
+from .art import convert_arts
+from .rotozoom_cache import rotozoom_cache
+
+_DEFAULT_DIRTY_RECTS_THRESHOLD = 0.5 # The fraction of the screen above which the whole screen is updated.
+_DEFAULT_RLE_ACCEL = False # Whether the arts with a colorkey or mostly opaque are RLE-accelerated.
+_DEFAULT_ROTOZOOM_CACHE_SIZE_KB = 65536 # The memory used to keep the rotated and zoomed surfaces of the actors.
+_DEFAULT_ROTOZOOM_ANGLE_STEP = 1 # [°], the step the angles of the actors are rounded to.
+_DEFAULT_ROTOZOOM_ZOOM_STEP = 1/64 # The step the zooms of the actors are rounded to.
+
+def union_area(rects: list[pygame.Rect]) -> int:
+    """Return the area covered by the rects, the overlapping parts being counted once."""
+    edges = sorted({x for rect in rects for x in (rect.left, rect.right)})
+    area = 0
+    # The area is summed over the vertical slices between two consecutive edges.
+    for left, right in zip(edges, edges[1:]):
+        intervals = sorted((rect.top, rect.bottom) for rect in rects if rect.left <= left and right <= rect.right and rect.height > 0)
+        covered, end = 0, None
+        for top, bottom in intervals:
+            if end is None or top > end:
+                covered += bottom - top
+                end = bottom
+            elif bottom > end:
+                covered += bottom - end
+                end = bottom
+        area += covered*(right - left)
+    return area
 
 class Screen:
     """The screen class is used to represent the screen of the game."""
@@ -11,21 +38,85 @@ class Screen:
     def __init__(self, config: Config, settings: Settings) -> None:
         self._width, self._height = config.dimension
         self._fullscreen = settings.fullscreen
+        self._dirty_rects_threshold = config.get("dirty_rects_threshold", _DEFAULT_DIRTY_RECTS_THRESHOLD)
+        set_rle_accel(config.get("rle_accel", _DEFAULT_RLE_ACCEL))
+        rotozoom_cache.configure(
+            config.get("rotozoom_cache_size_kb", _DEFAULT_ROTOZOOM_CACHE_SIZE_KB)*1024,
+            config.get("rotozoom_angle_step", _DEFAULT_ROTOZOOM_ANGLE_STEP),
+            config.get("rotozoom_zoom_step", _DEFAULT_ROTOZOOM_ZOOM_STEP)
+        )
+        # The display can be recreated by the update thread while the display thread presents the last draw list.
+        self._display_lock = Lock()
         self.screen = pygame.display.set_mode((self._width, self._height), pygame.FULLSCREEN if self._fullscreen else 0)
 
         pygame.display.set_caption(config.game_name)
         pygame.display.set_icon(pygame.image.load(get_file('', 'icon.ico')))
 
-    def display_phase(self, phase):
-        """Blit the Frame on the screen."""
-        phase.draw(self.screen)
+        # The scene is drawn by the update thread, the display thread only receives copies of its damaged areas.
+        self._scene = pygame.Surface((self._width, self._height)).convert()
+        self._draw_list: list[tuple[pygame.Surface, pygame.Rect]] | None = None
+        self._draw_list_lock = Lock()
+
+    def publish(self, phase):
+        """
+        Draw the damaged areas of the phase on the scene and publish them to be displayed.
+        This method is called by the update thread at the end of every loop iteration.
+        """
+        with self._draw_list_lock:
+            if self._draw_list is not None:
+                # The last draw list has not been displayed yet, the phase keeps its damaged areas for the next one.
+                return
+        rects = phase.draw(self._scene)
+        scene_rect = self._scene.get_rect()
+        if rects is None:
+            draw_list = [(self._scene.copy(), scene_rect)]
+        else:
+            draw_list = [(self._scene.subsurface(rect).copy(), rect) for rect in map(scene_rect.clip, rects) if rect]
+        if draw_list:
+            with self._draw_list_lock:
+                self._draw_list = draw_list
+
+    def present(self):
+        """
+        Blit the last published draw list on the window and update it.
+        This method is called by the display thread.
+        """
+        with self._draw_list_lock:
+            draw_list, self._draw_list = self._draw_list, None
+        if draw_list:
+            with self._display_lock:
+                for surface, rect in draw_list:
+                    self.screen.blit(surface, rect)
+                self.update([rect for _, rect in draw_list])
+
+    def update(self, rects: list[pygame.Rect] | None = None):
+        """
+        Update the screen.
 
-    def update(self):
-        """Update the screen."""
-        pygame.display.flip()
+        Params:
+        ---
+        - rects: list[Rect] | None, the areas of the screen to update. If None, or if the damaged area
+        is above the dirty rects threshold, the whole screen is updated.
+        """
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            damaged_area = union_area(rects)
+            if damaged_area > self._dirty_rects_threshold*self._width*self._height:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
 
     def update_settings(self, settings: Settings):
         """Update the screen based on the new settings."""
         if self._fullscreen != settings.fullscreen:
             self._fullscreen = settings.fullscreen
-            self.screen = pygame.display.set_mode((self._width, self._height), pygame.FULLSCREEN if self._fullscreen else 0)
+            with self._display_lock:
+                self.screen = pygame.display.set_mode((self._width, self._height), pygame.FULLSCREEN if self._fullscreen else 0)
+            # The pixel format of the new display might be different, the scene and the arts are converted again.
+            self._scene = self._scene.convert()
+            convert_arts()
+            rotozoom_cache.clear()
+            with self._draw_list_lock:
+                # The new display is empty, the whole scene is displayed again.
+                self._draw_list = [(self._scene.copy(), self._scene.get_rect())]
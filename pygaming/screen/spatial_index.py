@@ -0,0 +1,85 @@
+"""The spatial_index module contains the SpatialIndex class, used to find the objects under a point without testing all of them."""
+from typing import Any
+from pygame import Rect
+
+_DEFAULT_CELL_SIZE = 64
+
+class SpatialIndex:
+    """
+    A SpatialIndex is a uniform grid hash: the plane is divided into square cells and every object is stored in the cells its rect overlaps.
+    Querying an area only returns the objects stored in the cells the area overlaps, which are the only ones that can collide with it.
+    """
+
+    def __init__(self, cell_size: int = _DEFAULT_CELL_SIZE) -> None:
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], set] = {}
+        self._rects: dict[Any, tuple[Rect, range, range]] = {} # The rect of every object with the columns and rows of its cells.
+
+    def _cell_ranges(self, rect: Rect) -> tuple[range, range]:
+        size = self._cell_size
+        # An empty rect is still stored in the cell of its top left.
+        return (
+            range(rect.left//size, (max(rect.right, rect.left + 1) - 1)//size + 1),
+            range(rect.top//size, (max(rect.bottom, rect.top + 1) - 1)//size + 1)
+        )
+
+    def update(self, obj, rect: Rect):
+        """
+        Add an object to the index, or move it if it is already in it.
+
+        Params:
+        ---
+        - obj: the object. It must be hashable.
+        - rect: Rect, the area covered by the object.
+        """
+        previous = self._rects.get(obj)
+        if previous is not None and previous[0] == rect:
+            return
+        columns, rows = self._cell_ranges(rect)
+        if previous is not None:
+            if previous[1] == columns and previous[2] == rows:
+                self._rects[obj] = (Rect(rect), columns, rows)
+                return
+            self.remove(obj)
+        self._rects[obj] = (Rect(rect), columns, rows)
+        for column in columns:
+            for row in rows:
+                self._cells.setdefault((column, row), set()).add(obj)
+
+    def remove(self, obj):
+        """Remove an object from the index. Nothing happens if it is not in it."""
+        previous = self._rects.pop(obj, None)
+        if previous is None:
+            return
+        _, columns, rows = previous
+        for column in columns:
+            for row in rows:
+                cell = self._cells[(column, row)]
+                cell.discard(obj)
+                if not cell:
+                    del self._cells[(column, row)]
+
+    def query(self, rect: Rect) -> set:
+        """Return the objects whose rect collides with an area."""
+        columns, rows = self._cell_ranges(rect)
+        if len(columns)*len(rows) > len(self._cells):
+            candidates = set().union(*self._cells.values())
+        else:
+            candidates = set()
+            for column in columns:
+                for row in rows:
+                    cell = self._cells.get((column, row))
+                    if cell:
+                        candidates.update(cell)
+        return {obj for obj in candidates if self._rects[obj][0].colliderect(rect)}
+
+    def get_rect(self, obj) -> Rect | None:
+        """Return the rect of an object, or None if it is not in the index."""
+        previous = self._rects.get(obj)
+        return None if previous is None else previous[0]
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
@@ -0,0 +1,111 @@
+"""The surface_pool module contains the SurfacePool class, used to reuse the surfaces built at every frame instead of allocating new ones."""
+from weakref import WeakSet
+import pygame
+from pygame.surfarray import pixels2d
+
+_DEFAULT_MAX_SURFACES_PER_FORMAT = 4
+_DEFAULT_MAX_FORMATS = 32
+
+class SurfacePool:
+    """
+    A SurfacePool keeps the surfaces that are not used anymore, sorted by size and pixel format, to lend them again later.
+    Only the surfaces lent by the pool can be released into it, the other ones are ignored.
+    When more than max_formats sizes and formats are kept, the surfaces of the least recently released one are forgotten.
+    The pool is not thread-safe, it is meant to be used by the update thread only.
+    """
+
+    def __init__(self, max_surfaces_per_format: int = _DEFAULT_MAX_SURFACES_PER_FORMAT, max_formats: int = _DEFAULT_MAX_FORMATS) -> None:
+        self._max_surfaces_per_format = max_surfaces_per_format
+        self._max_formats = max_formats
+        self._free: dict[tuple, list[pygame.Surface]] = {}
+        self._lent: WeakSet[pygame.Surface] = WeakSet()
+
+    @staticmethod
+    def _key(size: tuple[int, int], flags: int, bitsize: int, masks: tuple[int, int, int, int]):
+        return (tuple(size), flags & pygame.SRCALPHA, bitsize, tuple(masks))
+
+    def _lend(self, size: tuple[int, int], flags: int, bitsize: int, masks: tuple[int, int, int, int]) -> pygame.Surface:
+        free = self._free.get(self._key(size, flags, bitsize, masks))
+        if free:
+            surface = free.pop()
+        else:
+            surface = pygame.Surface(size, flags & pygame.SRCALPHA, bitsize, masks)
+        self._lent.add(surface)
+        return surface
+
+    def get(self, size: tuple[int, int], like: pygame.Surface) -> pygame.Surface:
+        """
+        Return a surface of the given size with the same pixel format as another surface. Its content is undefined.
+
+        Params:
+        ---
+        - size: tuple[int, int], the size of the surface.
+        - like: pygame.Surface, the surface whose pixel format is used.
+        """
+        surface = self._lend(size, like.get_flags(), like.get_bitsize(), like.get_masks())
+        surface.set_colorkey(like.get_colorkey())
+        surface.set_alpha(like.get_alpha())
+        return surface
+
+    def copy(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Return a copy of the surface, reusing a released surface if possible.
+
+        Params:
+        ---
+        - surface: pygame.Surface, the surface to copy. It can be a subsurface.
+        """
+        if surface.get_bytesize() != 4:
+            return surface.copy()
+        if surface.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK):
+            # Locking a RLE-accelerated surface decodes it, the copy is made by SDL and is not RLE-accelerated to be drawn on.
+            copy = surface.copy()
+            copy.set_colorkey(copy.get_colorkey())
+            copy.set_alpha(copy.get_alpha())
+            return copy
+        copy = self.get(surface.get_size(), surface)
+        pixels = pixels2d(copy)
+        pixels[...] = pixels2d(surface)
+        del pixels # unlock the surfaces.
+        return copy
+
+    def release(self, surface: pygame.Surface | None):
+        """
+        Give a surface back to the pool. The surface must not be used anymore by the caller.
+        Surfaces that have not been lent by the pool are ignored.
+        """
+        if surface is None or surface not in self._lent:
+            return
+        self._lent.discard(surface)
+        key = self._key(surface.get_size(), surface.get_flags(), surface.get_bitsize(), surface.get_masks())
+        # The key is moved at the end of the dict to keep the formats sorted from the least to the most recently released.
+        free = self._free.pop(key, [])
+        self._free[key] = free
+        if len(free) < self._max_surfaces_per_format:
+            free.append(surface)
+        if len(self._free) > self._max_formats:
+            del self._free[next(iter(self._free))]
+
+    def clear(self):
+        """Forget every released surface."""
+        self._free.clear()
+
+surface_pool = SurfacePool()
+
+def replace_area(destination: pygame.Surface, source: pygame.Surface, dest: tuple[int, int], area: pygame.Rect | None = None):
+    """
+    Replace the pixels of an area of the destination by the pixels of the source, alpha included, instead of blending them.
+    The clip of the destination is respected.
+
+    Params:
+    ---
+    - destination: pygame.Surface, the surface to draw on.
+    - source: pygame.Surface, the surface whose pixels are copied.
+    - dest: tuple[int, int], the position of the copied pixels on the destination.
+    - area: pygame.Rect | None, the area of the source to copy. If None, the whole source is copied.
+    """
+    if not source.get_flags() & pygame.SRCALPHA and source.get_alpha() is None and source.get_colorkey() is None:
+        destination.blit(source, dest, area)
+    else:
+        destination.fill((0, 0, 0, 0), pygame.Rect(dest, source.get_size() if area is None else area.size))
+        destination.blit(source, dest, area, pygame.BLEND_RGBA_MAX)
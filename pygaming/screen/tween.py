@@ -0,0 +1,170 @@
+"""The tween module contains the TweenEngine class, used to animate values over time with transition functions."""
+from typing import Any, Callable, Hashable
+import numpy as np
+from ZOCallable import ZOCallable
+from ZOCallable.functions import linear
+
+_MAX_COMPONENTS = 4 # The maximum number of values animated together by one tween, like the left, top, width and height of a camera.
+_DEFAULT_CAPACITY = 16
+
+def _vectorize(function: ZOCallable) -> Callable[[np.ndarray], np.ndarray]:
+    """Return a version of the transition function computing all the values of an array at once."""
+    try:
+        values = np.asarray(function(np.array([0., 0.5, 1.])), dtype=float)
+        if values.shape == (3,):
+            return function
+    except (TypeError, ValueError):
+        pass
+    return np.vectorize(function, otypes=[float])
+
+class TweenEngine:
+    """
+    A TweenEngine animates values from a start to an end in a given duration, following transition functions.
+    All the running tweens are stored in arrays and advanced together at every loop iteration.
+    The callback of a tween is called with its new value only when the value changed, and a last time with the end value.
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._count = 0
+        self._starts = np.zeros((capacity, _MAX_COMPONENTS))
+        self._ends = np.zeros((capacity, _MAX_COMPONENTS))
+        self._values = np.zeros((capacity, _MAX_COMPONENTS)) # The values given to the callbacks the last time.
+        self._elapsed = np.zeros(capacity)
+        self._durations = np.zeros(capacity)
+        self._transitions = np.zeros(capacity, dtype=np.intp)
+        self._keys: list[Hashable] = [] # The key of every running tween, in the order of the arrays.
+        self._callbacks: list[tuple[Callable[[Any], Any], int]] = [] # The callback and the number of components of every tween.
+        self._rows: dict[Hashable, int] = {} # key: row of the tween in the arrays.
+        self._functions: list[Callable[[np.ndarray], np.ndarray]] = []
+        self._function_ids: dict[ZOCallable, int] = {}
+
+    def _grow(self):
+        capacity = 2*len(self._elapsed)
+        for name in ('_starts', '_ends', '_values'):
+            array = np.zeros((capacity, _MAX_COMPONENTS))
+            array[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, array)
+        for name in ('_elapsed', '_durations', '_transitions'):
+            array = np.zeros(capacity, dtype=getattr(self, name).dtype)
+            array[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, array)
+
+    def start(
+        self,
+        key: Hashable,
+        start: float | tuple[float, ...],
+        end: float | tuple[float, ...],
+        duration: int,
+        callback: Callable[[Any], Any],
+        transition_function: ZOCallable = linear
+    ):
+        """
+        Start a tween. If a tween with the same key is running, it is replaced.
+
+        Params:
+        ---
+        - key: Hashable, the key of the tween, used to stop or replace it.
+        - start: float | tuple[float, ...], the value at the start of the tween. Up to 4 values can be animated together.
+        - end: float | tuple[float, ...], the value at the end of the tween, with as many values as the start.
+        - duration: int [ms], the duration of the tween. If it is 0, the end value is reached at the next iteration.
+        - callback: Callable, called with the new value, a float or a tuple of floats like the start, every time it changes.
+        - transition_function: ZOCallable, the function giving the progress of the value from the progress of the time.
+        """
+        is_scalar = np.isscalar(start)
+        start = np.atleast_1d(np.asarray(start, dtype=float))
+        end = np.atleast_1d(np.asarray(end, dtype=float))
+        if start.shape != end.shape or len(start) > _MAX_COMPONENTS:
+            raise ValueError(f"The start {start} and the end {end} of a tween must have the same number of values, at most {_MAX_COMPONENTS}.")
+        if transition_function not in self._function_ids:
+            self._function_ids[transition_function] = len(self._functions)
+            self._functions.append(_vectorize(transition_function))
+
+        row = self._rows.get(key)
+        if row is None:
+            if self._count == len(self._elapsed):
+                self._grow()
+            row = self._count
+            self._count += 1
+            self._rows[key] = row
+            self._keys.append(key)
+            self._callbacks.append(None)
+        size = len(start)
+        self._starts[row, :size] = start
+        self._ends[row, :size] = end
+        self._values[row, :size] = start
+        self._starts[row, size:] = self._ends[row, size:] = self._values[row, size:] = 0
+        self._elapsed[row] = 0
+        self._durations[row] = duration
+        self._transitions[row] = self._function_ids[transition_function]
+        self._callbacks[row] = (callback, 0 if is_scalar else size)
+
+    def stop(self, key: Hashable):
+        """Stop a tween, its value stays where it is. Nothing happens if no tween has this key."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = self._count - 1
+        if row != last:
+            # The last tween takes the place of the stopped one.
+            for array in (self._starts, self._ends, self._values, self._elapsed, self._durations, self._transitions):
+                array[row] = array[last]
+            self._keys[row] = self._keys[last]
+            self._callbacks[row] = self._callbacks[last]
+            self._rows[self._keys[row]] = row
+        self._keys.pop()
+        self._callbacks.pop()
+        self._count = last
+
+    def is_running(self, key: Hashable) -> bool:
+        """Return whether a tween with this key is running."""
+        return key in self._rows
+
+    def advance(self, dt: int):
+        """
+        Advance all the tweens and call back the ones whose value changed.
+
+        Params:
+        ---
+        - dt: int, the duration of the loop iteration, in ms.
+        """
+        n = self._count
+        if not n:
+            return
+        elapsed = self._elapsed[:n]
+        elapsed += dt
+        durations = self._durations[:n]
+        progress = np.ones(n)
+        np.divide(elapsed, durations, out=progress, where=durations > 0)
+        np.clip(progress, 0, 1, out=progress)
+        finished = progress >= 1
+
+        transitions = self._transitions[:n]
+        for function_id in np.unique(transitions):
+            rows = transitions == function_id
+            progress[rows] = self._functions[function_id](progress[rows])
+
+        starts, ends = self._starts[:n], self._ends[:n]
+        values = starts + (ends - starts)*progress[:, None]
+        values[finished] = ends[finished] # The end value is reached exactly.
+        changed = np.flatnonzero((values != self._values[:n]).any(axis=1) | finished)
+        self._values[:n] = values
+
+        calls = []
+        for row in changed:
+            callback, size = self._callbacks[row]
+            calls.append((callback, float(values[row, 0]) if size == 0 else tuple(map(float, values[row, :size]))))
+        for row in np.flatnonzero(finished)[::-1]:
+            self.stop(self._keys[row])
+        # The callbacks are called once the engine is up to date, they can start or stop tweens.
+        for callback, value in calls:
+            callback(value)
+
+    def clear(self):
+        """Stop every tween."""
+        self._count = 0
+        self._keys.clear()
+        self._callbacks.clear()
+        self._rows.clear()
+
+    def __len__(self) -> int:
+        return self._count
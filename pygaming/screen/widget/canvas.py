@@ -83,6 +83,9 @@ class Canvas(GraphicalChild, Placeable):
         transfo = transform.DrawRoundedRectangle(color, rect, top_left, top_right, bottom_right, bottom_left, thickness, allow_antialias)
         self.transform(transfo)
 
+    def is_opaque(self):
+        return self._background_copy.is_opaque()
+
     def make_surface(self) -> Surface:
         return self._background_copy.get(self._arts.main, **self.game.settings)
 
@@ -9,6 +9,8 @@ from ..art import Art
 from ..hover import Cursor, Tooltip
 from ..hitbox import Hitbox
 from ..states import WidgetStates
+from ..surface_pool import surface_pool
+from ...database.text_metrics import TextMetrics, EditableLayout
 
 _DEFAULT_CARET_FREQUENCY = 500 # [ms]
 _DEFAULT_CARET_WIDTH = 2 # [px]
@@ -16,6 +18,13 @@ _DEFAULT_MAX_LENGTH = 15
 _PASSWORD_CHAR = "\u2022"
 _DEFAULT_PAD = 2
 
+def _update_layout(layout: EditableLayout | None, metrics: TextMetrics, text: str, max_width: int | None = None) -> EditableLayout:
+    """Return the layout of the text, edited locally if the previous layout has been made with the same font and width."""
+    if layout is None or layout.metrics is not metrics or layout.max_width != max_width:
+        return EditableLayout(metrics, text, max_width)
+    layout.update(text)
+    return layout
+
 class Entry(TextualWidget):
     """The Entry widget is used to allow the user to add a textual input."""
 
@@ -121,6 +130,7 @@ class Entry(TextualWidget):
 
         self._empty_text_or_loc = empty_text_or_loc
         self._fonts.add(WidgetStates.EMPTY, empty_font, empty_font_color)
+        self._layout: EditableLayout | None = None # The layout of the displayed text, updated locally at each edit.
 
     def get(self):
         """Return the textual value currently entered."""
@@ -129,32 +139,39 @@ class Entry(TextualWidget):
     def __make_text_to_display(self):
         if self.password and self.text:
             return _PASSWORD_CHAR*len(self.text)
-        elif self._empty_text_or_loc:
+        elif not self.text and self._empty_text_or_loc:
             return self._empty_text_or_loc
         else:
             return self.text
 
     def make_surface(self) -> Surface:
+        font, color = self._fonts.get(self.state)
         return self.__make_surface(
-            self._arts.get(self.state, **self.game.settings),
-            self._fonts.get(self.state), self._show_caret, self.__make_text_to_display()
+            surface_pool.copy(self._arts.get(self.state, copy=False, **self.game.settings)),
+            font, color, self.__make_text_to_display()
         )
 
     def __make_surface(self, background: Surface, font: str, color: Color, text: str):
-        rendered_text = self.game.typewriter.render(font, text, color)
+        if self.text:
+            self._layout = _update_layout(self._layout, self.game.typewriter.get_metrics(font), text)
+            caret_offset = self._layout.caret_pos(self._caret_index)[0]
+            rendered_text = self.game.typewriter.render(font, text, color, can_be_loc=False)
+        else: # The text is empty, or replaced by the empty text or loc.
+            caret_offset = 0
+            rendered_text = self.game.typewriter.render(font, text, color)
         text_width, text_height = rendered_text.get_size()
         just_y = self._justify[1]*(background.get_height() - text_height)
         # if the text is too long, we center on the charet, if the charet is too much on the right or left, we let the first/last
         # character be on the left/right.
         if text_width > background.get_width():
-            just_x = min(0, -self.game.typewriter.size(font, text[:self._caret_index])[0] + background.get_width()//2)
+            just_x = min(0, -caret_offset + background.get_width()//2)
             just_x = max(just_x, background.get_width() - text_width)
         else:
             just_x = self._justify[0]*(background.get_width() - text_width)
         background.blit(rendered_text, (just_x, just_y))
         if self._show_caret:
             caret_height = self.game.typewriter.get_linesize(font)
-            caret_x = just_x + self.game.typewriter.size(font, text[:self._caret_index])[0]
+            caret_x = just_x + caret_offset
             draw.line(background, self._fonts.get(WidgetStates.FOCUSED)[1], (caret_x, just_y), (caret_x, just_y + caret_height), self._caret_width)
         return background
 
@@ -324,6 +341,12 @@ class Text(TextualWidget):
 
         self._empty_text_or_loc = empty_text_or_loc
         self._fonts.add(WidgetStates.EMPTY, empty_font, empty_font_color)
+        self._layout: EditableLayout | None = None # The layout of the text, updated locally at each edit.
+
+    def _get_layout(self, font: str) -> EditableLayout:
+        """Return the layout of the text written with this font."""
+        self._layout = _update_layout(self._layout, self.game.typewriter.get_metrics(font), self.text, self._arts.width if self.wrap else None)
+        return self._layout
 
     def set_text(self, new_text: str):
         """Set a new value for the entry."""
@@ -352,29 +375,17 @@ class Text(TextualWidget):
 
     def move_to_the_bottom(self):
         """Move the caret to the bottom."""
-
-        car_pos = self.game.typewriter.get_caret_pos(
-            self._fonts.get(WidgetStates.FOCUSED)[0], self._caret_index, self.text, self._justify, False, self.wrap, self._arts.width
-        )
-
-        new_pos = car_pos[0], car_pos[1] + self.game.typewriter.get_linesize(self._fonts.get(WidgetStates.FOCUSED)[0])
-
-        self._caret_index = self.game.typewriter.get_caret_index(
-            self._fonts.get(WidgetStates.FOCUSED)[0], new_pos, self.text, self._justify, False, self.wrap, self._arts.width
-        )
+        layout = self._get_layout(self._fonts.get(WidgetStates.FOCUSED)[0])
+        car_pos = layout.caret_pos(self._caret_index, self._justify, self._arts.width)
+        new_pos = car_pos[0], car_pos[1] + layout.linesize
+        self._caret_index = layout.caret_index(new_pos, self._justify, self._arts.width)
 
     def move_to_the_top(self):
         """Move the caret to the top."""
-
-        car_pos = self.game.typewriter.get_caret_pos(
-            self._fonts.get(WidgetStates.FOCUSED)[0], self._caret_index, self.text, self._justify, False, self.wrap, self._arts.width
-        )
-
-        new_pos = car_pos[0], car_pos[1] - self.game.typewriter.get_linesize(self._fonts.get(WidgetStates.FOCUSED)[0])
-
-        self._caret_index = self.game.typewriter.get_caret_index(
-            self._fonts.get(WidgetStates.FOCUSED)[0], new_pos, self.text, self._justify, False, self.wrap, self._arts.width
-        )
+        layout = self._get_layout(self._fonts.get(WidgetStates.FOCUSED)[0])
+        car_pos = layout.caret_pos(self._caret_index, self._justify, self._arts.width)
+        new_pos = car_pos[0], car_pos[1] - layout.linesize
+        self._caret_index = layout.caret_index(new_pos, self._justify, self._arts.width)
 
     def _add_new_characters(self, new_characters):
         """Add new characters to the value. Return True if some new characters have been added."""
@@ -391,22 +402,23 @@ class Text(TextualWidget):
     
     def make_surface(self):
         state = WidgetStates.EMPTY if self.state == WidgetStates.NORMAL and not self.text else self.state
-        background = self._arts.get(state, **self.game.settings)
+        background = surface_pool.copy(self._arts.get(state, copy=False, **self.game.settings))
         font, color = self._fonts.get(state)
-        text = self._empty_text_or_loc if not self.text and self.state in (WidgetStates.NORMAL, WidgetStates.HOVERED) else self.text
-        rendered_text = self.game.typewriter.render(
-            font, text, color, justify=self._justify,
-            can_be_loc=len(self.text) == 0, wrap = self.wrap, max_width=background.get_width()
-        )
-        text_width, _ = rendered_text.get_size()
-        # if the text is too long, we center on the charet, if the charet is too much on the right or left, we let the first/last
-        # character be on the left/right.
-        just_x = self._justify[0]*(background.get_width() - text_width)
-        background.blit(rendered_text, (just_x, _DEFAULT_PAD))
+        if not self.text and self.state in (WidgetStates.NORMAL, WidgetStates.HOVERED):
+            rendered_text = self.game.typewriter.render(
+                font, self._empty_text_or_loc, color, justify=self._justify, wrap=self.wrap, max_width=background.get_width()
+            )
+            background.blit(rendered_text, (self._justify[0]*(background.get_width() - rendered_text.get_width()), _DEFAULT_PAD))
+            return background
+        # Only the lines that are visible are rendered, the lines that did not change are found in the render cache.
+        layout = self._get_layout(font)
+        for line_y, line, line_width in layout.visible_lines(background.get_height() - _DEFAULT_PAD):
+            if line:
+                rendered_line = self.game.typewriter.render(font, line, color, can_be_loc=False)
+                background.blit(rendered_line, (self._justify[0]*(background.get_width() - line_width), line_y + _DEFAULT_PAD))
         if self._show_caret and self.state == WidgetStates.FOCUSED:
-            caret_x, caret_y = self.game.typewriter.get_caret_pos(font, self._caret_index, text, self._justify, False, self.wrap, max_width=background.get_width() - _DEFAULT_PAD)
-            caret_height = self.game.typewriter.get_linesize(font)
-            background.fill(color, Rect(caret_x, caret_y + _DEFAULT_PAD, self._caret_width, caret_height))
+            caret_x, caret_y = layout.caret_pos(self._caret_index, self._justify, background.get_width())
+            background.fill(color, Rect(caret_x, caret_y + _DEFAULT_PAD, self._caret_width, layout.linesize))
         return background
     
     def __reset_caret(self, show: bool):
@@ -454,9 +466,8 @@ class Text(TextualWidget):
             if self.is_contact(ck1):
 
                 pos = ck1.make_local_click(self.absolute_left, self.absolute_top, self.master.wc_ratio)
-                self._caret_index = self.game.typewriter.get_caret_index(
-                    self._fonts.get(WidgetStates.FOCUSED)[0], pos, self.text, self._justify, False, self.wrap, self._arts.width
-                )
+                layout = self._get_layout(self._fonts.get(WidgetStates.FOCUSED)[0])
+                self._caret_index = layout.caret_index(pos, self._justify, self._arts.width)
                 self.__reset_caret(True)
                 
         else:
@@ -74,7 +74,7 @@ class Label(Textual, Hoverable):
         if self._show_text:
             return self._render_text_on_bg(self.game.settings, self.game.typewriter)
         else:
-            return self._arts.get(self.state, **self.game.settings)
+            return self._arts.get(self.state, copy=False, **self.game.settings)
 
 class Paragraph(Label):
     """A Paragraph is used to display a piece of a text as a justified paragraph."""
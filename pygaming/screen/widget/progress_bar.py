@@ -10,6 +10,7 @@ from ...color import ColorLike
 from ..art import Art, Rectangle
 from ...database import TextFormatter
 from .._abstract import Placeable, GraphicalChild
+from ..surface_pool import surface_pool
 
 class ProgressBar(Placeable, GraphicalChild):
 
@@ -50,13 +51,17 @@ class ProgressBar(Placeable, GraphicalChild):
         verify_ZOCallable(transition_function)
         self._transition_func = transition_function
         self._transition_duration = transition_duration
-        self._current_transition = None
-        self._current_transition_delta = 0
         self._current_position = self._value
 
     def set_value(self, new_value: float):
         self._value = new_value
-        self._current_transition = (self._current_position, self._value)
+        self._tween('position', self._current_position, self._value, self._transition_duration,
+            self._set_current_position, self._transition_func)
+
+    def _set_current_position(self, position: float):
+        """Move the bar during a transition."""
+        self._current_position = position
+        self.notify_change()
 
     def begin(self, **kwargs):
         self.foreground.start(**self.game.settings)
@@ -75,25 +80,10 @@ class ProgressBar(Placeable, GraphicalChild):
         has_changed = self.bar.update(loop_duration) or self.foreground.update(loop_duration)
         if has_changed:
             self.notify_change()
-
-        # Move the current_position
-        if self._current_transition is not None:
-            self.notify_change()
-            if self._transition_duration > 0:
-                self._current_transition_delta += loop_duration/self._transition_duration
-            else:
-                self._current_transition_delta = 1.01
-            t = self._transition_func(self._current_transition_delta)
-            self._current_position = self._current_transition[0]*(1-t) + t*self._current_transition[1]
-
-            # If we finished the transition
-            if self._current_transition_delta >= 1:
-                self._current_transition_delta = 0
-                self._current_transition = None
-                self._current_position = self._value
+        # The transitions are made by the tweens of the phase.
 
     def make_surface(self) -> Surface:
-        background = self._arts.get(self.state, **self.game.settings).copy()
+        background = surface_pool.copy(self._arts.get(self.state, copy=False, **self.game.settings))
         foreground = self.foreground.get(None, copy=False, **self.game.settings)
         bar = self.bar.get(None, copy=False, **self.game.settings)
         # For each case, find the blitting coordinate and the perhaps transformed bar.
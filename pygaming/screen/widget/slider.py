@@ -11,6 +11,7 @@ from ..art import Art
 from ..hover import Cursor, Tooltip
 from ..hitbox import Hitbox
 from ..anchors import Anchor
+from ..surface_pool import surface_pool
 from ...color import Color
 from ...error import PygamingException
 
@@ -76,8 +77,6 @@ class _Slider(Widget):
         verify_ZOCallable(transition_function)
         self._transition_func = transition_function
         self._transition_duration = transition_duration
-        self._current_transition = None
-        self._current_transition_delta = 0
         self._cursor_position = None
 
         self._step_wth_arrow = step_wth_arrow
@@ -126,8 +125,13 @@ class _Slider(Widget):
         if new_index != self._index:
             # In this case, we start a transition to it.
             self._index = new_index
-            self._current_transition = (self._cursor_position, self._positions[self._index])
-            self._current_transition_delta = 0
+            self._tween('cursor', self._cursor_position, self._positions[self._index], self._transition_duration,
+                self._set_cursor_position, self._transition_func)
+
+    def _set_cursor_position(self, position: float):
+        """Move the cursor during a transition."""
+        self._cursor_position = position
+        self.notify_change()
 
     def update(self, dt: int):
         """Update the slider based on the inputs."""
@@ -168,7 +172,7 @@ class _Slider(Widget):
                     else:
                         local_x = min(max(self._positions[0], local_x), self._positions[-1])
                     self._index = self._get_index_of_click(local_x)
-                    
+                    self._stop_tween('cursor')
                     self._cursor_position = local_x
                     self.notify_change()
             else:
@@ -192,28 +196,13 @@ class _Slider(Widget):
                     else:
                         local_y = min(max(self._positions[0], local_y), self._positions[-1])
                     self._index = self._get_index_of_click(local_y)
-                    
+                    self._stop_tween('cursor')
                     self._cursor_position = local_y
                     self.notify_change()
 
-        # In the case the user is not clicking
+        # In the case the user is not clicking. The transitions are made by the tweens of the phase.
         else:
             self._holding_cursor = False
-            # if we are doing a transition
-            if self._current_transition is not None:
-                self.notify_change()
-                if self._transition_duration > 0:
-                    self._current_transition_delta += dt/self._transition_duration
-                else:
-                    self._current_transition_delta = 1.01 # The transition is instantaneous
-                t = self._transition_func(self._current_transition_delta)
-                self._cursor_position = self._current_transition[0]*(1-t) + t*self._current_transition[1]
-
-                # If we finished the transition
-                if self._current_transition_delta >= 1:
-                    self._current_transition_delta = 0
-                    self._current_transition = None
-                    self._cursor_position = self._positions[self._index]
 
         # Verify the use of the arrows
         if self.state == WidgetStates.FOCUSED:
@@ -254,8 +243,8 @@ class _Slider(Widget):
     def make_surface(self) -> Surface:
         """Make the surface with the cursor and the background."""
 
-        bg = self._arts.get(self.state, **self.game.settings)
-        cursor = self._cursor_arts.get(self.state, **self.game.settings)
+        bg = surface_pool.copy(self._arts.get(self.state, copy=False, **self.game.settings))
+        cursor = self._cursor_arts.get(self.state, copy=False, **self.game.settings)
         if self._direction in [Anchor.LEFT, Anchor.RIGHT]:
             x = self._cursor_position - self._cursor_width//2
             y = (bg.get_height() - self._cursor_height)//2
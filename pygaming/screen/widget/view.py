@@ -1,10 +1,11 @@
 """The view module contains the View class which is used to have a view on a frame through a different camera."""
-from pygame import Surface, transform
+from pygame import Surface, transform, SRCALPHA
 from ...error import PygamingException
 from ..camera import Camera
 from .._abstract import Placeable
 from ..art import Art
 from ..frame import Frame
+from ..surface_pool import surface_pool
 
 class View(Placeable):
 
@@ -32,12 +33,15 @@ class View(Placeable):
         self.foreground = foreground
 
         target.views.add(self)
+        # The scaled view is kept until the target's surface or the camera change.
+        self._scaled: Surface | None = None
+        self._scaled_key = None
 
     def notify_change(self):
         """Notify a change in the visual."""
         self._surface_changed = True
         if self.is_visible():
-            self.master.notify_change()
+            self.master.notify_change(self.relative_rect)
     
     @property
     def width(self):
@@ -54,10 +58,27 @@ class View(Placeable):
             if has_changed:
                 self.notify_change()
 
+    def is_opaque(self):
+        """The view is opaque if the target is and the camera does not hide any part of it."""
+        return self.camera.hide_mask is None and self.target.is_opaque()
+
     def make_surface(self) -> Surface:
-        view = self.camera.get_surface(self.target.get_surface(), self.master.game.settings)
-        if view.get_size() != (self.width, self.height):
-            view = transform.scale(view, (self.width, self.height))
+        target_surface = self.target.get_surface()
+        key = (target_surface, self.target._surface_version, tuple(self.camera))
+        if key == self._scaled_key:
+            view = self._scaled
+        else:
+            view = self.camera.get_surface(target_surface, self.master.game.settings)
+            if view.get_size() != (self.width, self.height):
+                if self._scaled is None or self._scaled.get_size() != (self.width, self.height):
+                    self._scaled = Surface((self.width, self.height), view.get_flags() & SRCALPHA, view)
+                self._scaled = transform.scale(view, (self.width, self.height), self._scaled)
+                self._scaled_key = key
+                surface_pool.release(view)
+                view = self._scaled
+        if self.foreground is not None and (view is self._scaled or view.get_parent() is not None):
+            # The view is the cached scaled view or a subsurface of the target's surface, it must not be drawn on.
+            view = surface_pool.copy(view)
         if self.foreground is not None:
-            view.blit(self.foreground.get(None, **self.master.game.settings), (0, 0))
+            view.blit(self.foreground.get(None, copy=False, **self.master.game.settings), (0, 0))
         return view
@@ -0,0 +1,136 @@
+import unittest
+from types import SimpleNamespace
+import numpy as np
+import pygame
+from pygaming.screen._abstract import Master
+from pygaming.screen.actor_group import ActorGroup
+from pygaming.screen.art import Rectangle
+from pygaming.screen.art.art import Art
+
+class _Frames(Art):
+    """An art made of plain frames with the given durations."""
+
+    def __init__(self, *durations: int):
+        super().__init__(None)
+        self._frame_durations = durations
+        self._width, self._height = 4, 4
+
+    def _load(self, **ld_kwargs):
+        self._surfaces = tuple(pygame.Surface((4, 4)) for _ in self._frame_durations)
+        self._durations = self._frame_durations
+
+class _Master(Master):
+    """A master of 100x100 pixels displayed at the top left of the window, recording the damaged areas."""
+
+    def __init__(self):
+        super().__init__()
+        self.game = SimpleNamespace(settings={}, config=SimpleNamespace(dimension=(800, 600)))
+        self.camera = pygame.Rect(0, 0, 100, 100)
+        self.views = []
+        self.absolute_left, self.absolute_top, self.wc_ratio = 0, 0, (1, 1)
+        self.damaged = []
+
+    width = height = 100
+
+    def is_visible(self):
+        return True
+
+    def is_child_on_me(self, child):
+        return child._x is not None and self.camera.colliderect(child.relative_rect)
+
+    def notify_change_all(self):
+        pass
+
+    def notify_change(self, rect=None):
+        self.damaged.append(rect)
+
+    def make_surface(self):
+        return pygame.Surface((100, 100))
+
+class TestActorGroup(unittest.TestCase):
+    """Testing of the actor groups."""
+
+    def setUp(self):
+        self.master = _Master()
+        self.arts = [Rectangle((255, 0, 0), 10, 4), Rectangle((0, 0, 255), 6, 6)]
+        self.group = ActorGroup(self.master, self.arts)
+
+    def test_add_remove(self):
+        indices = self.group.add([10, 20, 30], [5, 15, 25], art=[0, 1, 0], layer=[2, 0, 1])
+        self.assertEqual(indices.tolist(), [0, 1, 2])
+        self.assertEqual(len(self.group), 3)
+        self.assertEqual(self.group.relative_rect, pygame.Rect(5, 3, 30, 24))
+        self.group.add(np.arange(100), 0)
+        self.assertEqual(len(self.group), 103, "The arrays should grow beyond their initial capacity.")
+        self.group.remove(np.arange(3, 103))
+        self.group.remove(1)
+        self.assertEqual(self.group.positions.tolist(), [[10, 5], [30, 25]], "The following sprites should keep their order.")
+        self.assertEqual(self.group.art_indices.tolist(), [0, 0])
+        self.assertEqual(self.group.layers.tolist(), [2, 1])
+        with self.assertRaises(ValueError):
+            self.group.add(0, 0, art=2)
+        self.group.clear()
+        self.assertEqual(len(self.group), 0)
+        self.assertEqual(self.group.get_blits((0, 0)), [])
+
+    def test_transformations(self):
+        self.group.add([10, 50], [10, 50])
+        self.group.translate(5, -5, sprites=1)
+        self.assertEqual(self.group.positions.tolist(), [[10, 10], [55, 45]])
+        self.group.translate([1, 2], [3, 4])
+        self.assertEqual(self.group.positions.tolist(), [[11, 13], [57, 49]])
+        self.group.rotate(90)
+        self.group.rotate(300, sprites=[0])
+        self.assertEqual(self.group.angles.tolist(), [30, 90])
+        self.group.zoom(2, sprites=np.array([False, True]))
+        self.assertEqual(self.group.zooms.tolist(), [1, 2])
+        _, _, widths, heights, _, _ = self.group._get_appearance()
+        expected = pygame.transform.rotozoom(pygame.Surface((10, 4)), 90, 2).get_size()
+        self.assertEqual((widths[1], heights[1]), expected, "The rotated and zoomed size should be computed from the size of the art.")
+
+    def test_not_loaded_before_begin(self):
+        self.group.add([10, 20], [10, 20], art=[0, 1], angle=45, zoom=1.5)
+        self.group.place(5, 5)
+        self.assertIsNotNone(self.group.relative_rect)
+        self.assertFalse(any(art.is_loaded() for art in self.arts), "The arts should not be loaded to place the group.")
+        _, _, widths, heights, order, _ = self.group._get_appearance()
+        sizes = [surface.get_size() for surface, _ in self.group.get_blits((0, 0))]
+        self.assertEqual(sizes, list(zip(widths[order].tolist(), heights[order].tolist())), "The declared sizes should match the surfaces.")
+
+    def test_blits_on_camera(self):
+        self.group.add([50, 98, 200], [50, 50, 50])
+        self.assertEqual(self.group.on_camera().tolist(), [True, True, False])
+        camera = self.master.camera
+        blits = self.group.get_blits((7, 3), camera)
+        self.assertEqual(len(blits), 2, "The sprites outside the area should not be blitted.")
+        (_, first_dest, first_area), (_, second_dest, second_area) = blits
+        self.assertEqual((first_dest, tuple(first_area)), ((45 + 7, 48 + 3), (0, 0, 10, 4)))
+        self.assertEqual((second_dest, tuple(second_area)), ((93 + 7, 48 + 3), (0, 0, 7, 4)), "The sprites should be clipped by the area.")
+
+    def test_damaged_area(self):
+        self.group.add([10, 12], [10, 12])
+        old_rect = self.group.relative_rect
+        self.group._drawn_rect = old_rect # As if the master had drawn the group.
+        self.master.damaged.clear()
+        self.group.translate(3, 2)
+        new_rect = self.group.relative_rect
+        self.assertEqual(len(self.master.damaged), 1, "The master should be notified once when the areas overlap.")
+        self.assertTrue(self.master.damaged[0].contains(old_rect) and self.master.damaged[0].contains(new_rect))
+
+        self.group._drawn_rect = new_rect
+        self.master.damaged.clear()
+        self.group.translate(60, 60)
+        damaged = self.master.damaged
+        self.assertTrue(any(rect.contains(new_rect) for rect in damaged), "The previous area should be damaged.")
+        self.assertTrue(any(rect.contains(self.group.relative_rect) for rect in damaged), "The new area should be damaged.")
+
+    def test_shared_art(self):
+        art = _Frames(100, 100, 100)
+        group = ActorGroup(self.master, [art, art])
+        group.add([10, 20], [10, 20], art=[0, 1])
+        group.place(0, 0)
+        group.begin()
+        art.load()
+        group.loop(100)
+        self.assertEqual(art.index, 1, "An art used by several indices should be updated once per loop.")
+        group.finish()
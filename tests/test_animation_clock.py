@@ -0,0 +1,98 @@
+import unittest
+import pygame
+from pygaming.screen.art.art import Art
+from pygaming.screen.animation_clock import AnimationClock
+from pygaming.screen._abstract import Graphical
+from pygaming.screen.states import WidgetStates
+
+class _Frames(Art):
+    """An art made of plain frames with the given durations."""
+
+    def __init__(self, *durations: int):
+        super().__init__(None)
+        self._frame_durations = durations
+        self._width, self._height = 2, 2
+
+    def _load(self, **ld_kwargs):
+        self._surfaces = tuple(pygame.Surface((2, 2)) for _ in self._frame_durations)
+        self._durations = self._frame_durations
+
+class _Animated(Graphical):
+    """A graphical counting its changes."""
+
+    def __init__(self, art: Art):
+        super().__init__(art)
+        self.changes = 0
+
+    def notify_change(self):
+        self.changes += 1
+
+    def make_surface(self):
+        return self._arts.get(self.state, copy=False)
+
+class TestAnimationClock(unittest.TestCase):
+    """Testing of the animation clock."""
+
+    def test_frame_changes(self):
+        clock = AnimationClock()
+        animated = _Animated(_Frames(100, 50, 200))
+        static = _Animated(_Frames(100))
+        animated._arts.main.load()
+        static._arts.main.load()
+        clock.add(animated)
+        clock.add(static)
+        clock.advance(0)
+        for _ in range(9):
+            clock.advance(10)
+        self.assertEqual(animated.changes, 0, "The frame should not change before its duration.")
+        clock.advance(10)
+        self.assertEqual((animated.changes, animated._arts.main.index), (1, 1))
+        clock.advance(60)
+        self.assertEqual((animated.changes, animated._arts.main.index), (2, 2))
+        self.assertEqual(static.changes, 0, "A static art should never change.")
+        self.assertEqual(animated._arts.main._time_since_last_change, 10, "The time elapsed since the frame change should be kept.")
+
+    def test_state_change(self):
+        clock = AnimationClock()
+        animated = _Animated(_Frames(100, 100))
+        hovered = _Frames(30, 30)
+        animated._arts.add(WidgetStates.HOVERED, hovered)
+        animated._arts.main.load()
+        hovered.load()
+        animated._animation_clock = clock
+        clock.add(animated)
+        clock.advance(0)
+        animated.state = WidgetStates.HOVERED
+        clock.advance(0)
+        clock.advance(30)
+        self.assertEqual((animated.changes, hovered.index, animated._arts.main.index), (1, 1, 0),
+            "Only the art of the new state should be animated.")
+
+    def test_loading(self):
+        clock = AnimationClock()
+        animated = _Animated(_Frames(20, 20))
+        clock.add(animated)
+        clock.advance(0)
+        clock.advance(50)
+        self.assertEqual(animated.changes, 0)
+        animated._arts.main.load()
+        clock.advance(0)
+        clock.advance(20)
+        self.assertEqual(animated.changes, 1, "The animation should start when the art is loaded.")
+        clock.remove(animated)
+        clock.advance(100)
+        self.assertEqual(animated.changes, 1, "A removed graphical should not be animated anymore.")
+
+    def test_null_duration(self):
+        clock = AnimationClock()
+        animated = _Animated(_Frames(0, 0))
+        animated._arts.main.load()
+        clock.add(animated)
+        clock.advance(0)
+        changes = animated.changes
+        for _ in range(3):
+            clock.advance(0)
+        self.assertEqual(animated.changes, changes, "The frames of null duration should not be updated again in the same instant.")
+        for _ in range(3):
+            clock.advance(1)
+        self.assertEqual(animated.changes, changes + 3, "The frames of null duration should change once per iteration.")
@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+import pygame
+from pygaming.screen.camera import Camera
+from pygaming.screen.art import mask
+
+class _Settings(dict):
+    """Settings without any loading key."""
+
+    def keys(self):
+        return []
+
+class TestCamera(unittest.TestCase):
+    """Testing of the effects of the cameras."""
+
+    def test_unmasked_pixels(self):
+        rng = np.random.default_rng(0)
+        surface = pygame.Surface((40, 30))
+        pygame.surfarray.blit_array(surface, rng.integers(0, 256, (40, 30, 3)))
+        matrix = np.zeros((40, 30))
+        matrix[10:20, 5:15] = 0.5
+        matrix[25, 20] = 1
+        camera = Camera(0, 0, 40, 30, darken_mask=mask.MatrixMask(matrix), shift_hue_mask=mask.MatrixMask(matrix*0))
+        before = pygame.surfarray.array3d(surface)
+        after = pygame.surfarray.array3d(camera.apply_effects(surface, _Settings()))
+        unmasked = matrix == 0
+        self.assertTrue(np.array_equal(after[unmasked], before[unmasked]), "The pixels outside of the masks should be unchanged.")
+        self.assertFalse(np.array_equal(after[~unmasked], before[~unmasked]), "The pixels in the masks should be modified.")
@@ -0,0 +1,44 @@
+import random
+import sqlite3
+import unittest
+from types import SimpleNamespace
+from pygaming.database.database import Database
+from pygaming.database.localization_index import LocalizationIndex
+
+class TestLocalizationIndex(unittest.TestCase):
+    """Testing of the localization index."""
+
+    def test_same_as_database(self):
+        rng = random.Random(0)
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE tags (phase_name TEXT NOT NULL, tag TEXT NOT NULL)")
+        conn.execute("CREATE TABLE localizations (position TEXT NOT NULL, phase_name_or_tag TEXT NOT NULL, language_code TEXT, text_value TEXT NOT NULL)")
+        phases, tags, languages = ['menu', 'level', 'credits'], ['ui', 'story'], ['en_US', 'fr_FR', 'it_IT']
+        conn.executemany("INSERT INTO tags VALUES (?, ?)", [('menu', 'ui'), ('level', 'ui'), ('level', 'story')])
+        rows = []
+        for position in range(60):
+            # A position belongs to only one phase or tag, it can be missing in some languages.
+            group = rng.choice(phases + tags + ['all'])
+            rows.extend((f'LOC_{position}', group, language, f'{language} {position}') for language in languages if rng.random() < 0.7)
+        conn.executemany("INSERT INTO localizations VALUES (?, ?, ?, ?)", rows)
+
+        def execute_select_query(query, params=()):
+            return conn.execute(query, params).fetchall(), []
+        database = SimpleNamespace(execute_select_query=execute_select_query, _config=SimpleNamespace(default_language='en_US'))
+        index = Database.get_texts_index(database)
+        for phase in phases + ['all', 'unknown']:
+            for language in languages + ['es_ES']:
+                expected = dict(Database.get_language_texts(database, language, phase))
+                self.assertEqual(index.get(phase, language), expected, f"Wrong texts for {phase} in {language}.")
+        self.assertEqual(sorted(index.get_values('LOC_0')), sorted(value for (value,) in Database.get_loc_texts(database, 'LOC_0')))
+
+    def test_fallback(self):
+        index = LocalizationIndex(
+            [('all', 'en_US', 'LOC_A', 'a'), ('all', 'fr_FR', 'LOC_A', 'à'), ('all', 'en_US', 'LOC_B', 'b'), ('ui', 'fr_FR', 'LOC_C', 'c')],
+            [('menu', 'ui')],
+            'en_US'
+        )
+        self.assertEqual(index.get('all', 'fr_FR'), {'LOC_A': 'à', 'LOC_B': 'b'})
+        self.assertEqual(index.get('menu', 'fr_FR'), {'LOC_C': 'c'})
+        self.assertIs(index.get('all', 'fr_FR'), index.get('all', 'fr_FR'), "Switching the language should not resolve the texts again.")
+        self.assertEqual(index.get_values('LOC_A'), ['a', 'à'])
@@ -0,0 +1,31 @@
+import unittest
+import pygame
+from pygaming.database.render_cache import RenderCache
+
+class TestRenderCache(unittest.TestCase):
+    """Testing of the text render cache."""
+
+    def test_hits_and_misses(self):
+        cache = RenderCache()
+        surface = pygame.Surface((20, 10))
+        self.assertIsNone(cache.get(('font', 'text')))
+        self.assertIs(cache.put(('font', 'text'), surface), surface)
+        self.assertIs(cache.get(('font', 'text')), surface)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.size, surface.get_pitch()*surface.get_height())
+
+    def test_eviction(self):
+        first, second, third = (pygame.Surface((20, 10)) for _ in range(3))
+        cache = RenderCache()
+        cache.put('first', first)
+        cache.configure(max_bytes=2*cache.size)
+        cache.put('second', second)
+        cache.get('first')
+        cache.put('third', third)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get('first'), first, "The most recently used surfaces should be kept.")
+        self.assertIsNone(cache.get('second'), "The least recently used surfaces should be forgotten.")
+        cache.put('first', first)
+        self.assertEqual(cache.size, 2*first.get_pitch()*first.get_height(), "Replacing a surface should not count it twice.")
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
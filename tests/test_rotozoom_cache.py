@@ -0,0 +1,62 @@
+import random
+import unittest
+import numpy as np
+import pygame
+from pygaming.screen.rotozoom_cache import RotozoomCache
+
+class TestRotozoomCache(unittest.TestCase):
+    """Testing of the rotozoom cache."""
+
+    def test_size(self):
+        cache = RotozoomCache()
+        rng = random.Random(0)
+        for _ in range(200):
+            size = rng.randint(1, 60), rng.randint(1, 60)
+            angle, zoom = rng.uniform(-720, 720), rng.uniform(0.1, 3)
+            q_angle, q_zoom = cache.quantize(angle, zoom)
+            expected = pygame.transform.rotozoom(pygame.Surface(size), q_angle, q_zoom).get_size()
+            self.assertEqual(cache.get_size(size, angle, zoom), expected, f"Wrong size for {size}, {angle}, {zoom}.")
+
+    def test_quantization(self):
+        cache = RotozoomCache(angle_step=5)
+        surface = pygame.Surface((10, 4))
+        self.assertIs(cache.get(surface, 0.4, 1), surface, "A surface that is not rotated nor zoomed should be returned as is.")
+        rotated = cache.get(surface, 31, 1)
+        self.assertIs(cache.get(surface, 29, 1), rotated, "Close angles should share the same surface.")
+        self.assertIs(cache.get(surface, 390, 1), rotated, "The angles should be taken modulo 360.")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_eviction(self):
+        surface, second, third = (pygame.Surface((10, 10)) for _ in range(3))
+        cache = RotozoomCache()
+        first = cache.get(surface, 90, 1)
+        cache.configure(max_bytes=2*cache.size)
+        cache.get(second, 90, 1)
+        cache.get(surface, 90, 1)
+        cache.get(third, 90, 1)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(surface, 90, 1), first, "The most recently used surfaces should be kept.")
+        self.assertEqual(cache.misses, 3)
+        cache.bake([surface, second, third], 1, 4)
+        self.assertLessEqual(cache.size, cache._max_bytes)
+
+    def test_quantize_arrays(self):
+        cache = RotozoomCache(angle_step=5.625)
+        rng = random.Random(1)
+        angles = [rng.uniform(-720, 720) for _ in range(100)]
+        zooms = [rng.uniform(0, 3) for _ in range(100)]
+        q_angles, q_zooms = cache.quantize_arrays(np.array(angles), np.array(zooms))
+        for angle, zoom, q_angle, q_zoom in zip(angles, zooms, q_angles, q_zooms):
+            self.assertEqual((q_angle, q_zoom), cache.quantize(angle, zoom), "The arrays should be quantized like single values.")
+
+    def test_zoom_step(self):
+        surface = pygame.Surface((100, 100))
+        cache = RotozoomCache(zoom_step=1/256)
+        self.assertEqual(cache.quantize(0, 0.1), (0, 26/256))
+        self.assertEqual(cache.get(surface, 0, 0.1).get_size(), cache.get_size((100, 100), 0, 0.1), (10, 10))
+        self.assertIsNot(cache.get(surface, 0, 0.1), cache.get(surface, 0, 0.105), "Zooms further apart than the step should not be shared.")
+        cache.configure(zoom_step=1/8)
+        self.assertEqual(cache.quantize(0, 0.1), (0, 1/8))
+        self.assertEqual(cache.quantize(0, 0.01), (0, 1/8), "The zoom should not be rounded to zero.")
+        q_angles, q_zooms = cache.quantize_arrays(np.array([0., 0.]), np.array([0.1, 0.3]))
+        self.assertEqual(q_zooms.tolist(), [1/8, 1/4])
@@ -0,0 +1,23 @@
+import random
+import unittest
+import numpy as np
+from pygame import Rect
+from pygaming.screen.screen import union_area
+
+class TestUnionArea(unittest.TestCase):
+    """Testing of the area covered by the damaged rects."""
+
+    def test_overlaps(self):
+        self.assertEqual(union_area([]), 0)
+        self.assertEqual(union_area([Rect(0, 0, 10, 10), Rect(0, 0, 10, 10)]), 100, "Identical rects should be counted once.")
+        self.assertEqual(union_area([Rect(0, 0, 10, 10), Rect(5, 5, 10, 10)]), 175)
+        self.assertEqual(union_area([Rect(0, 0, 10, 10), Rect(2, 2, 0, 5)]), 100)
+
+    def test_random(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            rects = [Rect(rng.randint(0, 80), rng.randint(0, 80), rng.randint(0, 30), rng.randint(0, 30)) for _ in range(rng.randint(1, 10))]
+            covered = np.zeros((120, 120), dtype=bool)
+            for rect in rects:
+                covered[rect.left:rect.right, rect.top:rect.bottom] = True
+            self.assertEqual(union_area(rects), covered.sum(), f"Wrong area for {rects}.")
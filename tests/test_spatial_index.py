@@ -0,0 +1,29 @@
+import unittest
+from pygame import Rect
+from pygaming.screen.spatial_index import SpatialIndex
+
+class TestSpatialIndex(unittest.TestCase):
+    """Testing of the spatial index."""
+
+    def test_query(self):
+        index = SpatialIndex(cell_size=10)
+        index.update('a', Rect(0, 0, 5, 5))
+        index.update('b', Rect(3, 3, 30, 30))
+        index.update('c', Rect(100, 100, 10, 10))
+        self.assertEqual(index.query(Rect(4, 4, 1, 1)), {'a', 'b'})
+        self.assertEqual(index.query(Rect(20, 20, 1, 1)), {'b'}, "Objects spanning several cells should be found in all of them.")
+        self.assertEqual(index.query(Rect(50, 50, 1, 1)), set())
+        self.assertEqual(index.query(Rect(-1000, -1000, 2000, 2000)), {'a', 'b', 'c'})
+
+    def test_update(self):
+        index = SpatialIndex(cell_size=10)
+        index.update('a', Rect(0, 0, 5, 5))
+        index.update('a', Rect(50, 50, 5, 5))
+        self.assertEqual(index.query(Rect(1, 1, 1, 1)), set(), "A moved object should not be found at its previous position.")
+        self.assertEqual(index.query(Rect(51, 51, 1, 1)), {'a'})
+        index.update('a', Rect(52, 52, 5, 5))
+        self.assertEqual(index.query(Rect(51, 51, 1, 1)), set(), "The rect should be updated even if the object stays in the same cells.")
+        index.remove('a')
+        self.assertNotIn('a', index)
+        self.assertEqual(index.query(Rect(53, 53, 1, 1)), set())
+        index.remove('a')
@@ -0,0 +1,37 @@
+import unittest
+import pygame
+from pygaming.screen.surface_pool import SurfacePool
+
+class TestSurfacePool(unittest.TestCase):
+    """Testing of the surface pool."""
+
+    def test_copy(self):
+        pool = SurfacePool()
+        source = pygame.Surface((10, 5), pygame.SRCALPHA)
+        source.fill((10, 20, 30, 40))
+        source.fill((200, 100, 0, 255), (2, 1, 3, 3))
+        copy = pool.copy(source)
+        self.assertIsNot(copy, source)
+        self.assertEqual(pygame.image.tobytes(copy, 'RGBA'), pygame.image.tobytes(source, 'RGBA'),
+            "The copy should have exactly the same pixels as the source, alpha included.")
+        sub = source.subsurface((2, 1, 3, 3))
+        self.assertEqual(pygame.image.tobytes(pool.copy(sub), 'RGBA'), pygame.image.tobytes(sub, 'RGBA'))
+
+    def test_release(self):
+        pool = SurfacePool()
+        source = pygame.Surface((10, 5))
+        copy = pool.copy(source)
+        pool.release(copy)
+        self.assertIs(pool.copy(source), copy, "A released surface should be lent again for the same size and format.")
+        self.assertIsNot(pool.copy(source), copy, "A lent surface should not be lent twice.")
+        pool.release(source)
+        self.assertIsNot(pool.copy(source), source, "Surfaces that have not been lent by the pool should not be released into it.")
+
+    def test_max_formats(self):
+        pool = SurfacePool(max_surfaces_per_format=1, max_formats=2)
+        surfaces = [pool.get((i + 1, 1), pygame.Surface((1, 1))) for i in range(3)]
+        for surface in surfaces:
+            pool.release(surface)
+        self.assertIsNot(pool.get((1, 1), pygame.Surface((1, 1))), surfaces[0],
+            "The surfaces of the least recently released format should be forgotten.")
+        self.assertIs(pool.get((3, 1), pygame.Surface((1, 1))), surfaces[2])
@@ -0,0 +1,74 @@
+import random
+import unittest
+import pygame
+from pygaming.database.text_metrics import TextMetrics, EditableLayout
+
+class TestTextMetrics(unittest.TestCase):
+    """Testing of the text metrics."""
+
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+        self.metrics = TextMetrics(self.font)
+        rng = random.Random(0)
+        self.text = ' '.join(''.join(rng.choice('abcdefghijklmnoVAWT.,') for _ in range(rng.randint(0, 10))) for _ in range(200))
+
+    def test_wrap(self):
+        max_width = 150
+        layout = self.metrics.layout(self.text, max_width)
+        self.assertEqual('\n'.join(layout.lines).replace('\n', ' '), self.text, "Only spaces should be replaced by line breaks.")
+        for line, next_line, width in zip(layout.lines, layout.lines[1:] + ('',), layout.widths):
+            self.assertEqual(width, self.font.size(line)[0])
+            self.assertLessEqual(width, max_width, f"The line {line!r} is too wide.")
+            if next_line:
+                first_word = next_line.split(' ')[0]
+                self.assertGreater(self.font.size(line + ' ' + first_word)[0], max_width, f"{first_word!r} should be on the line {line!r}.")
+        self.assertIs(self.metrics.layout(self.text, max_width), layout, "The layouts should be cached.")
+
+    def test_long_word(self):
+        layout = self.metrics.layout('a verylongword b', 20)
+        self.assertEqual(layout.lines, ('a', 'verylongword', 'b'), "A word wider than the line should be alone on its line.")
+        self.assertEqual(layout.starts, (0, 2, 15))
+        self.assertEqual([layout.line_of(i) for i in (0, 1, 2, 14, 15, 16)], [0, 0, 1, 1, 2, 2])
+
+    def test_char_index(self):
+        line = self.text[:60]
+        for x in range(1, self.font.size(line)[0] + 10, 3):
+            expected = next((i for i in range(len(line)) if self.font.size(line[:i + 1])[0] > x), len(line) - 1)
+            self.assertEqual(self.metrics.char_index(line, x), expected, f"Wrong index at {x}.")
+
+class TestEditableLayout(unittest.TestCase):
+    """Testing of the layout of the edited texts."""
+
+    def test_edits(self):
+        pygame.font.init()
+        font = pygame.font.Font(None, 20)
+        rng = random.Random(1)
+        for max_width in (None, 100):
+            layout = EditableLayout(TextMetrics(font), '', max_width)
+            text = ''
+            for _ in range(200):
+                idx = rng.randint(0, len(text))
+                if rng.random() < 0.6:
+                    text = text[:idx] + ''.join(rng.choice('abcVAW .\n') for _ in range(rng.randint(1, 5))) + text[idx:]
+                else:
+                    text = text[:idx] + text[idx + rng.randint(1, 4):]
+                layout.update(text)
+                fresh = EditableLayout(TextMetrics(font), text, max_width)
+                self.assertEqual(list(layout.visible_lines(10**6)), list(fresh.visible_lines(10**6)), f"Wrong lines for {text!r}.")
+                for caret_index in range(0, len(text) + 1, 5):
+                    caret_pos = layout.caret_pos(caret_index)
+                    self.assertEqual(caret_pos, fresh.caret_pos(caret_index))
+                    self.assertEqual(layout.caret_index(caret_pos), fresh.caret_index(caret_pos))
+
+    def test_caret(self):
+        pygame.font.init()
+        font = pygame.font.Font(None, 20)
+        rng = random.Random(2)
+        text = ''.join(rng.choice('abcdefVAWT.,') for _ in range(80))
+        layout = EditableLayout(TextMetrics(font), text)
+        for caret_index in range(len(text) + 1):
+            self.assertEqual(layout.caret_pos(caret_index), (font.size(text[:caret_index])[0], 0))
+        for x in range(1, font.size(text)[0] + 10, 3):
+            expected = next((i for i in range(len(text)) if font.size(text[:i + 1])[0] > x), len(text) - 1)
+            self.assertEqual(layout.caret_index((x, 5)), expected, f"Wrong index at {x}.")
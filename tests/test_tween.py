@@ -0,0 +1,42 @@
+import unittest
+from pygaming.screen.tween import TweenEngine
+
+class TestTweenEngine(unittest.TestCase):
+    """Testing of the tween engine."""
+
+    def test_advance(self):
+        engine = TweenEngine(capacity=1)
+        values, positions = [], []
+        engine.start('value', 0, 10, 100, values.append)
+        engine.start('position', (0, 0), (10, -20), 200, positions.append, lambda x: x**2)
+        engine.advance(50)
+        self.assertEqual(values, [5.0])
+        self.assertEqual(positions, [(0.625, -1.25)], "The transition function should be applied to the progress of the time.")
+        engine.advance(50)
+        self.assertEqual(values, [5.0, 10.0], "The end value should be reached exactly.")
+        self.assertFalse(engine.is_running('value'))
+        self.assertEqual(len(engine), 1)
+        engine.advance(500)
+        self.assertEqual(positions[-1], (10.0, -20.0))
+        self.assertEqual(len(engine), 0)
+
+    def test_unchanged_values(self):
+        engine = TweenEngine()
+        values = []
+        engine.start('value', 3, 3, 100, values.append)
+        engine.advance(10)
+        self.assertEqual(values, [], "A tween whose value did not change should not be called back.")
+        engine.advance(100)
+        self.assertEqual(values, [3.0], "A tween should always be called back at its end.")
+
+    def test_replace_and_stop(self):
+        engine = TweenEngine()
+        values = []
+        engine.start('a', 0, 10, 100, values.append)
+        engine.start('b', 0, 10, 100, lambda value: None)
+        engine.start('a', 10, 0, 0, values.append)
+        engine.advance(1)
+        self.assertEqual(values, [0.0], "Starting a tween with the same key should replace the running one.")
+        engine.stop('b')
+        engine.stop('b')
+        self.assertEqual(len(engine), 0)